@@ -39,6 +39,14 @@ def load_assumptions(data):
         start=date(data['sim_param']['base_yr'], 1, 1),
         end=date(data['sim_param']['base_yr'], 12, 31))
 
+    # Temporal resolution of the model run ('hourly', 'daily', 'monthly' or 'custom'
+    # intervals as defined in the time intervals yaml file). Peaks are only resolved hourly
+    data['sim_param']['temporal_resolution'] = 'hourly'
+
+    # Number of representative days of every weather region for which the
+    # technologies and enduses are calculated (if `None`, every day is calculated)
+    data['sim_param']['representative_days'] = None
+
     # ============================================================
     # If unconstrained mode (False), heat demand is provided per technology. If True, heat is delievered with fueltype
     assumptions['mode_constrained'] = False # True --> Technologies are defined in ED model, False: heat is delievered
@@ -0,0 +1,231 @@
+"""Annual fuel adjustment of the enduses
+
+The yearly fuel of an enduse is changed by climate change, smart meter
+savings, the enduse specific change and the scenario drivers. All of
+these changes are factors which are independent of the fueltype. The
+factors which only depend on the enduse (smart meter and specific change)
+are calculated once per simulation year and submodel, the regional factors
+once per region and enduse. The fuel of an enduse is then multiplied
+with the product of all factors.
+"""
+from energy_demand.technologies import diffusion_technologies as diffusion
+
+# Factors in the order of the calculation cascade
+FACTOR_NAMES = (
+    'climate_change',
+    'smart_meter',
+    'specific_change',
+    'scenario_driver'
+    )
+
+def get_climate_change_factor(enduse, assumptions, heating_factor_y, cooling_factor_y):
+    """Change of heating and cooling fuel depending on changes in
+    HDD and CDD within a region (e.g. climate change induced)
+
+    Parameters
+    ----------
+    enduse : str
+        Enduse
+    assumptions : dict
+        Assumptions
+    heating_factor_y : float
+        Change of HDD of region
+    cooling_factor_y : float
+        Change of CDD of region
+
+    Returns
+    -------
+    factor : float
+        Climate change factor
+
+    Note
+    ----
+    `cooling_factor_y` and `heating_factor_y` are based on the sum
+    over the year. Therefore it is assumed that fuel correlates
+    directly with HDD or CDD.
+    """
+    if enduse in assumptions['enduse_space_heating']:
+        return heating_factor_y
+    elif enduse in assumptions['enduse_space_cooling']:
+        return cooling_factor_y
+    else:
+        return 1
+
+def get_smart_meter_factor(enduse, assumptions, sim_param):
+    """Fuel savings depending on smart meter penetration
+
+    Parameters
+    ----------
+    enduse : str
+        Enduse
+    assumptions : dict
+        Assumptions
+    sim_param : dict
+        Simulation parameters
+
+    Returns
+    -------
+    factor : float
+        Smart meter factor
+
+    Note
+    -----
+    - The smart meter penetration is assumed with a sigmoid diffusion.
+
+    - In the assumptions the maximum penetration and also the
+      generally fuel savings for each enduse can be defined.
+    """
+    if enduse not in assumptions['savings_smart_meter']:
+        return 1
+
+    # Sigmoid diffusion up to current year
+    sigm_factor = diffusion.sigmoid_diffusion(
+        sim_param['base_yr'],
+        sim_param['curr_yr'],
+        sim_param['end_yr'],
+        assumptions['smart_meter_diff_params']['sig_midpoint'],
+        assumptions['smart_meter_diff_params']['sig_steeppness']
+        )
+
+    # Smart Meter penetration (percentage of people having smart meters)
+    penetration_by = assumptions['smart_meter_p_by']
+    penetration_cy = assumptions['smart_meter_p_by'] + (
+        sigm_factor * (assumptions['smart_meter_p_ey'] - assumptions['smart_meter_p_by']))
+
+    return 1 - (penetration_by - penetration_cy) * assumptions['savings_smart_meter'][enduse]
+
+def get_specific_change_factor(enduse, assumptions, enduse_overall_change_ey, sim_param):
+    """Assumed overall enduse specific fuel consumption change
+
+    Parameters
+    ----------
+    enduse : str
+        Enduse
+    assumptions : dict
+        Assumptions
+    enduse_overall_change_ey : dict
+        Assumption of overall change in end year
+    sim_param : dict
+        Simulation parameters
+
+    Returns
+    -------
+    factor : float
+        Specific change factor
+
+    Note
+    -----
+    - Because for enduses where no technology stock is defined (and may
+      consist of many different) technologies, a linear diffusion is
+      suggested to best represent multiple sigmoid efficiency improvements
+      of individual technologies.
+
+    - Either a sigmoid standard diffusion or linear diffusion can be implemented.
+      inear is suggested.
+    """
+    # Fuel consumption shares in base and end year
+    percent_by = 1.0
+    percent_ey = enduse_overall_change_ey[enduse]
+
+    # Share of fuel consumption difference
+    diff_fuel_consump = percent_ey - percent_by
+    diffusion_choice = assumptions['other_enduse_mode_info']['diff_method']
+
+    if diff_fuel_consump == 0:
+        return 1
+
+    # Lineare diffusion up to cy
+    if diffusion_choice == 'linear':
+        return diffusion.linear_diff(
+            sim_param['base_yr'],
+            sim_param['curr_yr'],
+            percent_by,
+            percent_ey,
+            sim_param['sim_period_yrs']
+        )
+
+    # Sigmoid diffusion up to cy
+    elif diffusion_choice == 'sigmoid':
+        sig_diff_factor = diffusion.sigmoid_diffusion(
+            sim_param['base_yr'],
+            sim_param['curr_yr'],
+            sim_param['end_yr'],
+            assumptions['other_enduse_mode_info']['sigmoid']['sig_midpoint'],
+            assumptions['other_enduse_mode_info']['sigmoid']['sig_steeppness']
+            )
+        return diff_fuel_consump * sig_diff_factor
+
+def create_national_factors(enduses, assumptions, enduse_overall_change_ey, sim_param):
+    """Calculate the factors of all enduses which do not depend on the region
+
+    Parameters
+    ----------
+    enduses : list
+        Enduses
+    assumptions : dict
+        Assumptions
+    enduse_overall_change_ey : dict
+        Assumption of overall change in end year
+    sim_param : dict
+        Simulation parameters
+
+    Returns
+    -------
+    national_factors : dict
+        Smart meter and specific change factor of every enduse
+    """
+    return {
+        enduse: {
+            'smart_meter': get_smart_meter_factor(enduse, assumptions, sim_param),
+            'specific_change': get_specific_change_factor(
+                enduse, assumptions, enduse_overall_change_ey, sim_param)
+            } for enduse in enduses}
+
+def get_fuel_factors(enduse, national_factors, assumptions, heating_factor_y, cooling_factor_y, scenario_driver_ratio):
+    """Get all fuel adjustment factors of an enduse in a region
+
+    Parameters
+    ----------
+    enduse : str
+        Enduse
+    national_factors : dict
+        Factors of all enduses which do not depend on the region
+    assumptions : dict
+        Assumptions
+    heating_factor_y : float
+        Change of HDD of region
+    cooling_factor_y : float
+        Change of CDD of region
+    scenario_driver_ratio : float
+        Ratio of the scenario drivers of the current year to the base year
+
+    Returns
+    -------
+    fuel_factors : dict
+        Factor breakdown {factor name: factor}
+    """
+    return {
+        'climate_change': get_climate_change_factor(
+            enduse, assumptions, heating_factor_y, cooling_factor_y),
+        'smart_meter': national_factors[enduse]['smart_meter'],
+        'specific_change': national_factors[enduse]['specific_change'],
+        'scenario_driver': scenario_driver_ratio}
+
+def get_fuel_multiplier(fuel_factors):
+    """Multiply all fuel adjustment factors
+
+    Parameters
+    ----------
+    fuel_factors : dict
+        Factor breakdown {factor name: factor}
+
+    Returns
+    -------
+    multiplier : float
+        Product of all factors
+    """
+    multiplier = 1
+    for factor_name in FACTOR_NAMES:
+        multiplier *= fuel_factors[factor_name]
+
+    return multiplier
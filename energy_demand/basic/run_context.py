@@ -0,0 +1,141 @@
+"""Run context of a simulation year
+
+The enduse and submodel calculations only need a small part of the main
+data dictionary. The run context holds only these inputs, with
+the years already resolved. It is read only (the enduses copy
+the dicts they adapt, e.g. the base year fuel shares) and small enough
+to be pickled and sent to worker processes.
+"""
+from collections import namedtuple
+from energy_demand.basic import fuel_adjustment
+
+# Assumptions which are used in the enduse calculations
+ENDUSE_ASSUMPTIONS = [
+    'mode_constrained',
+    'hybrid_technologies',
+    'enduse_space_heating',
+    'enduse_space_cooling',
+    'heat_recovered',
+    'other_enduse_mode_info'
+    ]
+
+# Submodels with technologies {submodel: (prefix of assumptions, switch plan name)}
+SUBMODELS = {
+    'rs_submodel': ('rs', 'rs_model'),
+    'ss_submodel': ('ss', 'ss_model'),
+    'is_submodel': ('is', 'is_model')
+    }
+
+RunContext = namedtuple('RunContext', [
+    'base_yr',
+    'curr_yr',
+    'sim_param',
+    'lu_fueltype',
+    'assumptions',
+    'non_regional_profile_stock',
+    'submodels'
+    ])
+RunContext.__doc__ = """Inputs of all enduse calculations of a simulation year
+
+Attributes
+----------
+base_yr, curr_yr : int
+    Base and current year
+sim_param : dict
+    Simulation parameters used in the enduse calculations
+lu_fueltype : dict
+    Fueltype look-up
+assumptions : dict
+    Assumptions used in the enduse calculations (see `ENDUSE_ASSUMPTIONS`)
+non_regional_profile_stock : LoadProfileStock
+    Non regional load profiles
+submodels : dict
+    `SubmodelContext` of every submodel
+"""
+
+SubmodelContext = namedtuple('SubmodelContext', [
+    'fuel_switches',
+    'service_switches',
+    'fuel_tech_p_by',
+    'tech_increased_service',
+    'tech_decreased_share',
+    'tech_constant_share',
+    'installed_tech',
+    'sig_param_tech',
+    'national_fuel_factors',
+    'driver_ratios',
+    'switch_plans'
+    ])
+SubmodelContext.__doc__ = """Switch assumptions, fuel adjustment factors,
+scenario driver ratios and switch plans of a submodel"""
+
+def create_submodel_context(data, submodel, sim_param):
+    """Create context of a submodel
+
+    Parameters
+    ----------
+    data : dict
+        Data container
+    submodel : str
+        Submodel ('rs_submodel', 'ss_submodel' or 'is_submodel')
+    sim_param : dict
+        Simulation parameters used in the enduse calculations
+
+    Returns
+    -------
+    submodel_context : SubmodelContext
+        Context of submodel
+    """
+    prefix, model_name = SUBMODELS[submodel]
+    assumptions = data['assumptions']
+    years = (data['sim_param']['base_yr'], data['sim_param']['curr_yr'])
+
+    return SubmodelContext(
+        fuel_switches=assumptions['{}_fuel_switches'.format(prefix)],
+        service_switches=assumptions['{}_service_switches'.format(prefix)],
+        fuel_tech_p_by=assumptions['{}_fuel_tech_p_by'.format(prefix)],
+        tech_increased_service=assumptions['{}_tech_increased_service'.format(prefix)],
+        tech_decreased_share=assumptions['{}_tech_decreased_share'.format(prefix)],
+        tech_constant_share=assumptions['{}_tech_constant_share'.format(prefix)],
+        installed_tech=assumptions['{}_installed_tech'.format(prefix)],
+        sig_param_tech=assumptions['{}_sig_param_tech'.format(prefix)],
+        national_fuel_factors=fuel_adjustment.create_national_factors(
+            data['{}_all_enduses'.format(prefix)],
+            assumptions,
+            assumptions['enduse_overall_change_ey'][model_name],
+            sim_param),
+        driver_ratios=data['scenario_driver_ratios'][submodel].select_years(years),
+        switch_plans=data['switch_plans'][model_name])
+
+def create_run_context(data):
+    """Create run context of the current simulation year
+
+    Parameters
+    ----------
+    data : dict
+        Data container (with the non regional load
+        profiles and switch plans of the current year)
+
+    Returns
+    -------
+    run_context : RunContext
+        Run context
+    """
+    base_yr = data['sim_param']['base_yr']
+    curr_yr = data['sim_param']['curr_yr']
+
+    sim_param = {
+        'base_yr': base_yr,
+        'curr_yr': curr_yr,
+        'end_yr': data['sim_param']['end_yr'],
+        'sim_period_yrs': data['sim_param']['sim_period_yrs']}
+
+    return RunContext(
+        base_yr=base_yr,
+        curr_yr=curr_yr,
+        sim_param=sim_param,
+        lu_fueltype=data['lu_fueltype'],
+        assumptions={key: data['assumptions'][key] for key in ENDUSE_ASSUMPTIONS},
+        non_regional_profile_stock=data['non_regional_profile_stock'],
+        submodels={
+            submodel: create_submodel_context(data, submodel, sim_param) for submodel in SUBMODELS})
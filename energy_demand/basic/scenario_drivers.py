@@ -0,0 +1,209 @@
+"""Scenario drivers of the enduses
+
+The change of a scenario driver of an enduse (e.g. population or GVA)
+between the base year and a simulation year is calculated once for all
+simulation years, regions and enduses of a submodel after the scenario
+data and dwelling stocks are loaded. The enduse calculations then only
+multiply the fuel with the driver ratio.
+"""
+import numpy as np
+
+# Data of the scenario drivers which are not calculated with a
+# dwelling stock {scenario driver: key of data {year: {region: value}}}.
+# Further drivers (e.g. households) are added here.
+DRIVER_DATA = {
+    'GVA': 'GVA',
+    'population': 'population',
+    'floorarea': 'rs_floorarea'
+    }
+
+class DriverRatios(object):
+    """Ratio of the scenario driver of the simulation year to the
+    base year for every year, region and enduse of a submodel
+
+    Parameters
+    ----------
+    years : list
+        Years
+    regions : list
+        Regions
+    enduses : list
+        Enduses
+    ratios : array
+        Driver ratios, shape: (year, region, enduse)
+    """
+    def __init__(self, years, regions, enduses, ratios):
+        """Constructor
+        """
+        self.years = list(years)
+        self.regions = list(regions)
+        self.enduses = list(enduses)
+        self.ratios = ratios
+
+        self.year_index = {year: year_nr for year_nr, year in enumerate(self.years)}
+        self.region_index = {region: region_nr for region_nr, region in enumerate(self.regions)}
+        self.enduse_index = {enduse: enduse_nr for enduse_nr, enduse in enumerate(self.enduses)}
+
+    def get_ratio(self, year, region, enduse):
+        """Get driver ratio of an enduse
+
+        Note
+        ----
+        Returns 1 (no change) if the enduse has no scenario driver
+        """
+        if enduse not in self.enduse_index:
+            return 1.0
+
+        return float(self.ratios[
+            self.year_index[year], self.region_index[region], self.enduse_index[enduse]])
+
+    def select_years(self, years):
+        """Select years of the driver ratios
+
+        Parameters
+        ----------
+        years : list
+            Years to select
+
+        Returns
+        -------
+        driver_ratios : DriverRatios
+            Driver ratios of selected years
+        """
+        years = [year for year in years if year in self.year_index]
+
+        return DriverRatios(
+            years,
+            self.regions,
+            self.enduses,
+            self.ratios[[self.year_index[year] for year in years]])
+
+def calc_driver_ratios(driver_values, base_yr_nr):
+    """Calculate ratio of driver values to base year
+
+    Parameters
+    ----------
+    driver_values : array
+        Driver values, shape: (year, region, enduse)
+    base_yr_nr : int
+        Position of base year
+
+    Returns
+    -------
+    ratios : array
+        Ratio of every year to base year (1 if the base year value is zero)
+
+    Note
+    ----
+    The ratio is frozen as in chapter 3.1.2 EQ E-2
+    """
+    by_values = np.broadcast_to(driver_values[base_yr_nr], driver_values.shape)
+
+    return np.divide(
+        driver_values, by_values, out=np.ones(driver_values.shape), where=by_values != 0)
+
+def get_dw_stock_driver_values(dw_stock, years, regions, enduses):
+    """Get scenario driver values of a dwelling stock
+
+    Parameters
+    ----------
+    dw_stock : dict
+        Dwelling stock of every region and year
+    years : list
+        Years
+    regions : list
+        Regions
+    enduses : list
+        Enduses
+
+    Returns
+    -------
+    driver_values : array
+        Driver values, shape: (year, region, enduse)
+
+    Note
+    ----
+    Enduses which are not an attribute of the dwelling stock are not changed
+    """
+    return np.array([
+        [
+            [getattr(dw_stock[region][year], enduse, 1) for enduse in enduses]
+            for region in regions]
+        for year in years], dtype=float)
+
+def get_data_driver_values(data, driver_assumptions, years, regions, enduses):
+    """Get scenario driver values from scenario data
+
+    Parameters
+    ----------
+    data : dict
+        Data container
+    driver_assumptions : dict
+        Scenario drivers of every enduse
+    years : list
+        Years
+    regions : list
+        Regions
+    enduses : list
+        Enduses
+
+    Returns
+    -------
+    driver_values : array
+        Product of the drivers of every enduse, shape: (year, region, enduse)
+    """
+    driver_values = np.ones((len(years), len(regions), len(enduses)))
+
+    data_values = {}
+    for enduse_nr, enduse in enumerate(enduses):
+        for scenario_driver in driver_assumptions.get(enduse, []):
+            if scenario_driver not in data_values:
+                driver_data = data[DRIVER_DATA[scenario_driver]]
+                data_values[scenario_driver] = np.array([
+                    [driver_data[year][region] for region in regions] for year in years], dtype=float)
+
+            driver_values[:, :, enduse_nr] *= data_values[scenario_driver]
+
+    return driver_values
+
+def create_driver_ratios(data):
+    """Create driver ratios of all submodels
+
+    Parameters
+    ----------
+    data : dict
+        Data container (with scenario data and dwelling stocks)
+
+    Returns
+    -------
+    driver_ratios : dict
+        `DriverRatios` of every submodel
+
+    Note
+    ----
+    If a dwelling stock is defined for a submodel, the scenario
+    drivers of the dwelling stock are used
+    """
+    base_yr = data['sim_param']['base_yr']
+    years = sorted(set(data['sim_param']['sim_period']) | set([base_yr]))
+    regions = list(data['lu_reg'])
+
+    driver_ratios = {}
+    for prefix in ('rs', 'ss', 'is'):
+        enduses = data['{}_all_enduses'.format(prefix)]
+        dw_stock = data.get('{}_dw_stock'.format(prefix), False)
+
+        if dw_stock:
+            driver_values = get_dw_stock_driver_values(dw_stock, years, regions, enduses)
+        else:
+            driver_values = get_data_driver_values(
+                data,
+                data['assumptions']['scenario_drivers'].get('{}_submodule'.format(prefix), {}),
+                years,
+                regions,
+                enduses)
+
+        driver_ratios['{}_submodel'.format(prefix)] = DriverRatios(
+            years, regions, enduses, calc_driver_ratios(driver_values, years.index(base_yr)))
+
+    return driver_ratios
@@ -0,0 +1,212 @@
+"""Temporal resolution of the model run
+
+The model can be run hourly (365, 24) or at a coarser resolution (daily,
+monthly or custom intervals as defined in a time intervals yaml file,
+e.g. `time_intervals.yaml`).
+
+The load profiles, the temperature dependent technology attributes
+and the service and fuel of every enduse are calculated at the
+resolution, i.e. a coarser resolution reduces the memory and run time
+of the yearly model run. The arrays of every enduse and region are only
+expanded to hours when summing (see `EnergyModel.sum_submodels_yh`),
+and the kept results are aggregated to the intervals (see `ResultStore`).
+"""
+import re
+import sys
+from datetime import date
+import numpy as np
+import yaml
+from energy_demand.basic import date_handling
+
+def convert_duration_to_h(duration):
+    """Convert an ISO 8601 duration to hours
+
+    Parameters
+    ----------
+    duration : str
+        Duration (e.g. 'P8759H' or 'P1DT2H'). Only days and hours are
+        supported as month and year durations are ambiguous
+
+    Returns
+    -------
+    hours : int
+        Number of hours
+    """
+    match = re.match(r'^P(?:(\d+)D)?(?:T?(?:(\d+)H)?)$', duration)
+    if not match or duration == 'P':
+        sys.exit("Error: The duration {} could not be converted to hours".format(duration))
+
+    days, hours = match.groups()
+
+    return int(days or 0) * 24 + int(hours or 0)
+
+def read_time_intervals(path_time_intervals):
+    """Read time intervals from yaml file
+
+    Parameters
+    ----------
+    path_time_intervals : str
+        Path to yaml file with intervals ('id', 'start', 'end')
+
+    Returns
+    -------
+    interval_ids : list
+        Ids of intervals (in order of first appearance)
+    yh_interval : array
+        Interval index of every hour of the year, shape: (8760,)
+    """
+    with open(path_time_intervals, 'r') as infile:
+        time_intervals = yaml.safe_load(infile)
+
+    interval_ids = []
+    yh_interval = np.full((8760), -1, dtype=int)
+
+    for time_interval in time_intervals:
+        if time_interval['id'] not in interval_ids:
+            interval_ids.append(time_interval['id'])
+
+        yh_interval[
+            convert_duration_to_h(time_interval['start']):
+            convert_duration_to_h(time_interval['end'])] = interval_ids.index(time_interval['id'])
+
+    if np.any(yh_interval == -1):
+        sys.exit("Error: The time intervals do not cover all hours of the year")
+
+    return interval_ids, yh_interval
+
+class TemporalResolution(object):
+    """Temporal resolution of the model run
+
+    Parameters
+    ----------
+    resolution : str
+        'hourly', 'daily', 'monthly' or 'custom'
+    base_yr : int
+        Year to assign days to months
+    path_time_intervals : str
+        Path to yaml file with intervals (only for 'custom')
+
+    Note
+    ----
+    - Arrays at the resolution have the shape (..., `shape`). Hourly
+      arrays are (..., 365, 24), all other arrays have a single cell
+      per interval (..., nr_of_intervals, 1)
+    - The value of a cell is the mean value of its hours, i.e. yearly
+      sums are weighted with the number of hours of every cell (`weights`)
+    - Only hourly arrays resolve the hours of a day (`hourly`), which
+      is needed for the peak day calculations of the enduses
+    """
+    def __init__(self, resolution, base_yr=2015, path_time_intervals=None):
+        """Constructor
+        """
+        self.resolution = resolution
+
+        if resolution == 'hourly':
+            self.interval_ids = ['{}_{}'.format(day, hour) for day in range(365) for hour in range(24)]
+            self.yh_interval = np.arange(8760)
+        elif resolution == 'daily':
+            self.interval_ids = [str(day) for day in range(365)]
+            self.yh_interval = np.repeat(np.arange(365), 24)
+        elif resolution == 'monthly':
+            self.interval_ids = [str(month) for month in range(1, 13)]
+            list_dates = date_handling.fullyear_dates(
+                start=date(base_yr, 1, 1), end=date(base_yr, 12, 31))[:365]
+            self.yh_interval = np.repeat([yearday.month - 1 for yearday in list_dates], 24)
+        elif resolution == 'custom':
+            self.interval_ids, self.yh_interval = read_time_intervals(path_time_intervals)
+        else:
+            sys.exit("Error: The temporal resolution {} is not defined".format(resolution))
+
+        self.nr_of_intervals = len(self.interval_ids)
+        self.hourly = resolution == 'hourly'
+
+        # Order of hours sorted by interval and first hour of every interval
+        self.order_yh = np.argsort(self.yh_interval, kind='stable')
+        self.interval_starts = np.searchsorted(
+            self.yh_interval[self.order_yh], np.arange(self.nr_of_intervals))
+
+        # Shape of arrays at the resolution and number of hours of every cell
+        if self.hourly:
+            self.shape = (365, 24)
+            self.weights = np.ones(self.shape)
+        else:
+            self.shape = (self.nr_of_intervals, 1)
+            self.weights = np.bincount(
+                self.yh_interval, minlength=self.nr_of_intervals).astype(float)[:, np.newaxis]
+
+    def reduce(self, values_yh):
+        """Reduce hourly values to the resolution
+
+        Parameters
+        ----------
+        values_yh : array
+            Hourly values, shape: (..., 365, 24)
+
+        Returns
+        -------
+        values : array
+            Mean value of the hours of every cell, shape: (..., `shape`)
+        """
+        if self.hourly:
+            return np.asarray(values_yh)
+
+        return self.aggregate(values_yh)[..., np.newaxis] / self.weights
+
+    def expand(self, values):
+        """Expand values at the resolution to every hour
+
+        Parameters
+        ----------
+        values : array
+            Values of every cell, shape: (..., `shape`)
+
+        Returns
+        -------
+        values_yh : array
+            Value of the cell of every hour, shape: (..., 365, 24)
+        """
+        if self.hourly:
+            return np.asarray(values)
+
+        values_intervals = np.asarray(values)[..., 0]
+
+        return values_intervals[..., self.yh_interval].reshape(values_intervals.shape[:-1] + (365, 24))
+
+    def sum_y(self, values):
+        """Yearly sum of values at the resolution
+
+        Parameters
+        ----------
+        values : array
+            Values of every cell, shape: (..., `shape`)
+
+        Returns
+        -------
+        values_y : array
+            Sum of all hours, shape: (...)
+        """
+        if self.hourly:
+            return np.sum(values, axis=(-2, -1))
+
+        return np.sum(values * self.weights, axis=(-2, -1))
+
+    def aggregate(self, fuel_yh):
+        """Aggregate hourly values to the intervals
+
+        Parameters
+        ----------
+        fuel_yh : array
+            Hourly values, shape: (..., 365, 24)
+
+        Returns
+        -------
+        fuel_intervals : array
+            Summed values of every interval, shape: (..., nr_of_intervals)
+        """
+        fuel_8760 = np.reshape(fuel_yh, np.shape(fuel_yh)[:-2] + (8760, ))
+
+        if self.resolution == 'hourly':
+            return fuel_8760
+
+        return np.add.reduceat(
+            fuel_8760[..., self.order_yh], self.interval_starts, axis=-1)
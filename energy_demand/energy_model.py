@@ -3,7 +3,9 @@
 
 The main function executing all the submodels of the energy demand model
 """
+import sys
 import uuid
+from collections import OrderedDict
 import numpy as np
 from energy_demand.geography import region
 from energy_demand.geography import WeatherRegion
@@ -13,8 +15,12 @@ import energy_demand.is_model as is_model
 import energy_demand.ts_model as ts_model
 from energy_demand.profiles import load_factors as load_factors
 from energy_demand.profiles import load_profile
+from energy_demand.profiles import peak_engine
 from energy_demand.initalisations import helpers
 from energy_demand.profiles import generic_shapes
+from energy_demand.technologies import switch_plan
+from energy_demand.technologies import technological_stock
+from energy_demand.basic import run_context as run_context_module
 '''# pylint: disable=I0011,C0321,C0301,C0103,C0325,no-member'''
 
 class EnergyModel(object):
@@ -41,6 +47,16 @@ class EnergyModel(object):
         # Non regional load profiles
         data['non_regional_profile_stock'] = self.create_load_profile_stock(data)
 
+        # Technologies which are identical for all weather regions
+        data['shared_technologies'] = technological_stock.create_shared_technologies(
+            data, technological_stock.get_all_stock_technologies(data))
+
+        # National switch plans of all submodels
+        data['switch_plans'] = self.create_switch_plans(data)
+
+        # Inputs of the enduse calculations of all submodels
+        run_context = run_context_module.create_run_context(data)
+
         # --------------------
         # Industry SubModel
         # --------------------
@@ -49,7 +65,7 @@ class EnergyModel(object):
         self.regions = self.create_regions(
             region_names, data, 'is_submodel')
         self.is_submodel = self.industry_submodel(
-            data, data['is_all_enduses'], data['is_sectors'])
+            run_context, data['is_all_enduses'], data['is_sectors'])
 
         # --------------------
         # Residential SubModel
@@ -59,7 +75,7 @@ class EnergyModel(object):
         self.regions = self.create_regions(
             region_names, data, 'rs_submodel')
         self.rs_submodel = self.residential_submodel(
-            data, data['rs_all_enduses'])
+            run_context, data['rs_all_enduses'])
 
         # --------------------
         # Service SubModel
@@ -69,7 +85,7 @@ class EnergyModel(object):
         self.regions = self.create_regions(
             region_names, data, 'ss_submodel')
         self.ss_submodel = self.service_submodel(
-            data, data['ss_all_enduses'], data['ss_sectors'])
+            run_context, data['ss_all_enduses'], data['ss_sectors'])
 
         # --------------------
         # Transport SubModel
@@ -78,7 +94,7 @@ class EnergyModel(object):
             data['weather_stations'], data, 'ts_submodel')
         self.regions = self.create_regions(
             region_names, data, 'ts_submodel')
-        self.ts_submodel = self.other_submodels()
+        self.ts_submodel = self.other_submodels(data['temporal_resolution'])
 
         # ---------------------------------------------------------------------
         # Functions to summarise data for all Regions in the EnergyModel class
@@ -86,44 +102,95 @@ class EnergyModel(object):
         print("...summarise fuel")
         # Sum according to weekend, working day
 
-        # Sum across all regions, all enduse and sectors sum_reg
-        self.sum_uk_fueltypes_enduses_y = self.sum_reg('fuel_yh', data['nr_of_fueltypes'], [self.ss_submodel, self.rs_submodel, self.is_submodel, self.ts_submodel], 'sum', 'non_peak')
-
-        self.all_submodels_sum_uk_specfuelype_enduses_y = self.sum_reg('fuel_yh', data['nr_of_fueltypes'], [self.ss_submodel, self.rs_submodel, self.is_submodel, self.ts_submodel], 'no_sum', 'non_peak')
-        self.rs_sum_uk_specfuelype_enduses_y = self.sum_reg('fuel_yh', data['nr_of_fueltypes'], [self.rs_submodel], 'no_sum', 'non_peak')
-        self.ss_sum_uk_specfuelype_enduses_y = self.sum_reg('fuel_yh', data['nr_of_fueltypes'], [self.ss_submodel], 'no_sum', 'non_peak')
-        self.is_sum_uk_specfuelype_enduses_y = self.sum_reg('fuel_yh', data['nr_of_fueltypes'], [self.is_submodel], 'no_sum', 'non_peak')
-        self.ts_sum_uk_specfuelype_enduses_y = self.sum_reg('fuel_yh', data['nr_of_fueltypes'], [self.ts_submodel], 'no_sum', 'non_peak')
-
-        self.rs_tot_fuels_all_enduses_y = self.sum_reg('fuel_yh', data['nr_of_fueltypes'], [self.rs_submodel], 'no_sum', 'non_peak')
-        self.ss_tot_fuels_all_enduses_y = self.sum_reg('fuel_yh', data['nr_of_fueltypes'], [self.ss_submodel], 'no_sum', 'non_peak')
+        # Sum hourly fuel across all regions, enduses and sectors
+        submodels = [
+            ('ss_submodel', self.ss_submodel),
+            ('rs_submodel', self.rs_submodel),
+            ('is_submodel', self.is_submodel),
+            ('ts_submodel', self.ts_submodel)]
+        self.reg_model_objects = self.index_model_objects(region_names, submodels)
+        fuels_yh, enduse_fuels_yh, self.reg_load_factor_season, self.peak_engine = self.sum_submodels_yh(
+            region_names, data['nr_of_fueltypes'], [submodel_name for submodel_name, _ in submodels], self.reg_model_objects)
+        self.reg_index = self.peak_engine.reg_index
+
+        # National fuel of all submodels (kept by the peak engine)
+        self.all_submodels_sum_uk_specfuelype_enduses_y = self.peak_engine.national_fuel_yh
+        self.sum_uk_fueltypes_enduses_y = np.sum(self.all_submodels_sum_uk_specfuelype_enduses_y)
+
+        self.rs_sum_uk_specfuelype_enduses_y = fuels_yh['rs_submodel']
+        self.ss_sum_uk_specfuelype_enduses_y = fuels_yh['ss_submodel']
+        self.is_sum_uk_specfuelype_enduses_y = fuels_yh['is_submodel']
+        self.ts_sum_uk_specfuelype_enduses_y = fuels_yh['ts_submodel']
+
+        self.rs_tot_fuels_all_enduses_y = fuels_yh['rs_submodel']
+        self.ss_tot_fuels_all_enduses_y = fuels_yh['ss_submodel']
 
         # Sum across all regions for enduse
-        self.all_models_tot_fuel_y_enduse_specific_h = self.sum_enduse_all_regions('fuel_yh', [self.rs_submodel, self.ss_submodel, self.is_submodel, self.ts_submodel])
-
-        self.rs_tot_fuel_y_enduse_specific_h = self.sum_enduse_all_regions('fuel_yh', [self.rs_submodel])
-        self.ss_tot_fuel_enduse_specific_h = self.sum_enduse_all_regions('fuel_yh', [self.ss_submodel])
+        self.all_models_tot_fuel_y_enduse_specific_h = {}
+        for submodel_name in ['rs_submodel', 'ss_submodel', 'is_submodel', 'ts_submodel']:
+            for enduse, fuel_yh in enduse_fuels_yh[submodel_name].items():
+                if enduse not in self.all_models_tot_fuel_y_enduse_specific_h:
+                    self.all_models_tot_fuel_y_enduse_specific_h[enduse] = 0
+                self.all_models_tot_fuel_y_enduse_specific_h[enduse] += fuel_yh
+
+        self.rs_tot_fuel_y_enduse_specific_h = enduse_fuels_yh['rs_submodel']
+        self.ss_tot_fuel_enduse_specific_h = enduse_fuels_yh['ss_submodel']
+
+        # Coincident national peak hour of the residential and service submodel
+        self.rs_tot_fuel_y_max_allenduse_fueltyp, _ = peak_engine.get_peak_h(fuels_yh['rs_submodel'])
+        self.ss_tot_fuel_y_max_allenduse_fueltyp, _ = peak_engine.get_peak_h(fuels_yh['ss_submodel'])
+
+        # Yearly regional results aggregated to every level of the region hierarchy {level: (fueltype, unit)}
+        if data.get('region_hierarchy') is not None:
+            self.reg_fuel_y_levels = self.aggregate_regions(data['region_hierarchy'], self.get_regional_y())
+        else:
+            self.reg_fuel_y_levels = {}
 
+        # Across all enduses calc_load_factor_h
+        self.rs_reg_load_factor_h = load_factors.calc_load_factor_h(data, self.rs_tot_fuels_all_enduses_y, self.rs_tot_fuel_y_max_allenduse_fueltyp)
+        self.ss_reg_load_factor_h = load_factors.calc_load_factor_h(data, self.ss_tot_fuels_all_enduses_y, self.ss_tot_fuel_y_max_allenduse_fueltyp)
 
-        # Sum across all regions, enduses for peak hour
+        # Load factors of every fueltype and region (fueltype, region)
+        self.reg_load_factor_h = load_factors.calc_load_factor(
+            np.mean(self.peak_engine.fuel_yd, axis=-1) / 24, self.peak_engine.get_regional_peak_h())
+        self.reg_load_factor_d = load_factors.calc_lf_d(self.peak_engine.fuel_yd)
 
-        # NEW
-        self.peak_all_models_all_enduses_fueltype = self.sum_reg('fuel_peak_dh', data['nr_of_fueltypes'], [self.rs_submodel, self.ss_submodel, self.is_submodel, self.ts_submodel], 'no_sum', 'peak_dh')
+        # SUMMARISE FOR EVERY REGION AND ENDSE
+        #self.tot_country_fuel_y_load_max_h = self.peak_loads_per_fueltype(data, self.regions, 'rs_reg_load_factor_h')
 
-        self.rs_tot_fuel_y_max_allenduse_fueltyp = self.sum_reg('fuel_peak_h', data['nr_of_fueltypes'], [self.rs_submodel], 'no_sum', 'peak_h')
-        self.ss_tot_fuel_y_max_allenduse_fueltyp = self.sum_reg('fuel_peak_h', data['nr_of_fueltypes'], [self.ss_submodel], 'no_sum', 'peak_h')
+    @classmethod
+    def create_switch_plans(cls, data):
+        """Create national switch plans of the current year for every submodel
 
-        # Functions for load calculations
-        # ---------------------------
-        self.rs_fuels_peak_h = self.sum_reg('fuel_peak_h', data['nr_of_fueltypes'], [self.rs_submodel], 'no_sum', 'peak_h')
-        self.ss_fuels_peak_h = self.sum_reg('fuel_peak_h', data['nr_of_fueltypes'], [self.ss_submodel], 'no_sum', 'peak_h')
+        Parameters
+        ----------
+        data : dict
+            Data container
 
-        # Across all enduses calc_load_factor_h
-        self.rs_reg_load_factor_h = load_factors.calc_load_factor_h(data, self.rs_tot_fuels_all_enduses_y, self.rs_fuels_peak_h)
-        self.ss_reg_load_factor_h = load_factors.calc_load_factor_h(data, self.ss_tot_fuels_all_enduses_y, self.ss_fuels_peak_h)
+        Returns
+        -------
+        switch_plans : dict
+            Switch plans of every enduse with switches for every submodel
 
-        # SUMMARISE FOR EVERY REGION AND ENDSE
-        #self.tot_country_fuel_y_load_max_h = self.peak_loads_per_fueltype(data, self.regions, 'rs_reg_load_factor_h')
+        Note
+        ----
+        The diffusion of technologies is not regionally different and
+        is therefore calculated only once and not for every region
+        """
+        switch_plans = {}
+        for submodel in ['rs', 'ss', 'is']:
+            switch_plans['{}_model'.format(submodel)] = switch_plan.create_switch_plans(
+                data['{}_all_enduses'.format(submodel)],
+                data['sim_param']['curr_yr'],
+                data['assumptions']['{}_fuel_switches'.format(submodel)],
+                data['assumptions']['{}_service_switches'.format(submodel)],
+                data['assumptions']['{}_installed_tech'.format(submodel)],
+                data['assumptions']['{}_sig_param_tech'.format(submodel)],
+                data['assumptions']['{}_tech_increased_service'.format(submodel)],
+                data['assumptions']['{}_tech_decreased_share'.format(submodel)],
+                data['assumptions']['{}_tech_constant_share'.format(submodel)])
+
+        return switch_plans
 
     @classmethod
     def create_load_profile_stock(cls, data):
@@ -148,7 +215,7 @@ class EnergyModel(object):
             technologies=data['assumptions']['technology_list']['rs_lighting'],
             enduses=['rs_lighting'],
             shape_yd=data['rs_shapes_yd']['rs_lighting']['shape_non_peak_yd'],
-            shape_yh=data['rs_shapes_dh']['rs_lighting']['shape_non_peak_y_dh'] * data['rs_shapes_yd']['rs_lighting']['shape_non_peak_yd'][:, np.newaxis],
+            shape_y_dh=data['rs_shapes_dh']['rs_lighting']['shape_non_peak_y_dh'],
             enduse_peak_yd_factor=data['rs_shapes_yd']['rs_lighting']['shape_peak_yd_factor'],
             shape_peak_dh=data['rs_shapes_dh']['rs_lighting']['shape_peak_dh']
             )
@@ -159,7 +226,7 @@ class EnergyModel(object):
             technologies=data['assumptions']['technology_list']['rs_cold'],
             enduses=['rs_cold'],
             shape_yd=data['rs_shapes_yd']['rs_cold']['shape_non_peak_yd'],
-            shape_yh=data['rs_shapes_dh']['rs_cold']['shape_non_peak_y_dh'] * data['rs_shapes_yd']['rs_cold']['shape_non_peak_yd'][:, np.newaxis],
+            shape_y_dh=data['rs_shapes_dh']['rs_cold']['shape_non_peak_y_dh'],
             enduse_peak_yd_factor=data['rs_shapes_yd']['rs_cold']['shape_peak_yd_factor'],
             shape_peak_dh=data['rs_shapes_dh']['rs_cold']['shape_peak_dh']
             )
@@ -170,7 +237,7 @@ class EnergyModel(object):
             technologies=data['assumptions']['technology_list']['rs_cooking'],
             enduses=['rs_cooking'],
             shape_yd=data['rs_shapes_yd']['rs_cooking']['shape_non_peak_yd'],
-            shape_yh=data['rs_shapes_dh']['rs_cooking']['shape_non_peak_y_dh'] * data['rs_shapes_yd']['rs_cooking']['shape_non_peak_yd'][:, np.newaxis],
+            shape_y_dh=data['rs_shapes_dh']['rs_cooking']['shape_non_peak_y_dh'],
             enduse_peak_yd_factor=data['rs_shapes_yd']['rs_cooking']['shape_peak_yd_factor'],
             shape_peak_dh=data['rs_shapes_dh']['rs_cooking']['shape_peak_dh']
             )
@@ -181,7 +248,7 @@ class EnergyModel(object):
             technologies=data['assumptions']['technology_list']['rs_wet'],
             enduses=['rs_wet'],
             shape_yd=data['rs_shapes_yd']['rs_wet']['shape_non_peak_yd'],
-            shape_yh=data['rs_shapes_dh']['rs_wet']['shape_non_peak_y_dh'] * data['rs_shapes_yd']['rs_wet']['shape_non_peak_yd'][:, np.newaxis],
+            shape_y_dh=data['rs_shapes_dh']['rs_wet']['shape_non_peak_y_dh'],
             enduse_peak_yd_factor=data['rs_shapes_yd']['rs_wet']['shape_peak_yd_factor'],
             shape_peak_dh=data['rs_shapes_dh']['rs_wet']['shape_peak_dh']
             )
@@ -194,7 +261,7 @@ class EnergyModel(object):
                 technologies=tech_list,
                 enduses=[enduse],
                 shape_yd=data['rs_shapes_yd'][enduse]['shape_non_peak_yd'],
-                shape_yh=data['rs_shapes_dh'][enduse]['shape_non_peak_y_dh'] * data['rs_shapes_yd'][enduse]['shape_non_peak_yd'][:, np.newaxis],
+                shape_y_dh=data['rs_shapes_dh'][enduse]['shape_non_peak_y_dh'],
                 enduse_peak_yd_factor=data['rs_shapes_yd'][enduse]['shape_peak_yd_factor'],
                 shape_peak_dh=data['rs_shapes_dh'][enduse]['shape_peak_dh']
                 )
@@ -209,13 +276,13 @@ class EnergyModel(object):
                     enduses=[enduse],
                     sectors=[sector],
                     shape_yd=data['ss_shapes_yd'][sector][enduse]['shape_non_peak_yd'],
-                    shape_yh=data['ss_shapes_dh'][sector][enduse]['shape_non_peak_y_dh'] * data['ss_shapes_yd'][sector][enduse]['shape_non_peak_yd'][:, np.newaxis],
+                    shape_y_dh=data['ss_shapes_dh'][sector][enduse]['shape_non_peak_y_dh'],
                     enduse_peak_yd_factor=data['ss_shapes_yd'][sector][enduse]['shape_peak_yd_factor'],
                     shape_peak_dh=data['ss_shapes_dh'][sector][enduse]['shape_peak_dh']
                     )
 
         # dummy is - Flat load profile
-        shape_peak_dh, _, shape_peak_yd_factor, shape_non_peak_yd, shape_non_peak_yh = generic_shapes.generic_flat_shape()
+        shape_peak_dh, shape_non_peak_y_dh, shape_peak_yd_factor, shape_non_peak_yd, _ = generic_shapes.generic_flat_shape()
 
         for enduse in data['assumptions']['is_dummy_enduses']:
             tech_list = helpers.get_nested_dict_key(data['assumptions']['is_fuel_tech_p_by'][enduse])
@@ -226,9 +293,9 @@ class EnergyModel(object):
                     enduses=[enduse],
                     sectors=[sector],
                     shape_yd=shape_non_peak_yd,
-                    shape_yh=shape_non_peak_yh,
                     enduse_peak_yd_factor=shape_peak_yd_factor,
-                    shape_peak_dh=shape_peak_dh
+                    shape_peak_dh=shape_peak_dh,
+                    shape_y_dh=shape_non_peak_y_dh
                     )
 
         return non_regional_profile_stock
@@ -246,54 +313,61 @@ class EnergyModel(object):
         Return
         ------
         region_fuel_yh : array
-            Summed fuel of a region
+            Summed fuel of a region, shape: (fueltype, 365, 24)
 
         Note
         ----
-        - Summing function
+        - The hourly fuel of the regions is not kept after summing. It
+          is summed again from the model objects of the region
         """
-        region_fuel_yh = self.sum_reg(
-            'fuel_yh',
-            nr_of_fueltypes,
-            [self.ss_submodel, self.rs_submodel, self.is_submodel, self.ts_submodel],
-            'no_sum',
-            'non_peak',
-            region_name,
-            )
+        region_fuel_yh = np.zeros((nr_of_fueltypes, 365, 24))
+        for (_, _), (resolution, fuel) in self.sum_region_objects(
+                self.reg_model_objects[region_name], nr_of_fueltypes).items():
+            region_fuel_yh += resolution.expand(fuel)[:nr_of_fueltypes]
 
         return region_fuel_yh
 
-    def get_fuel_region_all_models_yh(self, nr_of_fueltypes, region_name_to_get, sector_models, attribute_to_get):
-        """Summarise fuel yh for a certain region
+    def aggregate_regions(self, region_hierarchy, reg_values, region_axis=1):
+        """Aggregate regional results to all levels of the region hierarchy
 
         Parameters
         ----------
-        nr_of_fueltypes : int
-            Number of fueltypes
-        region_name_to_get : str
-            Name of region to read out
-        sector_models : list
-            Objectos of submodel runs
-        attribute_to_get : str
-            Attribute to get
+        region_hierarchy : RegionHierarchy
+            Region hierarchy
+        reg_values : array
+            Values of all regions ordered according to `reg_index`
+        region_axis : int, default=1
+            Axis of the regions
 
-        Note
-        ----
-        - Summing function
+        Return
+        ------
+        values_levels : dict
+            Values of every level {level: values}
         """
-        tot_fuels_all_enduse_yh = np.zeros((nr_of_fueltypes, 365, 24))
+        if region_hierarchy.region_names != self.peak_engine.region_names:
+            sys.exit("Error: The regions of the region hierarchy differ from the modelled regions")
+
+        return region_hierarchy.aggregate_all(reg_values, region_axis)
 
-        for sector_model in sector_models:
-            sector_model_objects = getattr(self, sector_model)
-            for model_object in sector_model_objects:
-                if model_object.region_name == region_name_to_get:
-                    tot_fuels_all_enduse_yh += self.get_fuels_yh(model_object, attribute_to_get)
+    def get_regional_y(self):
+        """Get yearly fuel of all submodels for every fueltype and region
 
-        return tot_fuels_all_enduse_yh
+        Return
+        ------
+        reg_fuel_y : array
+            Yearly fuel, shape: (fueltype, region). Regions
+            are ordered according to `reg_index`
+        """
+        return np.sum(self.peak_engine.fuel_yd, axis=2)
 
-    def other_submodels(self):
+    def other_submodels(self, resolution):
         """Other submodel
 
+        Parameters
+        ----------
+        resolution : TemporalResolution
+            Temporal resolution of the model run
+
         Return
         ------
         submodules : list
@@ -313,7 +387,8 @@ class EnergyModel(object):
             # Create submodule
             submodule = ts_model.OtherModel(
                 region_object,
-                'generic_transport_enduse'
+                'generic_transport_enduse',
+                resolution
             )
 
             # Add to list
@@ -326,13 +401,13 @@ class EnergyModel(object):
         print("...finished other submodel")
         return submodules
 
-    def industry_submodel(self, data, enduses, sectors):
+    def industry_submodel(self, run_context, enduses, sectors):
         """Industry subsector model
 
         Parameters
         ----------
-        data : dict
-            Data containter
+        run_context : RunContext
+            Run context of simulation year
         enduses : list
             Enduses of industry submodel
         sectors : list
@@ -358,7 +433,7 @@ class EnergyModel(object):
 
                     # Create submodule
                     submodule = is_model.IndustryModel(
-                        data,
+                        run_context,
                         region_object,
                         enduse,
                         sector=sector
@@ -374,13 +449,13 @@ class EnergyModel(object):
 
         return submodules
 
-    def residential_submodel(self, data, enduses, sectors=['dummy_sector']):
+    def residential_submodel(self, run_context, enduses, sectors=['dummy_sector']):
         """Create the residential submodules (per enduse and region) and add them to list
 
         Parameters
         ----------
-        data : dict
-            Data container
+        run_context : RunContext
+            Run context of simulation year
         enduses : list
             All residential enduses
         sectors : dict, default=['dummy_sector']
@@ -406,7 +481,7 @@ class EnergyModel(object):
 
                     # Create submodule
                     submodel_object = rs_model.ResidentialModel(
-                        data,
+                        run_context,
                         region_object,
                         enduse,
                         sector
@@ -422,13 +497,13 @@ class EnergyModel(object):
 
         return submodule_list
 
-    def service_submodel(self, data, enduses, sectors):
+    def service_submodel(self, run_context, enduses, sectors):
         """Create the service submodules per enduse, sector and region and add to list
 
         Parameters
         ----------
-        data : dict
-            Data container
+        run_context : RunContext
+            Run context of simulation year
         enduses : list
             All residential enduses
         sectors : list
@@ -454,7 +529,7 @@ class EnergyModel(object):
 
                     # Create submodule
                     submodule = ss_model.ServiceModel(
-                        data,
+                        run_context,
                         region_object,
                         enduse,
                         sector
@@ -464,7 +539,7 @@ class EnergyModel(object):
                     submodule_list.append(submodule)
 
                     _scrap_cnt += 1
-                    print("   ...running service model {}  {}".format(data['sim_param']['curr_yr'], 100.0 / (len(self.regions) * len(sectors) * len(enduses)) * _scrap_cnt))
+                    print("   ...running service model {}  {}".format(run_context.curr_yr, 100.0 / (len(self.regions) * len(sectors) * len(enduses)) * _scrap_cnt))
 
         # To save on memory
         del self.regions, self.weather_regions
@@ -528,81 +603,132 @@ class EnergyModel(object):
 
         return regions
 
-    def sum_enduse_all_regions(self, attribute_to_get, sector_models):
-        """Summarise an enduse attribute across all regions
+    @classmethod
+    def index_model_objects(cls, region_names, submodels):
+        """Group the model objects of all submodels by region
 
         Parameters
         ----------
-        attribute_to_get : string
-            Enduse attribute to summarise
-        sector_models : List
-            List with sector models
+        region_names : list
+            Region names
+        submodels : list
+            Submodel names and objects [(submodel name, model objects)]
 
-        Return
-        ------
-        enduse_dict : dict
-            Summarise enduses across all regions
+        Returns
+        -------
+        reg_model_objects : dict
+            Model objects of every region {region name: [(submodel name, model object)]}
         """
-        enduse_dict = {}
+        reg_model_objects = {region_name: [] for region_name in region_names}
 
-        for sector_model in sector_models:
+        for submodel_name, sector_model in submodels:
             for model_object in sector_model:
+                reg_model_objects[model_object.region_name].append((submodel_name, model_object))
+
+        return reg_model_objects
+
+    def sum_submodels_yh(self, region_names, nr_of_fueltypes, submodel_names, reg_model_objects):
+        """Sum the hourly fuel of all submodels in a single pass
+
+        Parameters
+        ----------
+        region_names : list
+            Region names
+        nr_of_fueltypes : int
+            Number of fueltypes
+        submodel_names : list
+            Submodel names
+        reg_model_objects : dict
+            Model objects of every region (see `index_model_objects`)
+
+        Returns
+        -------
+        fuels_yh : dict
+            Fuel summed across all regions and enduses of every
+            submodel {submodel name: array of shape (fueltype, 365, 24)}
+        enduse_fuels_yh : dict
+            Fuel summed across all regions of every enduse
+            {submodel name: {enduse: array of shape (fueltype, 365, 24)}}
+        reg_load_factor_season : dict
+            Load factor [in %] of every season, fueltype and region
+            {season: array of shape (fueltype, region)}. Regions are
+            ordered according to `region_names`
+        peak_engine_object : PeakEngine
+            Peak engine with the fuel of all regions
 
-                if model_object.enduse not in enduse_dict:
-                    enduse_dict[model_object.enduse] = 0
+        Note
+        ----
+        - The model objects are visited region by region. The fuel of
+          every model object is streamed into the peak engine, which
+          only keeps the partial sum of the current region until the
+          region is finished. The hourly fuel of a region is only
+          used for its seasonal load factors and then dropped
+        - The fuel of the model objects of a region is summed for every
+          submodel and enduse at the temporal resolution of the model
+          objects (see `sum_region_objects`). Only these sums are
+          expanded to every hour
+        """
+        fuels_yh = {}
+        enduse_fuels_yh = {}
+        for submodel_name in submodel_names:
+            fuels_yh[submodel_name] = np.zeros((nr_of_fueltypes, 365, 24))
+            enduse_fuels_yh[submodel_name] = {}
+
+        peak_engine_object = peak_engine.PeakEngine(region_names, nr_of_fueltypes)
+        reg_load_factor_season = {
+            season: np.zeros((nr_of_fueltypes, len(region_names))) for season in load_factors.SEASONS}
+
+        for reg_nr, region_name in enumerate(region_names):
+            for (submodel_name, enduse), (resolution, fuel) in self.sum_region_objects(
+                    reg_model_objects[region_name], nr_of_fueltypes).items():
+                fuel_yh = resolution.expand(fuel)
 
-                # Add fuel with flat load shape
-                enduse_dict[model_object.enduse] += self.get_fuels_yh(
-                    model_object, attribute_to_get)
+                fuels_yh[submodel_name] += fuel_yh
+                if enduse not in enduse_fuels_yh[submodel_name]:
+                    enduse_fuels_yh[submodel_name][enduse] = 0
+                enduse_fuels_yh[submodel_name][enduse] += fuel_yh
 
-        return enduse_dict
+                peak_engine_object.add_fuel_yh(region_name, fuel_yh)
 
-    def sum_reg(self, attribute_to_get, nr_of_fueltypes, sector_models, crit, crit2, region_name=False):
-        """Collect hourly data from all regions and sum across all fuel types and enduses
+            region_fuel_yh = peak_engine_object.finish_region(region_name)
+            for season, load_factor in load_factors.calc_lf_season(region_fuel_yh).items():
+                reg_load_factor_season[season][:, reg_nr] = load_factor
+
+        return fuels_yh, enduse_fuels_yh, reg_load_factor_season, peak_engine_object
+
+    def sum_region_objects(self, model_objects, nr_of_fueltypes):
+        """Sum the fuel of the model objects of a region for every submodel and enduse
 
         Parameters
         ----------
-        attribute_to_get : str
-            Attribue to summarise
+        model_objects : list
+            Model objects of a region [(submodel name, model object)]
         nr_of_fueltypes : int
             Number of fueltypes
-        sector_models : list
-            Sector models to summarise
-        crit : str
-            Criteria
-        crit2 : str
-        Criteria
-        region_name : str
-            Name of region
 
         Returns
         -------
-        fuels : array
-            Summarised fuels
-        """
-        if crit2 == 'peak_h':
-            fuels = np.zeros((nr_of_fueltypes)) #np.zeros((nr_of_fueltypes, ))
-        elif crit2 == 'non_peak':
-            fuels = np.zeros((nr_of_fueltypes, 365, 24))
-        elif crit2 == 'peak_dh':
-            fuels = np.zeros((nr_of_fueltypes, 24))
-
-        # Iterate all submodel
-        for sector_model in sector_models:
-            for model_object in sector_model:
+        fuels : dict
+            Temporal resolution and summed fuel at the resolution
+            {(submodel name, enduse): (resolution, fuel)}
 
-                # Select specific region
-                if region_name:
-                    if model_object.region_name == region_name:
-                        fuels += self.get_fuels_yh(model_object, attribute_to_get)
-                else:
-                    fuels += self.get_fuels_yh(model_object, attribute_to_get)
+        Note
+        ----
+        - The model objects of an enduse of a region use the same technology
+          stock and therefore the same temporal resolution
+        - The fuel of enduses with flat or factorised load profiles is
+          generated when summing. Every model object is visited only
+          once, so this is done once and added to all sums
+        """
+        fuels = OrderedDict()
+        for submodel_name, model_object in model_objects:
+            key = (submodel_name, model_object.enduse)
+            if key not in fuels:
+                resolution = model_object.enduse_object.resolution
+                fuels[key] = (resolution, np.zeros((nr_of_fueltypes, ) + resolution.shape))
 
-        # Criteria if fuel is summed or not
-        if crit == 'no_sum':
-            fuels = fuels
-        elif crit == 'sum':
-            fuels = np.sum(fuels)
+            _, fuel = fuels[key]
+            fuel += self.get_fuels_yh(model_object, 'fuel_yh')
 
         return fuels
 
@@ -619,29 +745,24 @@ class EnergyModel(object):
         Returns
         -------
         fuels : array
-            Fuels with flat load profile
+            Fuels with flat load profile (at the temporal
+            resolution of the model object)
 
         Note
         -----
         -   For enduses where 'crit_flat_profile' in Enduse Class is True
             a flat load profile is generated. Otherwise, the yh as calculated
             for each enduse is used
+        -   For enduses where 'crit_factorised' in Enduse Class is True
+            the yh fuel is generated from the fuel of every day and
+            the shape within every day
         """
         if model_object.enduse_object.crit_flat_profile:
 
             # Yearly fuel
             fuels_reg_y = model_object.enduse_object.fuel_y
 
-            if attribute_to_get == 'fuel_peak_dh':
-                # Flat shape
-                shape_peak_dh = np.full((24), 1/24)
-
-                # Because flat shape, the dh_peak is 24/8760
-                fuels_reg_peak = fuels_reg_y * (1/365)
-
-                fuels = fuels_reg_peak[:, np.newaxis] * shape_peak_dh
-
-            elif attribute_to_get == 'shape_non_peak_y_dh':
+            if attribute_to_get == 'shape_non_peak_y_dh':
                 # Flat shape
                 shape_non_peak_y_dh = np.full((365, 24), (1.0/24))
                 fuels = fuels_reg_y * shape_non_peak_y_dh
@@ -652,14 +773,19 @@ class EnergyModel(object):
                 fuels = fuels_reg_y * shape_non_peak_yd
 
             elif attribute_to_get == 'fuel_yh':
-                # Flat shape
-                shape_non_peak_yh = np.full((365, 24), 1/8760)
-                fast_shape_non_peak_yh = np.zeros((model_object.enduse_object.fuel_new_y.shape[0], 365, 24))
+                # Flat shape (the mean fuel of every hour is the same for every cell)
+                resolution = model_object.enduse_object.resolution
+                shape_non_peak_yh = np.full(resolution.shape, 1/8760)
+                fast_shape_non_peak_yh = np.zeros((model_object.enduse_object.fuel_new_y.shape[0], ) + resolution.shape)
 
                 for fueltype, _ in enumerate(fast_shape_non_peak_yh):
                     fast_shape_non_peak_yh[fueltype] = shape_non_peak_yh
 
                 fuels = fuels_reg_y[:, np.newaxis, np.newaxis] * fast_shape_non_peak_yh
+        elif model_object.enduse_object.crit_factorised and attribute_to_get == 'fuel_yh':
+            fuels = load_profile.fuel_yd_to_yh(
+                model_object.enduse_object.fuel_yd,
+                model_object.enduse_object.fuel_load_profile.shape_y_dh)
         else:
             # If not flat shape, use yh load profile of enduse
             fuels = getattr(model_object.enduse_object, attribute_to_get)
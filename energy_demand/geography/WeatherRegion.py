@@ -12,7 +12,9 @@ import numpy as np
 from energy_demand.technologies import technological_stock
 from energy_demand.basic import date_handling
 from energy_demand.profiles import load_profile
+from energy_demand.profiles import profile_kernels
 from energy_demand.profiles import hdd_cdd
+from energy_demand.profiles import representative_days
 '''# pylint: disable=I0011,C0321,C0301,C0103,C0325,no-member'''
 
 class WeatherRegion(object):
@@ -32,6 +34,12 @@ class WeatherRegion(object):
     - For each region_name, a technology stock is defined with help of
       regional temperature data technology specific
     - regional specific fuel shapes are assigned to technologies
+    - The technologies, load profiles and enduses of the weather region
+      are calculated at the temporal resolution of the model run or, if
+      a number of representative days is defined in `sim_param`, for the
+      representative days of the current year temperatures (`resolution`)
+    - The load profiles are given for every hour and reduced to the
+      resolution when read
     """
     def __init__(self, weather_region_name, data, modeltype):
         """Constructor
@@ -42,6 +50,16 @@ class WeatherRegion(object):
         temp_by = data['temperature_data'][weather_region_name][data['sim_param']['base_yr']]
         temp_cy = data['temperature_data'][weather_region_name][data['sim_param']['curr_yr']]
 
+        # Temporal resolution (representative days or resolution of the model run)
+        if data['sim_param']['representative_days']:
+            self.resolution = representative_days.RepresentativeDays(
+                temp_cy,
+                representative_days.get_daytypes(data['sim_param']['list_dates']),
+                data['sim_param']['representative_days'])
+        else:
+            self.resolution = data['temporal_resolution']
+        temp_cy_tech = self.resolution.reduce(temp_cy)
+
         rs_t_base_heating_cy = hdd_cdd.sigm_temp(
             data['sim_param'], data['assumptions'], 'rs_t_base_heating')
         rs_t_base_cooling_cy = hdd_cdd.sigm_temp(
@@ -67,33 +85,39 @@ class WeatherRegion(object):
                 'is_tech_stock',
                 data,
                 temp_by,
-                temp_cy,
+                temp_cy_tech,
                 data['assumptions']['ss_t_base_heating']['base_yr'],
                 data['is_all_enduses'],
                 ss_t_base_heating_cy,
-                data['assumptions']['is_specified_tech_enduse_by']
+                data['assumptions']['is_specified_tech_enduse_by'],
+                data['shared_technologies'],
+                self.resolution
                 )
         elif modeltype == 'rs_submodel':
             self.rs_tech_stock = technological_stock.TechStock(
                 'rs_tech_stock',
                 data,
                 temp_by,
-                temp_cy,
+                temp_cy_tech,
                 data['assumptions']['rs_t_base_heating']['base_yr'],
                 data['rs_all_enduses'],
                 rs_t_base_heating_cy,
-                data['assumptions']['rs_specified_tech_enduse_by']
+                data['assumptions']['rs_specified_tech_enduse_by'],
+                data['shared_technologies'],
+                self.resolution
                 )
         elif modeltype == 'ss_submodel':
             self.ss_tech_stock = technological_stock.TechStock(
                 'ss_tech_stock',
                 data,
                 temp_by,
-                temp_cy,
+                temp_cy_tech,
                 data['assumptions']['ss_t_base_heating']['base_yr'],
                 data['ss_all_enduses'],
                 ss_t_base_heating_cy,
-                data['assumptions']['ss_specified_tech_enduse_by']
+                data['assumptions']['ss_specified_tech_enduse_by'],
+                data['shared_technologies'],
+                self.resolution
                 )
 
         # -------------------
@@ -126,12 +150,12 @@ class WeatherRegion(object):
             #rs_peak_yd_cooling_factor = self.get_shape_peak_yd_factor(rs_cdd_cy)
 
             # --Specific heating technologies for residential sector
-            rs_profile_storage_heater_yh, _ = self.get_shape_heating_boilers_yh(
+            _, rs_profile_storage_heater_y_dh = self.get_shape_heating_boilers_yh(
                 data, rs_fuel_shape_heating_yd, 'rs_profile_heating_storage_dh')
-            rs_profile_elec_heater_yh, _ = self.get_shape_heating_boilers_yh(
+            _, rs_profile_elec_heater_y_dh = self.get_shape_heating_boilers_yh(
                 data, rs_fuel_shape_heating_yd, 'rs_profile_heating_second_heating_dh')
             # boiler, non-peak
-            rs_profile_boilers_yh, rs_profile_boilers_y_dh = self.get_shape_heating_boilers_yh(
+            _, rs_profile_boilers_y_dh = self.get_shape_heating_boilers_yh(
                 data, rs_fuel_shape_heating_yd, 'rs_shapes_heating_boilers_dh')
             # heat pumps, non-peak
             rs_fuel_shape_hp_yh, rs_fuel_shape_hp_y_dh = self.get_fuel_shape_heating_hp_yh(
@@ -156,7 +180,7 @@ class WeatherRegion(object):
                 technologies=data['assumptions']['technology_list']['tech_heating_const'],
                 enduses=['rs_space_heating', 'rs_water_heating'],
                 shape_yd=rs_fuel_shape_heating_yd,
-                shape_yh=rs_profile_boilers_yh,
+                shape_y_dh=rs_profile_boilers_y_dh,
                 enduse_peak_yd_factor=rs_peak_yd_heating_factor,
                 shape_peak_dh=data['rs_shapes_heating_boilers_dh']['peakday']
                 )
@@ -167,7 +191,7 @@ class WeatherRegion(object):
                 technologies=data['assumptions']['technology_list']['primary_heating_electricity'],
                 enduses=['rs_space_heating'],
                 shape_yd=rs_fuel_shape_heating_yd,
-                shape_yh=rs_profile_storage_heater_yh,
+                shape_y_dh=rs_profile_storage_heater_y_dh,
                 enduse_peak_yd_factor=rs_peak_yd_heating_factor,
                 shape_peak_dh=data['rs_profile_heating_storage_dh']['peakday']
                 )
@@ -178,7 +202,7 @@ class WeatherRegion(object):
                 technologies=data['assumptions']['technology_list']['secondary_heating_electricity'],
                 enduses=['rs_space_heating', 'rs_water_heating'],
                 shape_yd=rs_fuel_shape_heating_yd,
-                shape_yh=rs_profile_elec_heater_yh,
+                shape_y_dh=rs_profile_elec_heater_y_dh,
                 enduse_peak_yd_factor=rs_peak_yd_heating_factor,
                 shape_peak_dh=data['rs_profile_heating_second_heating_dh']['peakday']
                 )
@@ -230,7 +254,7 @@ class WeatherRegion(object):
 
             # --Heating technologies for service sector
             # (the heating shape follows the gas shape of aggregated sectors)
-            ss_fuel_shape_any_tech, ss_fuel_shape = self.ss_get_sector_enduse_shape(
+            _, ss_fuel_shape = self.ss_get_sector_enduse_shape(
                 data, ss_fuel_shape_heating_yd, 'ss_space_heating')
 
             # Cooling service
@@ -253,7 +277,7 @@ class WeatherRegion(object):
                 enduses=['ss_space_heating', 'ss_water_heating'],
                 sectors=data['ss_sectors'],
                 shape_yd=ss_fuel_shape_heating_yd,
-                shape_yh=ss_fuel_shape_any_tech,
+                shape_y_dh=ss_fuel_shape,
                 enduse_peak_yd_factor=ss_peak_yd_heating_factor,
                 shape_peak_dh=data['ss_shapes_dh']
                 )
@@ -264,7 +288,7 @@ class WeatherRegion(object):
                 enduses=['ss_space_heating'],
                 sectors=data['ss_sectors'],
                 shape_yd=ss_fuel_shape_heating_yd,
-                shape_yh=ss_fuel_shape_any_tech,
+                shape_y_dh=ss_fuel_shape,
                 enduse_peak_yd_factor=ss_peak_yd_heating_factor,
                 shape_peak_dh=data['rs_profile_heating_storage_dh']['peakday']
                 )
@@ -275,7 +299,7 @@ class WeatherRegion(object):
                 enduses=['rs_space_heating', 'rs_water_heating'],
                 sectors=data['ss_sectors'],
                 shape_yd=ss_fuel_shape_heating_yd,
-                shape_yh=ss_fuel_shape_any_tech,
+                shape_y_dh=ss_fuel_shape,
                 enduse_peak_yd_factor=ss_peak_yd_heating_factor
                 )
 
@@ -295,7 +319,7 @@ class WeatherRegion(object):
                 enduses=['ss_space_heating', 'ss_water_heating'],
                 sectors=data['ss_sectors'],
                 shape_yd=ss_fuel_shape_heating_yd,
-                shape_yh=ss_fuel_shape_any_tech,
+                shape_y_dh=ss_fuel_shape,
                 enduse_peak_yd_factor=ss_peak_yd_heating_factor
                 )
 
@@ -325,7 +349,7 @@ class WeatherRegion(object):
             # --Heating technologies for service sector (the heating shape follows
             # the gas shape of aggregated sectors)
             #Take from service sector
-            is_fuel_shape_any_tech, _ = self.ss_get_sector_enduse_shape(
+            _, is_fuel_shape = self.ss_get_sector_enduse_shape(
                 data, is_fuel_shape_heating_yd, 'ss_space_heating')
 
             self.is_load_profiles.add_load_profile(
@@ -334,7 +358,7 @@ class WeatherRegion(object):
                 enduses=['is_space_heating'],
                 sectors=data['is_sectors'],
                 shape_yd=is_fuel_shape_heating_yd,
-                shape_yh=is_fuel_shape_any_tech,
+                shape_y_dh=is_fuel_shape,
                 enduse_peak_yd_factor=is_peak_yd_heating_factor
                 )
 
@@ -345,7 +369,7 @@ class WeatherRegion(object):
                 sectors=data['is_sectors'],
                 shape_yd=is_fuel_shape_heating_yd,
                 enduse_peak_yd_factor=is_peak_yd_heating_factor,
-                shape_yh=is_fuel_shape_any_tech
+                shape_y_dh=is_fuel_shape
                 )
 
             self.is_load_profiles.add_load_profile(
@@ -354,7 +378,7 @@ class WeatherRegion(object):
                 enduses=['is_space_heating'],
                 sectors=data['is_sectors'],
                 shape_yd=is_fuel_shape_heating_yd,
-                shape_yh=is_fuel_shape_any_tech,
+                shape_y_dh=is_fuel_shape,
                 enduse_peak_yd_factor=is_peak_yd_heating_factor,
                 )
 
@@ -364,7 +388,7 @@ class WeatherRegion(object):
                 enduses=['is_space_heating'],
                 sectors=data['is_sectors'],
                 shape_yd=is_fuel_shape_heating_yd,
-                shape_yh=is_fuel_shape_any_tech,
+                shape_y_dh=is_fuel_shape,
                 enduse_peak_yd_factor=is_peak_yd_heating_factor,
                 )
 
@@ -374,7 +398,7 @@ class WeatherRegion(object):
                 enduses=['is_space_heating'],
                 sectors=data['is_sectors'],
                 shape_yd=is_fuel_shape_heating_yd,
-                shape_yh=is_fuel_shape_any_tech,
+                shape_y_dh=is_fuel_shape,
                 enduse_peak_yd_factor=is_peak_yd_heating_factor
                 )
 
@@ -408,12 +432,16 @@ class WeatherRegion(object):
 
         The shapes are the same for any hybrid technology with boiler and heat pump
         """
+        tech_low_high_p = tech_stock.get_tech_attr(
+            enduse, hybrid_tech, 'service_distr_hybrid_h_p')
+
         # Create dh shapes for every day from relative dh shape of hybrid technologies
+        # (the service shares at the resolution of the stock are expanded to every hour)
         fuel_shape_hybrid_y_dh = load_profile.get_hybrid_fuel_shapes_y_dh(
             fuel_shape_boilers_y_dh=fuel_shape_boilers_y_dh,
             fuel_shape_hp_y_dh=fuel_shape_hp_y_dh,
-            tech_low_high_p=tech_stock.get_tech_attr(
-                enduse, hybrid_tech, 'service_distr_hybrid_h_p')
+            tech_low_high_p={
+                key: tech_stock.resolution.expand(value) for key, value in tech_low_high_p.items()}
             )
 
         # Calculate yh fuel shape
@@ -440,9 +468,8 @@ class WeatherRegion(object):
         If the shape is taken from heat and cooling demand the assumption is made that
         HDD and CDD are directly proportional to fuel usage
         """
-        tot_demand_y = np.sum(demand_yd) # Total yearly demand
-        max_demand_d = np.max(demand_yd) # Maximum daily demand
-        max_factor_yd = (1.0 / tot_demand_y) * max_demand_d
+        # Maximum daily demand divided by total yearly demand
+        max_factor_yd = profile_kernels.peak_factor(demand_yd)
 
         return max_factor_yd
 
@@ -485,40 +512,32 @@ class WeatherRegion(object):
         *Sansom, R. (2014). Decarbonising low grade heat for low carbon future.
         Dissertation, Imperial College London.*
         """
-        shape_yh_hp = np.zeros((365, 24))
-        shape_y_dh = np.zeros((365, 24))
-
-        daily_fuel_profile_holiday = data[tech]['holiday'] / np.sum(data[tech]['holiday'])
-        daily_fuel_profile_workday = data[tech]['workday'] / np.sum(data[tech]['workday'])
-
+        daily_fuel_profile_holiday = profile_kernels.normalise(data[tech]['holiday'])
+        daily_fuel_profile_workday = profile_kernels.normalise(data[tech]['workday'])
+
+        # Take respectve daily fuel curve depending on weekday or weekend
+        # from Robert Sansom for heat pumps
+        daytypes = representative_days.get_daytypes(data['sim_param']['list_dates'])
+        daily_fuel_profile_y_dh = np.where(
+            daytypes[:, np.newaxis] == 1,
+            daily_fuel_profile_holiday,
+            daily_fuel_profile_workday)
+
+        # Calculate weighted average daily efficiency of heat pump
+        # (the efficiencies at the resolution of the stock are expanded to every hour)
         tech_eff = tech_stock.get_tech_attr('rs_space_heating', 'heat_pumps_gas', 'eff_cy')
+        average_eff_d = np.sum(
+            daily_fuel_profile_y_dh * tech_stock.resolution.expand(tech_eff), axis=1)
 
-        for day, date_gasday in enumerate(data['sim_param']['list_dates']):
-
-            # Take respectve daily fuel curve depending on weekday or weekend
-            # from Robert Sansom for heat pumps
-            if date_handling.get_weekday_type(date_gasday) == 'holiday':
-                daily_fuel_profile = daily_fuel_profile_holiday
-            else:
-                daily_fuel_profile = daily_fuel_profile_workday
-
-            # Calculate weighted average daily efficiency of heat pump
-            average_eff_d = 0
-            for hour, heat_share_h in enumerate(daily_fuel_profile):
-                # Hourly heat demand * heat pump efficiency
-                average_eff_d += heat_share_h * tech_eff[day][hour]
-
-            # Convert daily service demand to fuel (Heat demand / efficiency = fuel)
-            hp_daily_fuel = rs_hdd_cy[day] / average_eff_d
-
-            # Fuel distribution within day
-            fuel_shape_d = hp_daily_fuel * daily_fuel_profile
+        # Convert daily service demand to fuel (Heat demand / efficiency = fuel)
+        hp_daily_fuel = rs_hdd_cy / average_eff_d
 
-            # Distribute fuel of day according to fuel load curve
-            shape_yh_hp[day] = fuel_shape_d
+        # Distribute fuel of day according to fuel load curve
+        shape_yh_hp = hp_daily_fuel[:, np.newaxis] * daily_fuel_profile_y_dh
 
-            # Add normalised daily fuel curve
-            shape_y_dh[day] = load_profile.absolute_to_relative_without_nan(fuel_shape_d)
+        # Normalised daily fuel curve (zero for days without fuel)
+        shape_y_dh = np.where(
+            hp_daily_fuel[:, np.newaxis] != 0, daily_fuel_profile_y_dh, 0)
 
         # Convert absolute hourly fuel demand to relative fuel demand within a year
         shape_yh = load_profile.absolute_to_relative(shape_yh_hp)
@@ -0,0 +1,256 @@
+"""Hierarchy of the modelled regions (e.g. LAD -> NUTS region -> nation)
+
+For every higher level a sparse aggregation matrix of shape
+(units of level, regions) is built from a lookup csv file. Results
+of all regions are aggregated to a level with one sparse matrix
+multiplication. The matrices are cached in a ``.npz`` file which is
+only rebuilt if the lookup file or the modelled regions change.
+"""
+import os
+import sys
+import csv
+import hashlib
+import numpy as np
+from scipy import sparse
+
+def read_hierarchy_lookup(path_to_csv):
+    """Read lookup of the higher level units of every region
+
+    Parameters
+    ----------
+    path_to_csv : str
+        Path to lookup file. The first column contains the modelled
+        regions, every further column a level (e.g. ``lad,region,nation``)
+
+    Returns
+    -------
+    levels : list
+        Names of higher levels
+    region_units : dict
+        Unit of every level of every region {region: {level: unit}}
+    """
+    region_units = {}
+
+    with open(path_to_csv, 'r') as csvfile:
+        read_lines = csv.reader(csvfile, delimiter=',')
+        headings = [str.strip(heading) for heading in next(read_lines)]
+        levels = headings[1:]
+
+        for row in read_lines:
+            if not row:
+                continue
+            region_units[str.strip(row[0])] = {
+                level: str.strip(unit) for level, unit in zip(levels, row[1:])}
+
+    return levels, region_units
+
+def build_aggregation_matrix(region_names, region_units, level):
+    """Build the sparse aggregation matrix of a level
+
+    Parameters
+    ----------
+    region_names : list
+        Modelled regions (order of the result arrays)
+    region_units : dict
+        Unit of every level of every region
+    level : str
+        Level
+
+    Returns
+    -------
+    unit_names : list
+        Units of the level (sorted)
+    aggregation_matrix : scipy.sparse.csr_matrix
+        Matrix with a one for every unit (row) and region (column)
+        within the unit, shape: (unit, region)
+    """
+    for region_name in region_names:
+        if region_name not in region_units:
+            sys.exit("Error: Region {} is not defined in the region hierarchy".format(region_name))
+
+    unit_names = sorted(set(region_units[region_name][level] for region_name in region_names))
+    unit_index = {unit: unit_nr for unit_nr, unit in enumerate(unit_names)}
+
+    rows = np.array([unit_index[region_units[region_name][level]] for region_name in region_names], dtype=int)
+    columns = np.arange(len(region_names))
+
+    aggregation_matrix = sparse.csr_matrix(
+        (np.ones(len(region_names)), (rows, columns)),
+        shape=(len(unit_names), len(region_names)))
+
+    return unit_names, aggregation_matrix
+
+class RegionHierarchy(object):
+    """Aggregation of regional results to higher levels
+
+    Parameters
+    ----------
+    region_names : list
+        Modelled regions (order of the result arrays)
+    levels : list
+        Names of higher levels
+    unit_names : dict
+        Units of every level
+    aggregation_matrices : dict
+        Sparse aggregation matrix of every level
+    """
+    def __init__(self, region_names, levels, unit_names, aggregation_matrices):
+        """Constructor
+        """
+        self.region_names = list(region_names)
+        self.levels = list(levels)
+        self.unit_names = unit_names
+        self.aggregation_matrices = aggregation_matrices
+
+    def aggregate(self, values, level, region_axis=0):
+        """Aggregate regional values to a level
+
+        Parameters
+        ----------
+        values : array
+            Values of all regions (e.g. shape (region, fueltype, 365, 24))
+        level : str
+            Level to aggregate to
+        region_axis : int, default=0
+            Axis of the regions
+
+        Returns
+        -------
+        values_level : array
+            Values of all units of the level (regions are replaced by units)
+        """
+        values_regions = np.moveaxis(values, region_axis, 0)
+        shape_rest = values_regions.shape[1:]
+
+        values_level = self.aggregation_matrices[level].dot(
+            values_regions.reshape(len(self.region_names), -1))
+
+        return np.moveaxis(
+            values_level.reshape((len(self.unit_names[level]),) + shape_rest), 0, region_axis)
+
+    def aggregate_all(self, values, region_axis=0):
+        """Aggregate regional values to all levels
+
+        Parameters
+        ----------
+        values : array
+            Values of all regions
+        region_axis : int, default=0
+            Axis of the regions
+
+        Returns
+        -------
+        values_levels : dict
+            Values of every level {level: values}
+        """
+        return {level: self.aggregate(values, level, region_axis) for level in self.levels}
+
+def create_region_hierarchy(path_to_csv, region_names):
+    """Create region hierarchy from a lookup file
+
+    Parameters
+    ----------
+    path_to_csv : str
+        Path to lookup file
+    region_names : list
+        Modelled regions
+
+    Returns
+    -------
+    region_hierarchy : RegionHierarchy
+        Region hierarchy
+    """
+    levels, region_units = read_hierarchy_lookup(path_to_csv)
+
+    unit_names = {}
+    aggregation_matrices = {}
+    for level in levels:
+        unit_names[level], aggregation_matrices[level] = build_aggregation_matrix(
+            region_names, region_units, level)
+
+    return RegionHierarchy(region_names, levels, unit_names, aggregation_matrices)
+
+def get_cache_key(path_to_csv, region_names):
+    """Hash of the lookup file and the modelled regions
+    """
+    hash_value = hashlib.sha1()
+    with open(path_to_csv, 'rb') as csv_file:
+        hash_value.update(csv_file.read())
+    for region_name in region_names:
+        hash_value.update(str(region_name).encode('utf-8') + b'\n')
+
+    return hash_value.hexdigest()
+
+def write_cache(path_cache, cache_key, region_hierarchy):
+    """Write aggregation matrices of a region hierarchy to a cache file
+
+    Note
+    ----
+    As every region belongs to exactly one unit of a level, only the
+    unit of every region is stored
+    """
+    arrays = {
+        'cache_key': np.array(cache_key),
+        'region_names': np.array(region_hierarchy.region_names, dtype=str),
+        'levels': np.array(region_hierarchy.levels, dtype=str)}
+
+    for level in region_hierarchy.levels:
+        arrays['{}__unit_names'.format(level)] = np.array(region_hierarchy.unit_names[level], dtype=str)
+        arrays['{}__region_unit'.format(level)] = region_hierarchy.aggregation_matrices[level].tocsc().indices
+
+    np.savez(path_cache, **arrays)
+
+def read_cache(path_cache, cache_key):
+    """Read a region hierarchy from a cache file
+
+    Returns
+    -------
+    region_hierarchy : RegionHierarchy or None
+        Region hierarchy (`None` if the cache is outdated)
+    """
+    with np.load(path_cache) as cache:
+        if str(cache['cache_key']) != cache_key:
+            return None
+
+        region_names = cache['region_names'].tolist()
+        levels = cache['levels'].tolist()
+
+        unit_names = {}
+        aggregation_matrices = {}
+        for level in levels:
+            unit_names[level] = cache['{}__unit_names'.format(level)].tolist()
+            aggregation_matrices[level] = sparse.csr_matrix(
+                (np.ones(len(region_names)), (cache['{}__region_unit'.format(level)], np.arange(len(region_names)))),
+                shape=(len(unit_names[level]), len(region_names)))
+
+    return RegionHierarchy(region_names, levels, unit_names, aggregation_matrices)
+
+def load_region_hierarchy(path_to_csv, region_names, path_cache):
+    """Load region hierarchy from cache or create it from the lookup file
+
+    Parameters
+    ----------
+    path_to_csv : str
+        Path to lookup file
+    region_names : list
+        Modelled regions (order of the result arrays)
+    path_cache : str
+        Path to cache file
+
+    Returns
+    -------
+    region_hierarchy : RegionHierarchy
+        Region hierarchy
+    """
+    region_names = list(region_names)
+    cache_key = get_cache_key(path_to_csv, region_names)
+
+    if os.path.isfile(path_cache):
+        region_hierarchy = read_cache(path_cache, cache_key)
+        if region_hierarchy is not None:
+            return region_hierarchy
+
+    region_hierarchy = create_region_hierarchy(path_to_csv, region_names)
+    write_cache(path_cache, cache_key, region_hierarchy)
+
+    return region_hierarchy
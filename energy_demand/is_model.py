@@ -4,17 +4,18 @@ Industry Submodel
 
 """
 import energy_demand.enduse as endusefunctions
+from energy_demand.basic import fuel_adjustment
 
 class IndustryModel(object):
     """Industry Submodel
     """
-    def __init__(self, data, region_object, enduse, sector):
+    def __init__(self, run_context, region_object, enduse, sector):
         """Constructor of industry submodel
 
         Parameters
         ----------
-        data : dict
-            Data
+        run_context : RunContext
+            Run context of simulation year
         region_object : dict
             Object of region
         enduse : string
@@ -25,34 +26,41 @@ class IndustryModel(object):
         self.region_name = region_object.region_name
         self.enduse = enduse
         self.sector = sector
-        self.fuels_all_enduses = data['is_fueldata_disagg'][self.region_name][self.sector]
+        self.fuels_all_enduses = region_object.is_enduses_sectors_fuels[self.sector]
 
-        self.enduse_object = self.create_enduse(region_object, data)
+        self.enduse_object = self.create_enduse(region_object, run_context)
 
-    def create_enduse(self, region_object, data):
+    def create_enduse(self, region_object, run_context):
         """Create enduse for industry sector
         """
+        submodel_context = run_context.submodels['is_submodel']
+
         industry_object = endusefunctions.Enduse(
             region_name=self.region_name,
-            data=data,
+            run_context=run_context,
             enduse=self.enduse,
             sector=self.sector,
             fuel=self.fuels_all_enduses[self.enduse],
             tech_stock=region_object.is_tech_stock,
-            heating_factor_y=region_object.is_heating_factor_y,
-            cooling_factor_y=region_object.is_cooling_factor_y,
-            fuel_switches=data['assumptions']['is_fuel_switches'],
-            service_switches=data['assumptions']['is_service_switches'],
-            fuel_tech_p_by=data['assumptions']['is_fuel_tech_p_by'][self.enduse],
-            tech_increased_service=data['assumptions']['is_tech_increased_service'],
-            tech_decreased_share=data['assumptions']['is_tech_decreased_share'],
-            tech_constant_share=data['assumptions']['is_tech_constant_share'],
-            installed_tech=data['assumptions']['is_installed_tech'],
-            sig_param_tech=data['assumptions']['is_sig_param_tech'],
-            enduse_overall_change_ey=data['assumptions']['enduse_overall_change_ey']['is_model'],
+            fuel_switches=submodel_context.fuel_switches,
+            service_switches=submodel_context.service_switches,
+            fuel_tech_p_by=submodel_context.fuel_tech_p_by[self.enduse],
+            tech_increased_service=submodel_context.tech_increased_service,
+            tech_decreased_share=submodel_context.tech_decreased_share,
+            tech_constant_share=submodel_context.tech_constant_share,
+            installed_tech=submodel_context.installed_tech,
+            sig_param_tech=submodel_context.sig_param_tech,
             regional_profile_stock=region_object.is_load_profiles,
-            reg_scenario_drivers=data['assumptions']['scenario_drivers']['is_submodule'],
-            crit_flat_profile=True
+            fuel_factors=fuel_adjustment.get_fuel_factors(
+                self.enduse,
+                submodel_context.national_fuel_factors,
+                run_context.assumptions,
+                region_object.is_heating_factor_y,
+                region_object.is_cooling_factor_y,
+                submodel_context.driver_ratios.get_ratio(
+                    run_context.curr_yr, self.region_name, self.enduse)),
+            crit_flat_profile=True,
+            switch_plan=submodel_context.switch_plans.get(self.enduse)
         )
 
         return industry_object
@@ -38,21 +38,43 @@ TODO: REMOVE HEAT BOILER
 '''
 import os
 import sys
+import argparse
+import yaml
 import numpy as np
 import energy_demand.energy_model as energy_model
 from energy_demand.assumptions import assumptions
 from energy_demand.read_write import data_loader
 from energy_demand.read_write import write_data
 from energy_demand.read_write import read_data
+from energy_demand.read_write import result_store
 from energy_demand.dwelling_stock import dw_stock
 from energy_demand.basic import testing_functions as testing
-from energy_demand.basic import date_handling
-from energy_demand.validation import lad_validation
-from energy_demand.validation import elec_national_data
-from energy_demand.plotting import plotting_results
-print("Start Energy Demand Model with python version: " + str(sys.version))
+from energy_demand.basic import scenario_drivers
 #!python3.6
 
+# Default configuration of a model run (overwritten by the
+# configuration file and the command line flags)
+DEFAULT_CONFIG = {
+    'local_data_path': None,
+    'path_main': os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."),
+    'temporal_resolution': None,
+    'representative_days': None,
+    'spill_results': False,
+    'validation': False,
+    'charts': False,
+    'instrument_profiler': False
+}
+
+# Aggregated results which are kept for every year
+RESULT_STORE_ATTRIBUTES = [
+    'rs_tot_fuel_y_enduse_specific_h',
+    'ss_tot_fuel_enduse_specific_h',
+    'all_models_tot_fuel_y_enduse_specific_h',
+    'rs_tot_fuels_all_enduses_y',
+    'rs_tot_fuel_y_max_allenduse_fueltyp',
+    'ss_tot_fuel_y_max_allenduse_fueltyp'
+]
+
 def energy_demand_model(data):
     """Main function of energy demand model to calculate yearly demand
 
@@ -98,32 +120,42 @@ def energy_demand_model(data):
     for fff in range(8):
         print("FF: " + str(np.sum(model_run_object.all_submodels_sum_uk_specfuelype_enduses_y[fff])))
     # # --- Write to csv and YAML Convert data according to region and fueltype
-    #result_dict = read_data.convert_out_format_es(data, model_run_object, ['rs_submodel', 'ss_submodel', 'is_submodel', 'ts_submodel'])
+    #result_dict = read_data.convert_out_format_es(data, model_run_object)
     ###write_data.write_final_result(data, result_dict, model_run_object.curr_yr, data['lu_reg'], False)
 
     print("...finished energy demand model simulation")
     return _, model_run_object
 
-if __name__ == "__main__":
-    """
-    """
-    print('Start HIRE')
 
-    instrument_profiler = True
+def load_base_data(path_main, local_data_path, sim_param=None):
+    """Load all data needed to run the energy demand model
 
-    # Paths
-    path_main = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
-    local_data_path = r'Y:\01-Data_NISMOD\data_energy_demand'
+    Parameters
+    ----------
+    path_main : str
+        Path to the energy demand repository
+    local_data_path : str
+        Path to the local data folder
+    sim_param : dict, default=None
+        Simulation parameters which replace the assumed
+        parameters (e.g. {'temporal_resolution': 'daily'})
 
-    # Load data
+    Returns
+    -------
+    base_data : dict
+        Data container
+    """
     base_data = data_loader.load_paths(path_main, local_data_path)
     base_data = data_loader.load_fuels(base_data)
     base_data = data_loader.load_data_tech_profiles(base_data)
     base_data = data_loader.load_data_profiles(base_data)
     base_data['assumptions'] = assumptions.load_assumptions(base_data)
+    if sim_param:
+        base_data['sim_param'].update(sim_param)
     base_data['weather_stations'], base_data['temperature_data'] = data_loader.load_data_temperatures(
         os.path.join(base_data['paths']['path_scripts_data'], 'weather_data')
         )
+    base_data['temporal_resolution'] = data_loader.load_temporal_resolution(base_data)
 
     # >>>>>>>>>>>>>>>DUMMY DATA GENERATION
     # Population
@@ -133,6 +165,9 @@ if __name__ == "__main__":
     base_data = data_loader.dummy_data_generation(base_data)
     # <<<<<<<<<<<<<<<<<< FINISHED DUMMY GENERATION DATA
 
+    # Aggregation of regions to higher levels (e.g. NUTS regions, nation)
+    base_data['region_hierarchy'] = data_loader.load_region_hierarchy(base_data)
+
     # Load data from script calculations
     base_data = read_data.load_script_data(base_data)
 
@@ -140,7 +175,147 @@ if __name__ == "__main__":
     base_data['rs_dw_stock'] = dw_stock.rs_dw_stock(base_data['lu_reg'], base_data)
     base_data['ss_dw_stock'] = dw_stock.ss_dw_stock(base_data['lu_reg'], base_data)
 
-    results_every_year = []
+    # Change of scenario drivers of all simulation years, regions and enduses
+    base_data['scenario_driver_ratios'] = scenario_drivers.create_driver_ratios(base_data)
+
+    return base_data
+
+def validate_model_run(base_data, model_run_object):
+    """Validate the national and regional demand of a model run
+    and render the validation charts
+
+    Parameters
+    ----------
+    base_data : dict
+        Data container
+    model_run_object : object
+        Object of a yearly model run
+
+    Note
+    ----
+    The validation and plotting modules (which depend on
+    matplotlib) are only imported if this function is called
+    """
+    from energy_demand.basic import date_handling
+    from energy_demand.validation import lad_validation
+    from energy_demand.validation import elec_national_data
+    from energy_demand.plotting import chart_pack
+
+    # ---------------------------------------------------
+    # Validation of national electrictiy demand for base year
+    # ---------------------------------------------------
+    #'''
+    winter_week = list(range(date_handling.convert_date_to_yearday(2015, 1, 12), date_handling.convert_date_to_yearday(2015, 1, 19))) #Jan
+    spring_week = list(range(date_handling.convert_date_to_yearday(2015, 5, 11), date_handling.convert_date_to_yearday(2015, 5, 18))) #May
+    summer_week = list(range(date_handling.convert_date_to_yearday(2015, 7, 13), date_handling.convert_date_to_yearday(2015, 7, 20))) #Jul
+    #spring_week = list(range(date_handling.convert_date_to_yearday(2015, 5, 18), date_handling.convert_date_to_yearday(2015, 5, 26))) #May
+    #summer_week = list(range(date_handling.convert_date_to_yearday(2015, 7, 20), date_handling.convert_date_to_yearday(2015, 7, 28))) #Jul
+    autumn_week = list(range(date_handling.convert_date_to_yearday(2015, 10, 12), date_handling.convert_date_to_yearday(2015, 10, 19))) #Oct
+
+    days_to_plot = winter_week + spring_week + summer_week + autumn_week
+    days_to_plot_full_year = list(range(0, 365))
+
+    # ---------------------------------------------------------------------------------------------
+    # Compare total gas and electrictiy shape with Elexon Data for Base year for different regions
+    # ---------------------------------------------------------------------------------------------
+    validation_elec_data_2015_INDO, validation_elec_data_2015_ITSDO = elec_national_data.read_raw_elec_2015_data(
+        base_data['paths']['folder_validation_national_elec_data'],
+        base_data['paths']['path_validation_elec_cache'])
+
+    print("Loaded validation data elec demand. ND:  {}   TSD: {}".format(np.sum(validation_elec_data_2015_INDO), np.sum(validation_elec_data_2015_ITSDO)))
+    print("--ECUK Elec_demand  {} ".format(np.sum(model_run_object.all_submodels_sum_uk_specfuelype_enduses_y[2])))
+    print("--ECUK Gas Demand   {} ".format(np.sum(model_run_object.all_submodels_sum_uk_specfuelype_enduses_y[1])))
+    diff_factor_TD_ECUK_Input = (1.0 / np.sum(validation_elec_data_2015_INDO)) * np.sum(model_run_object.all_submodels_sum_uk_specfuelype_enduses_y[2]) # 1.021627962194478
+    print("FACTOR: " + str(diff_factor_TD_ECUK_Input))
+
+    INDO_factoreddata = diff_factor_TD_ECUK_Input * validation_elec_data_2015_INDO
+    print("CORRECTED DEMAND:  {} ".format(np.sum(INDO_factoreddata)))
+
+    validation_metrics = elec_national_data.calc_validation_metrics(
+        validation_elec_data_2015_INDO, model_run_object.all_submodels_sum_uk_specfuelype_enduses_y[2])
+    print("RMSE: {}  Peak h error: {}  Peak d error: {}".format(
+        validation_metrics['rmse'], validation_metrics['peak_h_error'], validation_metrics['peak_d_error']))
+
+    #GET SPECIFIC REGION
+
+    # Compare different models
+    chart_data = chart_pack.get_chart_data(base_data)
+    validation_charts = [
+        (elec_national_data.compare_results, ('plot_figure_01.pdf', chart_data, validation_elec_data_2015_INDO, validation_elec_data_2015_ITSDO, INDO_factoreddata, model_run_object.all_submodels_sum_uk_specfuelype_enduses_y[2], 'all_submodels', days_to_plot_full_year))]
+    #elec_national_data.compare_results('plot_figure_01.pdf', base_data, validation_elec_data_2015_INDO, validation_elec_data_2015_ITSDO, INDO_factoreddata, model_run_object.all_submodels_sum_uk_specfuelype_enduses_y[2], 'all_submodels', days_to_plot)
+    #elec_national_data.compare_results('plot_figure_01.pdf', base_data, validation_elec_data_2015_INDO, validation_elec_data_2015_ITSDO, INDO_factoreddata, model_run_object.rs_sum_uk_specfuelype_enduses_y[2], 'rs_model', days_to_plot)
+    #elec_national_data.compare_results('plot_figure_01.pdf', base_data, validation_elec_data_2015_INDO, validation_elec_data_2015_ITSDO, INDO_factoreddata, model_run_object.ss_sum_uk_specfuelype_enduses_y[2], 'ss_model', days_to_plot)
+    #elec_national_data.compare_results('plot_figure_01.pdf', base_data, validation_elec_data_2015_INDO, validation_elec_data_2015_ITSDO, INDO_factoreddata, model_run_object.is_sum_uk_specfuelype_enduses_y[2], 'is_model', days_to_plot)
+    #elec_national_data.compare_results('plot_figure_01.pdf', base_data, validation_elec_data_2015_INDO, validation_elec_data_2015_ITSDO, INDO_factoreddata, model_run_object.ts_sum_uk_specfuelype_enduses_y[2], 'ts_model', days_to_plot)
+
+    print("FUEL gwh TOTAL  validation_elec_data_2015_INDO:  {} validation_elec_data_2015_ITSDO: {}  MODELLED DATA:  {} ".format(np.sum(validation_elec_data_2015_INDO), np.sum(validation_elec_data_2015_ITSDO), np.sum(model_run_object.all_submodels_sum_uk_specfuelype_enduses_y[2])))
+    print("FUEL ktoe TOTAL  validation_elec_data_2015_INDO: {} validation_elec_data_2015_ITSDO: {}  MODELLED DATA:  {} ".format(np.sum(validation_elec_data_2015_INDO)/11.63, np.sum(validation_elec_data_2015_ITSDO)/11.63, np.sum(model_run_object.all_submodels_sum_uk_specfuelype_enduses_y[2])/11.63))
+
+    # ---------------------------------------------------
+    # Validation of spatial disaggregation
+    # ---------------------------------------------------
+    lad_infos_shapefile = data_loader.load_LAC_geocodes_info(
+        base_data['paths']['path_dummpy_regions']
+    )
+    lad_validation.compare_lad_regions(
+        'compare_lad_regions.pdf',
+        base_data,
+        lad_infos_shapefile,
+        model_run_object,
+        base_data['nr_of_fueltypes'],
+        base_data['lu_fueltype'],
+        base_data['lu_reg']
+        )
+
+    # ---------------------------------------------------
+    # Validation of national electrictiy demand for peak
+    # ---------------------------------------------------
+    peak_month = 2 #Feb
+    peak_day = 18 #Day
+
+    peak_h, peak_yearhour = model_run_object.peak_engine.get_peak_h()
+    print("Coincident peak h (modelled): {}  hour of year: {}  (real): {}".format(
+        peak_h[2], peak_yearhour[2], np.max(validation_elec_data_2015_INDO)))
+
+    validation_charts += [
+        # Compare peak from data
+        (elec_national_data.compare_peak, ("peak_comparison_01.pdf", chart_data, validation_elec_data_2015_INDO, model_run_object.all_submodels_sum_uk_specfuelype_enduses_y[peak_month][peak_day])),
+
+        # Compare peak from coincident peak day of all submodels
+        (elec_national_data.compare_peak, ("peak_comparison_02.pdf", chart_data, validation_elec_data_2015_INDO, model_run_object.peak_engine.get_peak_dh()[2])),
+
+        # Validate boxplots for every hour
+        (elec_national_data.compare_results_hour_boxplots, ("hourly_boxplots_01.pdf", chart_data, validation_elec_data_2015_INDO, model_run_object.all_submodels_sum_uk_specfuelype_enduses_y[2]))
+        ]
+
+    chart_pack.render_charts(validation_charts)
+
+def run_simulation(base_data, spill_results=False, validation=False, charts=False, instrument_profiler=False):
+    """Run the energy demand model for every simulation year
+
+    Parameters
+    ----------
+    base_data : dict
+        Data container
+    spill_results : bool, default=False
+        Criteria whether the results of every year are spilled to disk
+    validation : bool, default=False
+        Criteria whether every model run is validated
+    charts : bool, default=False
+        Criteria whether the chart pack is created
+    instrument_profiler : bool, default=False
+        Criteria whether every model run is profiled
+
+    Returns
+    -------
+    results_every_year : ResultStore
+        Aggregated results of every simulation year
+    """
+    results_every_year = result_store.ResultStore(
+        RESULT_STORE_ATTRIBUTES,
+        base_data['paths']['path_result_store'] if spill_results else None,
+        base_data['temporal_resolution'])
+
     for sim_yr in base_data['sim_param']['sim_period']:
         base_data['sim_param']['curr_yr'] = sim_yr
 
@@ -161,118 +336,132 @@ if __name__ == "__main__":
             print("Profiler Results")
             print(profiler.output_text(unicode=True, color=True))
 
-        results_every_year.append(model_run_object)
-
-        # ---------------------------------------------------
-        # Validation of national electrictiy demand for base year
-        # ---------------------------------------------------
-        #'''
-        winter_week = list(range(date_handling.convert_date_to_yearday(2015, 1, 12), date_handling.convert_date_to_yearday(2015, 1, 19))) #Jan
-        spring_week = list(range(date_handling.convert_date_to_yearday(2015, 5, 11), date_handling.convert_date_to_yearday(2015, 5, 18))) #May
-        summer_week = list(range(date_handling.convert_date_to_yearday(2015, 7, 13), date_handling.convert_date_to_yearday(2015, 7, 20))) #Jul
-        #spring_week = list(range(date_handling.convert_date_to_yearday(2015, 5, 18), date_handling.convert_date_to_yearday(2015, 5, 26))) #May
-        #summer_week = list(range(date_handling.convert_date_to_yearday(2015, 7, 20), date_handling.convert_date_to_yearday(2015, 7, 28))) #Jul
-        autumn_week = list(range(date_handling.convert_date_to_yearday(2015, 10, 12), date_handling.convert_date_to_yearday(2015, 10, 19))) #Oct
-
-        days_to_plot = winter_week + spring_week + summer_week + autumn_week
-        days_to_plot_full_year = list(range(0, 365))
-
-        # ---------------------------------------------------------------------------------------------
-        # Compare total gas and electrictiy shape with Elexon Data for Base year for different regions
-        # ---------------------------------------------------------------------------------------------
-        validation_elec_data_2015_INDO, validation_elec_data_2015_ITSDO = elec_national_data.read_raw_elec_2015_data(
-            base_data['paths']['folder_validation_national_elec_data'])
-
-        print("Loaded validation data elec demand. ND:  {}   TSD: {}".format(np.sum(validation_elec_data_2015_INDO), np.sum(validation_elec_data_2015_ITSDO)))
-        print("--ECUK Elec_demand  {} ".format(np.sum(model_run_object.all_submodels_sum_uk_specfuelype_enduses_y[2])))
-        print("--ECUK Gas Demand   {} ".format(np.sum(model_run_object.all_submodels_sum_uk_specfuelype_enduses_y[1])))
-        diff_factor_TD_ECUK_Input = (1.0 / np.sum(validation_elec_data_2015_INDO)) * np.sum(model_run_object.all_submodels_sum_uk_specfuelype_enduses_y[2]) # 1.021627962194478
-        print("FACTOR: " + str(diff_factor_TD_ECUK_Input))
-
-        INDO_factoreddata = diff_factor_TD_ECUK_Input * validation_elec_data_2015_INDO
-        print("CORRECTED DEMAND:  {} ".format(np.sum(INDO_factoreddata)))
-
-        #GET SPECIFIC REGION
-
-        # Compare different models
-        elec_national_data.compare_results('plot_figure_01.pdf', base_data, validation_elec_data_2015_INDO, validation_elec_data_2015_ITSDO, INDO_factoreddata, model_run_object.all_submodels_sum_uk_specfuelype_enduses_y[2], 'all_submodels', days_to_plot_full_year)
-        #elec_national_data.compare_results('plot_figure_01.pdf', base_data, validation_elec_data_2015_INDO, validation_elec_data_2015_ITSDO, INDO_factoreddata, model_run_object.all_submodels_sum_uk_specfuelype_enduses_y[2], 'all_submodels', days_to_plot)
-        #elec_national_data.compare_results('plot_figure_01.pdf', base_data, validation_elec_data_2015_INDO, validation_elec_data_2015_ITSDO, INDO_factoreddata, model_run_object.rs_sum_uk_specfuelype_enduses_y[2], 'rs_model', days_to_plot)
-        #elec_national_data.compare_results('plot_figure_01.pdf', base_data, validation_elec_data_2015_INDO, validation_elec_data_2015_ITSDO, INDO_factoreddata, model_run_object.ss_sum_uk_specfuelype_enduses_y[2], 'ss_model', days_to_plot)
-        #elec_national_data.compare_results('plot_figure_01.pdf', base_data, validation_elec_data_2015_INDO, validation_elec_data_2015_ITSDO, INDO_factoreddata, model_run_object.is_sum_uk_specfuelype_enduses_y[2], 'is_model', days_to_plot)
-        #elec_national_data.compare_results('plot_figure_01.pdf', base_data, validation_elec_data_2015_INDO, validation_elec_data_2015_ITSDO, INDO_factoreddata, model_run_object.ts_sum_uk_specfuelype_enduses_y[2], 'ts_model', days_to_plot)
-
-        print("FUEL gwh TOTAL  validation_elec_data_2015_INDO:  {} validation_elec_data_2015_ITSDO: {}  MODELLED DATA:  {} ".format(np.sum(validation_elec_data_2015_INDO), np.sum(validation_elec_data_2015_ITSDO), np.sum(model_run_object.all_submodels_sum_uk_specfuelype_enduses_y[2])))
-        print("FUEL ktoe TOTAL  validation_elec_data_2015_INDO: {} validation_elec_data_2015_ITSDO: {}  MODELLED DATA:  {} ".format(np.sum(validation_elec_data_2015_INDO)/11.63, np.sum(validation_elec_data_2015_ITSDO)/11.63, np.sum(model_run_object.all_submodels_sum_uk_specfuelype_enduses_y[2])/11.63))
-
-        # ---------------------------------------------------
-        # Validation of spatial disaggregation
-        # ---------------------------------------------------
-        lad_infos_shapefile = data_loader.load_LAC_geocodes_info(
-            base_data['paths']['path_dummpy_regions']
-        )
-        lad_validation.compare_lad_regions(
-            'compare_lad_regions.pdf',
-            base_data,
-            lad_infos_shapefile,
-            model_run_object,
-            base_data['nr_of_fueltypes'],
-            base_data['lu_fueltype'],
-            base_data['lu_reg']
-            )
-
-        # ---------------------------------------------------
-        # Validation of national electrictiy demand for peak
-        # ---------------------------------------------------
-        print("...compare peak from data")
-        peak_month = 2 #Feb
-        peak_day = 18 #Day
-        elec_national_data.compare_peak(
-            "peak_comparison_01.pdf",
-            base_data,
-            validation_elec_data_2015_INDO,
-            model_run_object.all_submodels_sum_uk_specfuelype_enduses_y[peak_month][peak_day]
-            )
-
-        print("...compare peak from max peak factors")
-        elec_national_data.compare_peak(
-            "peak_comparison_02.pdf",
-            base_data,
-            validation_elec_data_2015_INDO,
-            model_run_object.peak_all_models_all_enduses_fueltype[2])
-
-        # ---------------------------------------------------
-        # Validate boxplots for every hour
-        # ---------------------------------------------------
-        elec_national_data.compare_results_hour_boxplots(
-            "hourly_boxplots_01.pdf",
-            base_data,
-            validation_elec_data_2015_INDO,
-            model_run_object.all_submodels_sum_uk_specfuelype_enduses_y[2])
+        results_every_year.add_year(sim_yr, model_run_object)
+
+        if validation:
+            validate_model_run(base_data, model_run_object)
+
+        # Release model run object with all enduse objects of the year
+        del model_run_object
 
     # ------------------------------
     # Plotting
     # ------------------------------
-    # Plot load factors
-    ##pf.plot_load_curves_fueltype(results_every_year, base_data)
+    if charts:
+        from energy_demand.plotting import chart_pack
+        chart_pack.create_chart_pack(results_every_year, base_data)
 
-    # Plot total fuel (y) per enduse
-    plotting_results.plot_stacked_Country_end_use("figure_stacked_country01.pdf", base_data, results_every_year, base_data['rs_all_enduses'], 'rs_tot_fuel_y_enduse_specific_h')
-    plotting_results.plot_stacked_Country_end_use("figure_stacked_country02.pdf", base_data, results_every_year, base_data['ss_all_enduses'], 'ss_tot_fuel_enduse_specific_h')
+    return results_every_year
 
-    # Plot total fuel (y) per fueltype
-    plotting_results.plot_fuels_tot_all_enduses("figure_tot_all_enduse01.pdf", results_every_year, base_data, 'rs_tot_fuels_all_enduses_y')
-    plotting_results.plot_fuels_tot_all_enduses("figure_tot_all_enduse02.pdf", results_every_year, base_data, 'rs_tot_fuels_all_enduses_y')
+def parse_arguments(args=None):
+    """Parse the command line arguments of a model run
 
-    # Plot peak demand (h) per fueltype
-    plotting_results.plot_fuels_peak_hour(results_every_year, base_data, 'rs_tot_fuel_y_max_allenduse_fueltyp')
-    plotting_results.plot_fuels_peak_hour(results_every_year, base_data, 'ss_tot_fuel_y_max_allenduse_fueltyp')
+    Parameters
+    ----------
+    args : list, default=None
+        Command line arguments (if `None`, `sys.argv` is used)
 
-    # Plot a full week
-    plotting_results.plot_fuels_tot_all_enduses_week("figure_tot_all_enduse03.pdf", results_every_year, base_data, 'rs_tot_fuels_all_enduses_y')
-    plotting_results.plot_fuels_tot_all_enduses_week("figure_tot_all_enduse04.pdf", results_every_year, base_data, 'rs_tot_fuels_all_enduses_y')
+    Returns
+    -------
+    arguments : argparse.Namespace
+        Parsed arguments (`None` for flags which are not set)
+    """
+    parser = argparse.ArgumentParser(
+        prog='energy_demand',
+        description='Run the energy demand model (headless)')
+    parser.add_argument(
+        '-c', '--config', dest='path_config',
+        help='Path to a yaml configuration file')
+    parser.add_argument(
+        '-d', '--data-path', dest='local_data_path',
+        help='Path to the local data folder')
+    parser.add_argument(
+        '--path-main', dest='path_main',
+        help='Path to the energy demand repository')
+    parser.add_argument(
+        '--temporal-resolution', dest='temporal_resolution',
+        help="Temporal resolution of the model run ('hourly', 'daily', 'monthly' or 'custom')")
+    parser.add_argument(
+        '--representative-days', dest='representative_days', type=int,
+        help='Number of representative days of the technology and enduse calculations')
+    parser.add_argument(
+        '--spill-results', dest='spill_results', action='store_true', default=None,
+        help='Spill the results of every year to disk')
+    parser.add_argument(
+        '--validation', dest='validation', action='store_true', default=None,
+        help='Validate every model run (requires matplotlib)')
+    parser.add_argument(
+        '--charts', dest='charts', action='store_true', default=None,
+        help='Create the chart pack (requires matplotlib)')
+    parser.add_argument(
+        '--profile', dest='instrument_profiler', action='store_true', default=None,
+        help='Profile every model run (requires pyinstrument)')
+
+    return parser.parse_args(args)
+
+def get_config(arguments):
+    """Get configuration of a model run
 
-    # Plot all enduses
-    plotting_results.plot_stacked_Country_end_use("figure_stacked_country_final.pdf", base_data, results_every_year, base_data['rs_all_enduses'], 'all_models_tot_fuel_y_enduse_specific_h')
+    Parameters
+    ----------
+    arguments : argparse.Namespace
+        Parsed command line arguments
+
+    Returns
+    -------
+    config : dict
+        Configuration
+
+    Note
+    ----
+    The default configuration is overwritten by the configuration
+    file and the configuration file by the command line flags
+    """
+    config = dict(DEFAULT_CONFIG)
+
+    if arguments.path_config:
+        with open(arguments.path_config, 'r') as config_file:
+            config_file_values = yaml.safe_load(config_file) or {}
+
+        for key, value in config_file_values.items():
+            if key not in DEFAULT_CONFIG:
+                sys.exit("Error: Unknown configuration '{}' in {}".format(key, arguments.path_config))
+            config[key] = value
+
+    for key, value in vars(arguments).items():
+        if key in DEFAULT_CONFIG and value is not None:
+            config[key] = value
+
+    if not config['local_data_path']:
+        sys.exit("Error: No local data path is defined (use --data-path or a configuration file)")
+
+    return config
+
+def main(args=None):
+    """Console entry point of the energy demand model
+
+    Parameters
+    ----------
+    args : list, default=None
+        Command line arguments (if `None`, `sys.argv` is used)
+    """
+    config = get_config(parse_arguments(args))
+
+    print("Start Energy Demand Model with python version: " + str(sys.version))
+
+    sim_param = {
+        key: config[key] for key in ('temporal_resolution', 'representative_days') if config[key] is not None}
+
+    base_data = load_base_data(config['path_main'], config['local_data_path'], sim_param)
+
+    run_simulation(
+        base_data,
+        spill_results=config['spill_results'],
+        validation=config['validation'],
+        charts=config['charts'],
+        instrument_profiler=config['instrument_profiler'])
 
     print("... Finished running Energy Demand Model")
+
+if __name__ == "__main__":
+    main()
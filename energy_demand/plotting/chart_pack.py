@@ -0,0 +1,183 @@
+"""Render the standard charts of a model run
+
+The results needed for every chart are sliced or reduced from the result
+store first, so that only small arrays are sent to the worker processes.
+The charts are rendered in parallel with the non-interactive Agg backend.
+"""
+import multiprocessing
+import numpy as np
+import matplotlib
+from energy_demand.read_write import result_store
+from energy_demand.plotting import plotting_results
+
+def init_worker():
+    """Use non-interactive backend in worker processes
+    """
+    matplotlib.use('Agg')
+
+def render_chart(chart_job):
+    """Render a single chart
+
+    Parameters
+    ----------
+    chart_job : tuple
+        Plotting function and its arguments
+    """
+    import matplotlib.pyplot as plt
+
+    plot_function, args = chart_job
+    plot_function(*args)
+    plt.close('all')
+
+def render_charts(chart_jobs, processes=None):
+    """Render independent charts in parallel
+
+    Parameters
+    ----------
+    chart_jobs : list
+        Charts to render [(plot_function, args), ...]
+    processes : int
+        Number of worker processes (if `None`, the number of
+        cpus is used; if 1, charts are rendered sequentially)
+    """
+    if processes == 1:
+        init_worker()
+        for chart_job in chart_jobs:
+            render_chart(chart_job)
+    else:
+        with multiprocessing.Pool(processes, initializer=init_worker) as pool:
+            pool.map(render_chart, chart_jobs)
+
+def reduce_years(results, attributes, reduce_function):
+    """Reduce attributes of every year of the result store
+
+    Parameters
+    ----------
+    results : ResultStore
+        Results of all years
+    attributes : list
+        Attributes to keep
+    reduce_function : function
+        Function applied to every array (or every array of a dict)
+
+    Returns
+    -------
+    reduced_results : list
+        `YearResults` of every year with reduced attributes
+    """
+    reduced_results = []
+    for year_results in results:
+        reduced = {}
+        for attribute in attributes:
+            value = getattr(year_results, attribute)
+            if isinstance(value, dict):
+                reduced[attribute] = {
+                    key: reduce_function(key_value) for key, key_value in value.items()}
+            else:
+                reduced[attribute] = reduce_function(value)
+
+        reduced_results.append(result_store.YearResults(
+            year_results.curr_yr, reduced, year_results.resolution))
+
+    return reduced_results
+
+def sum_y(results, attributes):
+    """Reduce hourly arrays to yearly sums of every fueltype
+
+    Note
+    ----
+    Arrays with one axis (e.g. peak hour per fueltype) are kept
+    """
+    def sum_fueltype_y(value):
+        value = np.asarray(value)
+        if value.ndim > 1:
+            return value.reshape(value.shape[0], -1).sum(axis=1)
+        return value
+
+    return reduce_years(results, attributes, sum_fueltype_y)
+
+def slice_days(results, attributes, days, year=None):
+    """Slice days of hourly arrays (fueltype, 365, 24)
+
+    Parameters
+    ----------
+    days : list
+        Yeardays to keep
+    year : int
+        Only keep this year (if `None`, the last year)
+    """
+    if year is None:
+        year = results.years[-1]
+
+    return reduce_years(
+        [results.get_year(year)], attributes, lambda value: value[:, list(days)])
+
+def get_chart_data(data):
+    """Select the data entries needed for plotting
+
+    Parameters
+    ----------
+    data : dict
+        Data container
+
+    Returns
+    -------
+    chart_data : dict
+        Data entries used in the plotting functions
+    """
+    return {
+        'paths': {'path_main': data['paths']['path_main']},
+        'sim_param': data['sim_param'],
+        'lu_fueltype': data['lu_fueltype'],
+        'nr_of_fueltypes': data['nr_of_fueltypes']
+        }
+
+def create_chart_pack(results, data, processes=None):
+    """Render the standard charts of all simulated years
+
+    Parameters
+    ----------
+    results : ResultStore
+        Results of all years
+    data : dict
+        Data container
+    processes : int
+        Number of worker processes
+    """
+    chart_data = get_chart_data(data)
+    days_to_plot = range(10, 17)
+
+    # Reduce results to what is plotted
+    results_y = sum_y(
+        results,
+        [
+            'rs_tot_fuel_y_enduse_specific_h',
+            'ss_tot_fuel_enduse_specific_h',
+            'all_models_tot_fuel_y_enduse_specific_h',
+            'rs_tot_fuels_all_enduses_y',
+            'rs_tot_fuel_y_max_allenduse_fueltyp',
+            'ss_tot_fuel_y_max_allenduse_fueltyp'
+        ])
+    chart_jobs = [
+        # Plot total fuel (y) per enduse
+        (plotting_results.plot_stacked_Country_end_use, ("figure_stacked_country01.pdf", chart_data, results_y, data['rs_all_enduses'], 'rs_tot_fuel_y_enduse_specific_h')),
+        (plotting_results.plot_stacked_Country_end_use, ("figure_stacked_country02.pdf", chart_data, results_y, data['ss_all_enduses'], 'ss_tot_fuel_enduse_specific_h')),
+
+        # Plot total fuel (y) per fueltype
+        (plotting_results.plot_fuels_tot_all_enduses, ("figure_tot_all_enduse01.pdf", results_y, chart_data, 'rs_tot_fuels_all_enduses_y')),
+
+        # Plot peak demand (h) per fueltype
+        (plotting_results.plot_fuels_peak_hour, (results_y, chart_data, 'rs_tot_fuel_y_max_allenduse_fueltyp', "figure_peak_hour01.pdf")),
+        (plotting_results.plot_fuels_peak_hour, (results_y, chart_data, 'ss_tot_fuel_y_max_allenduse_fueltyp', "figure_peak_hour02.pdf")),
+
+        # Plot all enduses
+        (plotting_results.plot_stacked_Country_end_use, ("figure_stacked_country_final.pdf", chart_data, results_y, data['rs_all_enduses'], 'all_models_tot_fuel_y_enduse_specific_h'))
+        ]
+
+    # Plot a full week (only if hourly results are stored)
+    if results.resolution_name == 'hourly':
+        results_week = slice_days(results, ['rs_tot_fuels_all_enduses_y'], days_to_plot)
+        chart_jobs.append(
+            (plotting_results.plot_fuels_tot_all_enduses_week, ("figure_tot_all_enduse03.pdf", results_week, chart_data, 'rs_tot_fuels_all_enduses_y', days_to_plot)))
+
+    render_charts(chart_jobs, processes)
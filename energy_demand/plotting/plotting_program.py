@@ -12,6 +12,35 @@ def cm2inch(*tupl):
     else:
         return tuple(i/inch for i in tupl)
 
+def downsample(values, max_points):
+    """Reduce values to plot by averaging consecutive blocks
+
+    Parameters
+    ----------
+    values : array
+        Values to plot (1-dimensional)
+    max_points : int
+        Maximum number of points to plot
+
+    Returns
+    -------
+    x_values : array
+        Position of every block (index of its first value)
+    y_values : array
+        Averaged values of every block
+    """
+    values = np.asarray(values)
+    block_size = max(1, int(np.ceil(len(values) / float(max_points))))
+    nr_of_blocks = int(np.ceil(len(values) / float(block_size)))
+
+    # Pad last block with its mean
+    padded_values = np.full((nr_of_blocks * block_size), np.nan)
+    padded_values[:len(values)] = values
+    y_values = np.nanmean(padded_values.reshape(nr_of_blocks, block_size), axis=1)
+    x_values = np.arange(nr_of_blocks) * block_size
+
+    return x_values, y_values
+
 def plotout_sigmoid_tech_diff(L_values, technology, enduse, xdata, ydata, fit_parameter, close_window_crit=True):
     """Plot sigmoid diffusion
     """
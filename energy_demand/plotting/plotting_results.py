@@ -157,17 +157,18 @@ def plot_load_curves_fueltype(results_objects, data): # nr_of_day_to_plot, fuelt
 
     #plt.show()
 
-def plot_fuels_tot_all_enduses_week(fig_name, results_resid, data, attribute_to_get):
+def plot_fuels_tot_all_enduses_week(fig_name, results_resid, data, attribute_to_get, days_to_plot=range(10, 17)):
     """Plots stacked end_use for a region
 
+    Parameters
+    ----------
+    days_to_plot : list
+        Yeardays to plot. If the results only contain these
+        days (see `chart_pack.slice_days`), all days are plotted
 
     #TODO: For nice plot make that 24 --> shift averaged 30 into middle of bins.
     # INFO Cannot plot a single year?
     """
-
-    # Number of days to plot
-    days_to_plot = range(10, 17)
-
     # Which year in simulation (2015 = 0)
     year_to_plot = 2
 
@@ -187,13 +188,13 @@ def plot_fuels_tot_all_enduses_week(fig_name, results_resid, data, attribute_to_
         for model_year_object in results_resid:
 
             # Read out fueltype specific max h load
-            tot_fuels = getattr(model_year_object, attribute_to_get)
+            tot_fuels = getattr(model_year_object, attribute_to_get)[fueltype]
 
-            data_over_day = []
-            for day, daily_values in enumerate(tot_fuels[fueltype]):
-                if day in days_to_plot:
-                    for hour in daily_values:
-                        data_over_day.append(hour)
+            # Select days if full year is provided
+            if tot_fuels.shape[0] == 365:
+                tot_fuels = tot_fuels[list(days_to_plot)]
+
+            data_over_day = tot_fuels.ravel()
 
         Y_init[fueltype] = data_over_day
 
@@ -260,12 +261,15 @@ def plot_fuels_tot_all_enduses(fig_name, results_resid, data, attribute_to_get):
     plt.ylabel("Fuel")
     plt.xlabel("Simulation years")
     plt.title("Total yearly fuels of all enduses per fueltype")
-    fig_name
+
+    plt.savefig(os.path.join(data['paths']['path_main'], 'model_output', '01-charts', fig_name))
     #plt.show()
 
-def plot_fuels_peak_hour(results_resid, data, attribute_to_get):
+def plot_fuels_peak_hour(results_resid, data, attribute_to_get, fig_name=None):
     """Plots stacked end_use for a region
 
+    If `fig_name` is provided, the figure is saved
+
 
     #TODO: For nice plot make that 24 --> shift averaged 30 into middle of bins.
     # INFO Cannot plot a single year?
@@ -306,6 +310,9 @@ def plot_fuels_peak_hour(results_resid, data, attribute_to_get):
     plt.ylabel("Fuel")
     plt.xlabel("Simulation years")
     plt.title("Fuels for peak hour in a year across all enduses")
+
+    if fig_name:
+        plt.savefig(os.path.join(data['paths']['path_main'], 'model_output', '01-charts', fig_name))
     #plt.show()
 
 def plot_load_profile_dh(array_dh):
@@ -42,19 +42,27 @@ class genericFlatEnduse(object):
     """Class for generic enduses with flat shapes
 
     Generate flat shapes (i.e. same amount of fuel for every hour in a year)
+
+    Parameters
+    ----------
+    enduse_fuel : array
+        Yearly fuel of every fueltype
+    resolution : TemporalResolution
+        Temporal resolution of the fuel of every day
     """
-    def __init__(self, enduse_fuel):
+    def __init__(self, enduse_fuel, resolution):
         self.fuel_new_y = enduse_fuel
+        self.resolution = resolution
 
         shape_peak_dh, shape_non_peak_y_dh, shape_peak_yd_factor, shape_non_peak_yd, _ = generic_flat_shape()
 
         # Convert shape_peak_dh into fuel per day (Multiply average daily fuel demand for flat shape * peak factor)
         max_fuel_d = self.fuel_new_y * shape_peak_yd_factor
 
-        # Yh fuel shape per fueltype (non-peak)
-        self.fuel_yh = np.zeros((self.fuel_new_y.shape[0], 365, 24))
-        for fueltype, fuel in enumerate(self.fuel_new_y): #range(len(enduse_fuel)):
-            self.fuel_yh[fueltype] = (shape_non_peak_yd[:, np.newaxis] * shape_non_peak_y_dh) * fuel
+        # Yd fuel per fueltype and flat load profile (non-peak)
+        self.fuel_load_profile = load_profile.LoadProfile(
+            [], 'generic_flat', shape_non_peak_yd, None, shape_peak_yd_factor, shape_peak_dh, shape_non_peak_y_dh).get_reduced(resolution)
+        self.fuel_yd = self.fuel_new_y[:, np.newaxis] * self.fuel_load_profile.shape_yh_d
 
         # Dh fuel shape per fueltype (peak)  (shape of peak & maximum fuel per fueltype)
         self.fuel_peak_dh = shape_peak_dh * max_fuel_d[:, np.newaxis]
@@ -63,3 +71,4 @@ class genericFlatEnduse(object):
         self.fuel_peak_h = load_profile.calk_peak_h_dh(self.fuel_peak_dh)
 
         self.crit_flat_profile = False
+        self.crit_factorised = True
@@ -1,153 +1,126 @@
 """Load factor calculations
 
-#TODO: DOCUMENTATION
+Load factor = average load / maximum load in given time period
+https://en.wikipedia.org/wiki/Load_factor_(electrical)
 
+All functions work on arrays with arbitrary leading axes, e.g. the
+daily fuel of the peak engine with shape (fueltype, region, 365)
+or the hourly fuel of a region (fueltype, 365, 24). The load factors of
+all entries are calculated at once and returned in %.
 """
 import numpy as np
+from energy_demand.profiles import profile_kernels
 
-def calc_load_factor_h(data, fuels_tot_enduses_h, rs_fuels_peak_h):
-    """Calculate load factor of a h in a year from peak data (peak hour compared to all hours in a year)
+# Yeardays of every season (non leap year)
+SEASONS = {
+    'winter': np.concatenate((np.arange(0, 59), np.arange(334, 365))),
+    'spring': np.arange(59, 151),
+    'summer': np.arange(151, 243),
+    'autumn': np.arange(243, 334)
+    }
+
+def calc_load_factor(average_load, maximum_load):
+    """Calculate load factor
 
     Parameters
-    ------------
-    rs_fuels_peak_h : array
-        Fuels for peak day (fueltype, data)
-    rs_fuels_tot_enduses_d : array
-        Hourly fuel for different fueltypes (fueltype, 24 hours data)
+    ----------
+    average_load : array
+        Average load
+    maximum_load : array
+        Maximum load
 
     Return
     ------
-    load_factor_h : array
-        Array with load factor for every fuel type [in %]
-
-    Note
-    -----
-    Load factor = average load / maximum load in given time period
-    https://en.wikipedia.org/wiki/Load_factor_(electrical)
+    load_factor : array
+        Load factor [in %], zero where the maximum load is zero
     """
-    load_factor_h = np.zeros((data['nr_of_fueltypes']))
-
-    # Iterate fueltypes to calculate load factors for each fueltype
-    for fueltype, fuels in enumerate(fuels_tot_enduses_h):
-
-        # Maximum fuel of an hour of the peak day
-        maximum_h_of_day = rs_fuels_peak_h[fueltype]
-
-        #Calculate average in full year
-        average_demand_h = np.mean(fuels)
-
-        # If there is a maximum day hour
-        if maximum_h_of_day != 0:
-            load_factor_h[fueltype] = average_demand_h / maximum_h_of_day # Calculate load factor
+    load_factor = profile_kernels.safe_divide(
+        average_load, maximum_load, out=np.zeros(np.shape(average_load)))
 
     # Convert load factor to %
-    load_factor_h *= 100
+    load_factor *= 100
 
-    return load_factor_h
+    return load_factor
 
+def calc_lf_h(fuel_yh, peak_h=None):
+    """Calculate load factor of a h in a year
 
-def load_factor_d_non_peak(self, data):
-    """Calculate load factor of a day in a year from non-peak data
-    self.fuels_peak_d     :   Fuels for peak day (fueltype, data)
-    self.rs_fuels_tot_enduses_d    :   Hourly fuel for different fueltypes (fueltype, 24 hours data)
+    Parameters
+    ----------
+    fuel_yh : array
+        Hourly fuel, shape: (..., 365, 24)
+    peak_h : array
+        Fuel of peak hour, shape: (...). If not provided, the
+        maximum hour of `fuel_yh` is used
 
     Return
     ------
-    lf_d : array
-            Array with load factor for every fuel type in %
-
-    Note
-    -----
-    Load factor = average load / maximum load in given time period
-
-    https://en.wikipedia.org/wiki/Load_factor_(electrical)
+    load_factor_h : array
+        Load factor [in %], shape: (...)
     """
-    lf_d = np.zeros((data['nr_of_fueltypes']))
-
-    # Iterate fueltypes to calculate load factors for each fueltype
-    for k, fueldata in enumerate(self.rs_fuels_tot_enduses_d):
-
-        average_demand = sum(fueldata) / 365 # Averae_demand = yearly demand / nr of days
-        max_demand_d = max(fueldata)
+    if peak_h is None:
+        peak_h = np.max(fuel_yh, axis=(-2, -1))
 
-        if  max_demand_d != 0:
-            lf_d[k] = average_demand / max_demand_d # Calculate load factor
+    return calc_load_factor(np.mean(fuel_yh, axis=(-2, -1)), peak_h)
 
-    lf_d = lf_d * 100 # Convert load factor to %
+def calc_lf_d(fuel_yd, peak_d=None):
+    """Calculate load factor of a day in a year
 
-    return lf_d
-
-def load_factor_h_non_peak(self, data):
-    """Calculate load factor of a h in a year from non-peak data
-
-    self.rs_fuels_tot_enduses_d    :   Hourly fuel for different fueltypes (fueltype, 24 hours data)
+    Parameters
+    ----------
+    fuel_yd : array
+        Daily fuel, shape: (..., 365)
+    peak_d : array
+        Fuel of peak day, shape: (...). If not provided, the
+        maximum day of `fuel_yd` is used
 
     Return
     ------
-    load_factor_h : array
-        Array with load factor for every fuel type [in %]
-
-    Note
-    -----
-    Load factor = average load / maximum load in given time period
-
-    https://en.wikipedia.org/wiki/Load_factor_(electrical)
+    load_factor_d : array
+        Load factor [in %], shape: (...)
     """
-    load_factor_h = np.zeros((data['nr_of_fueltypes'], 1)) # Initialise array to store fuel
-
-    # Iterate fueltypes to calculate load factors for each fueltype
-    for fueltype, fueldata in enumerate(self.fuels_tot_enduses_h):
+    if peak_d is None:
+        peak_d = np.max(fuel_yd, axis=-1)
 
-        '''all_hours = []
-        for day_hours in self.fuels_tot_enduses_h[fueltype]:
-                for h in day_hours:
-                    all_hours.append(h)
-        maximum_h_of_day_in_year = max(all_hours)
-        '''
-        maximum_h_of_day_in_year = self.rs_fuels_peak_h[fueltype]
+    return calc_load_factor(np.mean(fuel_yd, axis=-1), peak_d)
 
-        average_demand_h = np.sum(fueldata) / (365 * 24) # Averae load = yearly demand / nr of days
-
-        # If there is a maximum day hour
-        if maximum_h_of_day_in_year != 0:
-            load_factor_h[fueltype] = average_demand_h / maximum_h_of_day_in_year # Calculate load factor
-
-    # Convert load factor to %
-    load_factor_h *= 100
-
-    return load_factor_h
-
-def load_factor_d(self, data):
-    """Calculate load factor of a day in a year from peak values
+def calc_lf_season(fuel_yh, seasons=SEASONS):
+    """Calculate load factor of a h for every season
 
     Parameters
-    -----------
-    data
+    ----------
+    fuel_yh : array
+        Hourly fuel, shape: (..., 365, 24)
+    seasons : dict
+        Yeardays of every season
 
-    Retrn
+    Return
     ------
-    lf_d : array
-            Array with load factor for every fuel type in %
-
-    Note
-    -----
-    - Load factor = average load / maximum load in given time period
-
-    - https://en.wikipedia.org/wiki/Load_factor_(electrical)
+    load_factor_season : dict
+        Load factor [in %] of every season, shape: (...)
     """
-    lf_d = np.zeros((data['nr_of_fueltypes']))
+    load_factor_season = {}
+    for season, yeardays in seasons.items():
+        load_factor_season[season] = calc_lf_h(fuel_yh[..., yeardays, :])
 
-    # Get day with maximum demand (in percentage of year)
-    peak_d_demand = self.fuels_peak_d
+    return load_factor_season
 
-    # Iterate fueltypes to calculate load factors for each fueltype
-    for k, fueldata in enumerate(self.rs_fuels_tot_enduses_d):
-        average_demand = np.sum(fueldata) / 365 # Averae_demand = yearly demand / nr of days
-
-        if average_demand != 0:
-            lf_d[k] = average_demand / peak_d_demand[k] # Calculate load factor
+def calc_load_factor_h(data, fuels_tot_enduses_h, rs_fuels_peak_h):
+    """Calculate load factor of a h in a year from peak data (peak hour compared to all hours in a year)
 
-    lf_d = lf_d * 100 # Convert load factor to %
+    Parameters
+    ------------
+    data : dict
+        Data container
+    fuels_tot_enduses_h : array
+        Hourly fuel for different fueltypes (fueltype, 365, 24)
+    rs_fuels_peak_h : array
+        Fuels for peak hour (fueltype)
 
-    return lf_d
-        
\ No newline at end of file
+    Return
+    ------
+    load_factor_h : array
+        Array with load factor for every fuel type [in %]
+    """
+    return calc_lf_h(
+        fuels_tot_enduses_h[:data['nr_of_fueltypes']], rs_fuels_peak_h)
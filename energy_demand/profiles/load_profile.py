@@ -2,6 +2,7 @@
 """
 import sys
 import numpy as np
+from energy_demand.profiles import profile_kernels
 # pylint: disable=I0011,C0321,C0301,C0103,C0325,no-member
 
 class LoadProfileStock(object):
@@ -39,7 +40,8 @@ class LoadProfileStock(object):
             shape_yd=np.zeros((365)),
             shape_yh=np.zeros((365, 24)),
             enduse_peak_yd_factor=1.0/365,
-            shape_peak_dh=np.full((24), 1.0/24)
+            shape_peak_dh=np.full((24), 1.0/24),
+            shape_y_dh=None
             ):
         """Add load profile to stock
 
@@ -60,6 +62,10 @@ class LoadProfileStock(object):
             Standard value is average daily amount
         shape_peak_dh : array, default=1/24
             Shape (dh), shape of a day for every hour
+        shape_y_dh : array, default=None
+            Shape (dh) of every day. If provided, the yh shape is
+            given by ``shape_yd`` and ``shape_y_dh`` and ``shape_yh``
+            is not used
 
         Note
         -----
@@ -72,7 +78,8 @@ class LoadProfileStock(object):
             shape_yd,
             shape_yh,
             enduse_peak_yd_factor,
-            shape_peak_dh
+            shape_peak_dh,
+            shape_y_dh
             )
 
         # Generate lookup dictionary with triple key
@@ -105,7 +112,30 @@ class LoadProfileStock(object):
                 for technology in technologies:
                     self.dict_with_tuple_keys[(enduse, sector, technology)] = unique_identifier
 
-    def get_load_profile(self, enduse, sector, technology, shape):
+    def get_load_profile_obj(self, enduse, sector, technology, resolution=None):
+        """Get load profile object for a certain technology, enduse and sector
+
+        Parameters
+        ----------
+        enduse : str
+            Enduse
+        sector : str
+            Sector
+        technology : str
+            technology
+        resolution : TemporalResolution or RepresentativeDays
+            Temporal resolution of the shapes (if `None`, hourly)
+
+        Return
+        ------
+        load_profile_obj : LoadProfile
+            Load profile at the resolution
+        """
+        position_in_dict = self.dict_with_tuple_keys[(enduse, sector, technology)]
+
+        return self.load_profile_dict[position_in_dict].get_reduced(resolution)
+
+    def get_load_profile(self, enduse, sector, technology, shape, resolution=None):
         """Get shape for a certain technology, enduse and sector
 
         Parameters
@@ -118,21 +148,21 @@ class LoadProfileStock(object):
             technology
         shape : str
             Type of shape which is to be read out from 'load_profile_dict'
+        resolution : TemporalResolution or RepresentativeDays
+            Temporal resolution of the shapes (if `None`, hourly)
 
         Return
         ------
         Load profile
         """
-        # Get key from lookup dict
-        position_in_dict = self.dict_with_tuple_keys[(enduse, sector, technology)]
-
-        # Get correct object
-        load_profile_obj = self.load_profile_dict[position_in_dict]
+        load_profile_obj = self.get_load_profile_obj(enduse, sector, technology, resolution)
 
         if shape == 'shape_yh':
             return load_profile_obj.shape_yh
         elif shape == 'shape_yd':
             return load_profile_obj.shape_yd
+        elif shape == 'shape_yh_d':
+            return load_profile_obj.shape_yh_d
         elif shape == 'shape_y_dh':
             return load_profile_obj.shape_y_dh
         elif shape == 'enduse_peak_yd_factor':
@@ -143,6 +173,83 @@ class LoadProfileStock(object):
             sys.error("Specific load shape is not found in object")
             return
 
+    def get_load_profile_dh(self, enduse, sector, technology, day_nr, resolution=None):
+        """Get shape within a day for a certain technology, enduse and sector
+
+        Parameters
+        ----------
+        enduse : str
+            Enduse
+        sector : str
+            Sector
+        technology : str
+            technology
+        day_nr : int
+            Day of the resolution
+        resolution : TemporalResolution or RepresentativeDays
+            Temporal resolution of the shapes (if `None`, hourly)
+
+        Return
+        ------
+        shape_dh : array
+            Shape for every hour of the day, shape: (24,)
+        """
+        return self.get_load_profile_obj(
+            enduse, sector, technology, resolution).get_shape_dh(day_nr)
+
+    def get_load_profile_stacked(self, enduse, sector, technologies, shape, resolution=None):
+        """Get shapes of several technologies stacked along a technology axis
+
+        Parameters
+        ----------
+        enduse : str
+            Enduse
+        sector : str
+            Sector
+        technologies : list
+            Technologies (order of technology axis)
+        shape : str
+            Type of shape which is to be read out from 'load_profile_dict'
+        resolution : TemporalResolution or RepresentativeDays
+            Temporal resolution of the shapes (if `None`, hourly)
+
+        Return
+        ------
+        load_profiles : array
+            Shape of every technology, shape: (technology, ...)
+        """
+        return np.array([
+            self.get_load_profile(enduse, sector, technology, shape, resolution) for technology in technologies])
+
+    def get_shared_load_profile(self, enduse, sector, technologies, resolution=None):
+        """Get the load profile which is shared by all technologies
+
+        Parameters
+        ----------
+        enduse : str
+            Enduse
+        sector : str
+            Sector
+        technologies : list
+            Technologies
+        resolution : TemporalResolution or RepresentativeDays
+            Temporal resolution of the shapes (if `None`, hourly)
+
+        Return
+        ------
+        load_profile_obj : LoadProfile
+            Load profile of all technologies at the resolution (`None`
+            if the technologies have different yh shapes)
+        """
+        load_profile_objs = [
+            self.load_profile_dict[self.dict_with_tuple_keys[(enduse, sector, technology)]] for technology in technologies]
+
+        for load_profile_obj in load_profile_objs[1:]:
+            if load_profile_obj is not load_profile_objs[0] and not load_profile_obj.is_same_shape_yh(load_profile_objs[0]):
+                return None
+
+        return load_profile_objs[0].get_reduced(resolution)
+
     def get_shape_peak_dh(self, enduse, sector, technology):
         """Get peak dh shape for a certain technology, enduse and sector
 
@@ -184,8 +291,19 @@ class LoadProfile(object):
         Standard value is average daily amount
     shape_peak_dh : array
         Shape (dh), shape of a day for every hour
+    shape_y_dh : array
+        Shape (dh) of every day (if provided, ``shape_yh`` is not used)
+
+    Note
+    ----
+    - The yh shape is not stored but factorised into the share of every
+      day (``shape_yh_d``) and the shape within the days (``shape_y_dh``).
+      Only the distinct daily shapes (e.g. one for every daytype) are
+      stored with the position of the daily shape of every day.
+    - The days of a load profile reduced to a temporal resolution
+      (`get_reduced`) are the days (or intervals) of the resolution
     """
-    def __init__(self, enduses, unique_identifier, shape_yd, shape_yh, enduse_peak_yd_factor, shape_peak_dh):
+    def __init__(self, enduses, unique_identifier, shape_yd, shape_yh, enduse_peak_yd_factor, shape_peak_dh, shape_y_dh=None):
         """Constructor
         """
 
@@ -193,42 +311,149 @@ class LoadProfile(object):
         self.enduses = enduses
 
         self.shape_yd = shape_yd
-        self.shape_yh = shape_yh
         self.enduse_peak_yd_factor = enduse_peak_yd_factor
 
         # Calculate percentage for every day
-        self.shape_y_dh = self.calc_y_dh_shape_from_yh()
+        if shape_y_dh is None:
+            self.shape_yh_d, shape_y_dh = factorise_shape_yh(shape_yh)
+        else:
+            self.shape_yh_d, shape_y_dh = factorise_shape_yh(shape_y_dh)
+            self.shape_yh_d *= shape_yd
+
+        # Distinct daily shapes and daily shape of every day
+        self.shape_dh_types, day_to_dh_type = np.unique(
+            shape_y_dh, axis=0, return_inverse=True)
+        self.day_to_dh_type = day_to_dh_type.reshape(-1)
 
         self.shape_peak_dh = shape_peak_dh
 
-    def calc_y_dh_shape_from_yh(self):
-        """Calculate shape for every day
+        # Full shapes are only generated (and kept) when read
+        self._shape_y_dh = None
+        self._shape_yh = None
+
+        # Load profiles reduced to temporal resolutions
+        self._reduced = {}
+
+    @property
+    def shape_y_dh(self):
+        """Shape for every day (within each day, the sum is 1)
+        """
+        if self._shape_y_dh is None:
+            self._shape_y_dh = self.shape_dh_types[self.day_to_dh_type]
+            self._shape_y_dh.flags.writeable = False
+
+        return self._shape_y_dh
+
+    @property
+    def shape_yh(self):
+        """Shape yh (from year to hour)
+        """
+        if self._shape_yh is None:
+            self._shape_yh = self.shape_yh_d[:, np.newaxis] * self.shape_y_dh
+            self._shape_yh.flags.writeable = False
+
+        return self._shape_yh
+
+    def get_shape_dh(self, day_nr):
+        """Shape within a day (without generating the shape of every day)
 
-        Returns
-        -------
-        shape_y_dh : array
-            Shape for every day
+        Parameters
+        ----------
+        day_nr : int
+            Day of the year
+
+        Return
+        ------
+        shape_dh : array
+            Shape for every hour of the day, shape: (24,)
+        """
+        return self.shape_dh_types[self.day_to_dh_type[day_nr]]
+
+    def get_reduced(self, resolution):
+        """Load profile with the shapes reduced to a temporal resolution
+
+        Parameters
+        ----------
+        resolution : TemporalResolution or RepresentativeDays
+            Temporal resolution (if `None`, hourly)
+
+        Return
+        ------
+        load_profile_obj : LoadProfile
+            Load profile at the resolution (the load profile
+            itself if the resolution is hourly)
 
         Note
         ----
-        The output gives the shape for every day in a year (total sum == 365)
-        Within each day, the sum is 1
+        The reduced shapes are the mean values of the hours of every
+        cell of the resolution. The reduced load profiles are kept
+        because they are the same for all regions using the resolution
+        """
+        if resolution is None or resolution.shape == (365, 24):
+            return self
+
+        if resolution not in self._reduced:
+            shape_yd = np.broadcast_to(np.reshape(self.shape_yd, (365, 1)), (365, 24))
 
-        A RuntimeWarning may be raised if in one day a zero value is found.
-        The resulting inf are replaced however and thus this warning
-        can be ignored
+            self._reduced[resolution] = LoadProfile(
+                self.enduses,
+                self.unique_identifier,
+                resolution.reduce(shape_yd)[:, 0],
+                resolution.reduce(self.shape_yh),
+                self.enduse_peak_yd_factor,
+                self.shape_peak_dh)
+
+        return self._reduced[resolution]
+
+    def is_same_shape_yh(self, load_profile_obj):
+        """Test if the yh shape is the same as of another load profile
         """
-        # Calculate even if flat shape is assigned
-        sum_every_day_p = 1 / np.sum(self.shape_yh, axis=1)
-        sum_every_day_p[np.isinf(sum_every_day_p)] = 0 # Replace inf by zero
+        return (
+            np.array_equal(self.shape_yh_d, load_profile_obj.shape_yh_d) and
+            np.array_equal(self.day_to_dh_type, load_profile_obj.day_to_dh_type) and
+            np.array_equal(self.shape_dh_types, load_profile_obj.shape_dh_types))
+
+def factorise_shape_yh(shape_yh):
+    """Factorise a yh shape into the share of every day and the shape within every day
+
+    Parameters
+    ----------
+    shape_yh : array
+        Shape yh (from year to hour)
+
+    Returns
+    -------
+    shape_yh_d : array
+        Share of every day, shape: (365,)
+    shape_y_dh : array
+        Shape for every day, shape: (365, 24)
+
+    Note
+    ----
+    The output gives the shape for every day in a year (total sum == 365)
+    Within each day, the sum is 1. Days with a zero sum get a zero shape.
+    """
+    # Calculate even if flat shape is assigned
+    shape_yh_d, shape_y_dh = profile_kernels.factorise(shape_yh, axis=1)
 
-        # Multiply (365,) + with (365, 24)
-        shape_y_dh = sum_every_day_p[:, np.newaxis] * self.shape_yh
+    return shape_yh_d, shape_y_dh
 
-        # Replace nan by zero (faster than np.nan_to_num)
-        shape_y_dh[np.isnan(shape_y_dh)] = 0
+def fuel_yd_to_yh(fuel_yd, shape_y_dh):
+    """Materialise hourly fuel from fuel of every day and shape within every day
 
-        return shape_y_dh
+    Parameters
+    ----------
+    fuel_yd : array
+        Fuel of every day, shape: (..., days)
+    shape_y_dh : array
+        Shape for every day, shape: (days, hours)
+
+    Returns
+    -------
+    fuel_yh : array
+        Fuel of every hour, shape: (..., days, hours)
+    """
+    return fuel_yd[..., np.newaxis] * shape_y_dh
 
 def absolute_to_relative_without_nan(absolute_array):
     """Convert absolute to relative (without correcting the NaN values)
@@ -242,13 +467,13 @@ def absolute_to_relative_without_nan(absolute_array):
     -------
     absolute_array : array
         Array with relative numbers
+
+    Note
+    ----
+    Identical to `absolute_to_relative` (the kernel does not
+    create NaN values which would need to be corrected)
     """
-    try:
-        relative_array = (1 / float(np.sum(absolute_array))) * absolute_array
-        return relative_array
-    except ZeroDivisionError:
-        # If the total sum is zero, return same array
-        return absolute_array
+    return profile_kernels.normalise(absolute_array)
 
 def absolute_to_relative(absolute_array):
     """Convert absolute numbers in an array to relative
@@ -267,13 +492,7 @@ def absolute_to_relative(absolute_array):
     ----
     - If the total sum is zero, return an array with zeros
     """
-    try:
-        relative_array = (1 / float(np.sum(absolute_array))) * absolute_array
-        relative_array[np.isnan(relative_array)] = 0
-    except ZeroDivisionError:
-        relative_array = absolute_array
-
-    return relative_array
+    return profile_kernels.normalise(absolute_array)
 
 def calk_peak_h_dh(fuel_peak_dh):
     """Ger peak hour in peak day
@@ -333,10 +552,8 @@ def get_hybrid_fuel_shapes_y_dh(fuel_shape_boilers_y_dh, fuel_shape_hp_y_dh, tec
     _var = (tech_low_high_p['low'] * fuel_shape_boilers_y_dh) + (tech_low_high_p['high'] * fuel_shape_hp_y_dh)
 
     # Absolute to relative for every row
-    fuel_shapes_hybrid_y_dh = np.apply_along_axis(absolute_to_relative, 1, _var) #absolute_to_relative_without_nan not possible
-    '''plt.plot(fuel_shapes_hybrid_y_dh[1])
-    plt.show()
-    '''
+    fuel_shapes_hybrid_y_dh = profile_kernels.normalise(_var, axis=1, out=_var)
+
     return fuel_shapes_hybrid_y_dh
 
 def calc_fueltype_share_yh_all_h(fueltypes_yh_p_cy):
@@ -346,20 +563,11 @@ def calc_fueltype_share_yh_all_h(fueltypes_yh_p_cy):
     ----------
     fueltypes_yh_p_cy : array
         Fuel share per fueltype for every day and hour (7, 365, 24)
+        or constant for all hours (7, 1, 1)
 
     Returns
     -------
     fueltype_share_yh_all_h : array (7)
-        Sum of fuel share for every hour
+        Average fuel share of all hours
     """
-    average_share_in_a_year = (1.0 / 8760)
-
-    # Sum across rows (share of fuel per hour per fueltype) (7, 24)
-    fueltypes_tech_share_yh_24 = np.sum(fueltypes_yh_p_cy, axis=1)
-
-    # Sum across rows (overall share of fuel per fueltype) (7,)
-    fueltype_share_yh_all_h = np.sum(fueltypes_tech_share_yh_24, axis=1)
-
-    fueltype_share_yh_all_h *= average_share_in_a_year
-
-    return fueltype_share_yh_all_h
+    return np.mean(fueltypes_yh_p_cy, axis=(1, 2))
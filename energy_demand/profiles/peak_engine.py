@@ -0,0 +1,296 @@
+"""Coincident peak calculations
+
+Peaks are searched in the aggregated hourly results of all
+enduses and submodels. As opposed to summing the peaks of individual
+enduses, this gives the coincident peak of every fueltype and region.
+"""
+import sys
+import numpy as np
+
+class PeakEngine(object):
+    """Aggregated fuel of all regions to search coincident peaks
+
+    Parameters
+    ----------
+    region_names : list
+        Region names
+    nr_of_fueltypes : int
+        Number of fueltypes
+    nr_of_top_h : int, default=10
+        Number of hours with most fuel which are kept of every region
+
+    Note
+    ----
+    - The hourly fuel of a region is added as the results of the
+      submodels stream in (`add_fuel_yh`). Only a partial sum of the
+      regions which are not finished is kept
+    - Once all fuel of a region is added, `finish_region` adds the
+      region to the national fuel and keeps the daily fuel, the peak
+      hour, the top hours and the hourly fuel of the peak day of the
+      region, i.e. queries do not need to sum up hours again
+    - Only the national hourly fuel is kept. A region can only be
+      finished once, adding fuel to a finished region is an error
+    - If `region_name` is not provided in the queries, national
+      results (sum across all regions) are returned
+    """
+    def __init__(self, region_names, nr_of_fueltypes, nr_of_top_h=10):
+        """Constructor
+        """
+        self.region_names = list(region_names)
+        self.reg_index = {
+            region_name: reg_nr for reg_nr, region_name in enumerate(self.region_names)}
+        self.nr_of_top_h = nr_of_top_h
+
+        self.partial_fuel_yh = {}
+        self.finished = np.zeros((len(self.region_names)), dtype=bool)
+
+        self.national_fuel_yh = np.zeros((nr_of_fueltypes, 365, 24))
+        self.national_fuel_yd = np.zeros((nr_of_fueltypes, 365))
+
+        self.fuel_yd = np.zeros((nr_of_fueltypes, len(self.region_names), 365))
+        self.peak_h = np.zeros((nr_of_fueltypes, len(self.region_names)))
+        self.peak_yearhour = np.zeros((nr_of_fueltypes, len(self.region_names)), dtype=int)
+        self.peak_dh = np.zeros((nr_of_fueltypes, len(self.region_names), 24))
+        self.top_k_h = np.zeros((nr_of_fueltypes, len(self.region_names), nr_of_top_h))
+        self.top_k_yearhour = np.zeros((nr_of_fueltypes, len(self.region_names), nr_of_top_h), dtype=int)
+
+    def add_fuel_yh(self, region_name, fuel_yh):
+        """Add hourly fuel (e.g. of a submodel) to the partial sum of a region
+
+        Parameters
+        ----------
+        region_name : str
+            Region name
+        fuel_yh : array
+            Fuel of every hour for every fueltype, shape: (fueltype, 365, 24)
+        """
+        if self.finished[self.reg_index[region_name]]:
+            sys.exit("Error: The fuel of region {} is added after the region was finished".format(region_name))
+
+        if region_name not in self.partial_fuel_yh:
+            self.partial_fuel_yh[region_name] = np.zeros(self.national_fuel_yh.shape)
+
+        self.partial_fuel_yh[region_name] += fuel_yh
+
+    def finish_region(self, region_name):
+        """Add the summed fuel of a region to the national fuel and keep its peaks
+
+        Parameters
+        ----------
+        region_name : str
+            Region name
+
+        Returns
+        -------
+        fuel_yh : array
+            Fuel of every hour of the region, shape: (fueltype, 365, 24).
+            The engine does not keep it
+
+        Note
+        ----
+        A region without added fuel is finished with zero fuel
+        """
+        reg_nr = self.reg_index[region_name]
+        if self.finished[reg_nr]:
+            sys.exit("Error: The region {} is finished twice".format(region_name))
+
+        fuel_yh = self.partial_fuel_yh.pop(region_name, None)
+        if fuel_yh is None:
+            fuel_yh = np.zeros(self.national_fuel_yh.shape)
+        fuel_yd = np.sum(fuel_yh, axis=2)
+
+        self.national_fuel_yh += fuel_yh
+        self.national_fuel_yd += fuel_yd
+        self.fuel_yd[:, reg_nr] = fuel_yd
+
+        self.peak_h[:, reg_nr], self.peak_yearhour[:, reg_nr] = get_peak_h(fuel_yh)
+        self.peak_dh[:, reg_nr] = get_peak_dh(fuel_yh, fuel_yd)
+        self.top_k_h[:, reg_nr], self.top_k_yearhour[:, reg_nr] = get_top_k_h(fuel_yh, self.nr_of_top_h)
+        self.finished[reg_nr] = True
+
+        return fuel_yh
+
+    def add_region_fuel_yh(self, region_name, fuel_yh):
+        """Add the hourly fuel of all submodels of a region and finish the region
+
+        Parameters
+        ----------
+        region_name : str
+            Region name
+        fuel_yh : array
+            Fuel of every hour of all submodels for every
+            fueltype, shape: (fueltype, 365, 24)
+        """
+        self.add_fuel_yh(region_name, fuel_yh)
+        self.finish_region(region_name)
+
+    def get_peak_h(self, region_name=None):
+        """Get coincident peak hour of every fueltype
+
+        Parameters
+        ----------
+        region_name : str
+            Region name (if `None`, national peak)
+
+        Returns
+        -------
+        peak_h : array
+            Fuel of peak hour, shape: (fueltype,)
+        peak_yearhour : array
+            Hour of the year (yearday * 24 + hour) of peak, shape: (fueltype,)
+        """
+        if region_name is None:
+            return get_peak_h(self.national_fuel_yh)
+        else:
+            reg_nr = self.reg_index[region_name]
+            return self.peak_h[:, reg_nr], self.peak_yearhour[:, reg_nr]
+
+    def get_regional_peak_h(self):
+        """Get coincident peak hour of every fueltype and region
+
+        Returns
+        -------
+        peak_h : array
+            Fuel of peak hour, shape: (fueltype, region)
+        """
+        return self.peak_h
+
+    def get_peak_d(self, region_name=None):
+        """Get day with maximum fuel of every fueltype
+
+        Parameters
+        ----------
+        region_name : str
+            Region name (if `None`, national peak)
+
+        Returns
+        -------
+        peak_d : array
+            Fuel of peak day, shape: (fueltype,)
+        peak_yearday : array
+            Yearday of peak day, shape: (fueltype,)
+        """
+        if region_name is None:
+            fuel_yd = self.national_fuel_yd
+        else:
+            fuel_yd = self.fuel_yd[:, self.reg_index[region_name]]
+
+        peak_yearday = np.argmax(fuel_yd, axis=1)
+        peak_d = fuel_yd[np.arange(fuel_yd.shape[0]), peak_yearday]
+
+        return peak_d, peak_yearday
+
+    def get_peak_dh(self, region_name=None):
+        """Get hourly fuel of the peak day of every fueltype
+
+        Parameters
+        ----------
+        region_name : str
+            Region name (if `None`, national peak)
+
+        Returns
+        -------
+        peak_dh : array
+            Hourly fuel of peak day, shape: (fueltype, 24)
+        """
+        if region_name is None:
+            return get_peak_dh(self.national_fuel_yh, self.national_fuel_yd)
+        else:
+            return self.peak_dh[:, self.reg_index[region_name]]
+
+    def get_top_k_h(self, k, region_name=None):
+        """Get the `k` hours with most fuel of every fueltype
+
+        Parameters
+        ----------
+        k : int
+            Number of hours (at most `nr_of_top_h` for regions)
+        region_name : str
+            Region name (if `None`, national hours)
+
+        Returns
+        -------
+        top_k_h : array
+            Fuel of the top hours in descending order, shape: (fueltype, k)
+        top_k_yearhour : array
+            Hour of the year of the top hours, shape: (fueltype, k)
+        """
+        if region_name is None:
+            return get_top_k_h(self.national_fuel_yh, k)
+        else:
+            if k > self.nr_of_top_h:
+                sys.exit("Error: Only the top {} hours of every region are kept".format(self.nr_of_top_h))
+
+            reg_nr = self.reg_index[region_name]
+            return self.top_k_h[:, reg_nr, :k], self.top_k_yearhour[:, reg_nr, :k]
+
+def get_peak_h(fuel_yh):
+    """Get peak hour of every fueltype
+
+    Parameters
+    ----------
+    fuel_yh : array
+        Fuel of every hour, shape: (fueltype, 365, 24)
+
+    Returns
+    -------
+    peak_h : array
+        Fuel of peak hour, shape: (fueltype,)
+    peak_yearhour : array
+        Hour of the year (yearday * 24 + hour) of peak, shape: (fueltype,)
+    """
+    fuel_8760 = fuel_yh.reshape(fuel_yh.shape[0], 8760)
+
+    peak_yearhour = np.argmax(fuel_8760, axis=1)
+    peak_h = fuel_8760[np.arange(fuel_8760.shape[0]), peak_yearhour]
+
+    return peak_h, peak_yearhour
+
+def get_peak_dh(fuel_yh, fuel_yd):
+    """Get hourly fuel of the day with most fuel of every fueltype
+
+    Parameters
+    ----------
+    fuel_yh : array
+        Fuel of every hour, shape: (fueltype, 365, 24)
+    fuel_yd : array
+        Fuel of every day, shape: (fueltype, 365)
+
+    Returns
+    -------
+    peak_dh : array
+        Hourly fuel of peak day, shape: (fueltype, 24)
+    """
+    peak_yearday = np.argmax(fuel_yd, axis=1)
+
+    return fuel_yh[np.arange(fuel_yh.shape[0]), peak_yearday]
+
+def get_top_k_h(fuel_yh, k):
+    """Get the `k` hours with most fuel of every fueltype
+
+    Parameters
+    ----------
+    fuel_yh : array
+        Fuel of every hour, shape: (fueltype, 365, 24)
+    k : int
+        Number of hours
+
+    Returns
+    -------
+    top_k_h : array
+        Fuel of the top hours in descending order, shape: (fueltype, k)
+    top_k_yearhour : array
+        Hour of the year of the top hours, shape: (fueltype, k)
+    """
+    fuel_8760 = fuel_yh.reshape(fuel_yh.shape[0], 8760)
+    fueltypes = np.arange(fuel_8760.shape[0])[:, np.newaxis]
+
+    # Select top hours unordered and sort only these
+    top_k_yearhour = np.argpartition(fuel_8760, -k, axis=1)[:, -k:]
+    top_k_h = fuel_8760[fueltypes, top_k_yearhour]
+
+    order = np.argsort(-top_k_h, axis=1)
+    top_k_yearhour = top_k_yearhour[fueltypes, order]
+    top_k_h = top_k_h[fueltypes, order]
+
+    return top_k_h, top_k_yearhour
@@ -0,0 +1,103 @@
+"""Normalisation and reduction kernels of profiles
+
+All profiles (e.g. yh, y_dh or yd shapes) are normalised with these
+functions. They work along any axis, can write into a given output
+array and set the result to zero where the total is zero (or not
+finite) within the division instead of patching NaN values afterwards.
+"""
+import numpy as np
+
+def safe_divide(numerator, denominator, out=None):
+    """Divide arrays, zero where the denominator is zero or not finite
+
+    Parameters
+    ----------
+    numerator : array
+        Numerator
+    denominator : array
+        Denominator (broadcastable to numerator)
+    out : array, default=None
+        Array to write the result to (can be the numerator)
+
+    Returns
+    -------
+    result : array
+        Result of division
+    """
+    denominator = np.asarray(denominator)
+    crit_valid = (denominator != 0) & np.isfinite(denominator)
+
+    if out is None:
+        out = np.zeros(np.broadcast(numerator, denominator).shape)
+        np.divide(numerator, denominator, out=out, where=crit_valid)
+
+        # Return scalars for scalar inputs
+        if out.ndim == 0:
+            return out[()]
+    else:
+        np.divide(numerator, denominator, out=out, where=crit_valid)
+        np.copyto(out, 0, where=~crit_valid)
+
+    return out
+
+def normalise(values, axis=None, out=None):
+    """Convert absolute values to relative values which sum up to one along an axis
+
+    Parameters
+    ----------
+    values : array
+        Absolute values
+    axis : int or tuple, default=None
+        Axis to normalise along (if `None`, the total of all values is one)
+    out : array, default=None
+        Array to write the result to (can be `values`)
+
+    Returns
+    -------
+    relative_values : array
+        Relative values (zero where the total is zero)
+    """
+    total = np.sum(values, axis=axis, keepdims=True)
+
+    return safe_divide(values, total, out)
+
+def factorise(values, axis=-1, out=None):
+    """Factorise values into the total along an axis and the relative values
+
+    Parameters
+    ----------
+    values : array
+        Absolute values (e.g. yh values)
+    axis : int, default=-1
+        Axis to factorise (e.g. hours of a day)
+    out : array, default=None
+        Array to write the relative values to
+
+    Returns
+    -------
+    total : array
+        Total along axis (e.g. value of every day)
+    relative_values : array
+        Relative values along axis (zero where the total is zero)
+    """
+    total = np.sum(values, axis=axis, keepdims=True)
+    relative_values = safe_divide(values, total, out)
+
+    return np.squeeze(total, axis=axis), relative_values
+
+def peak_factor(values, axis=None):
+    """Ratio of the maximum value to the total along an axis
+
+    Parameters
+    ----------
+    values : array
+        Values (e.g. demand of every day)
+    axis : int, default=None
+        Axis to reduce
+
+    Returns
+    -------
+    factor : array
+        Maximum value divided by total (zero where the total is zero)
+    """
+    return safe_divide(np.max(values, axis=axis), np.sum(values, axis=axis))
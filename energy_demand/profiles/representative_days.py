@@ -0,0 +1,226 @@
+"""Representative days of a weather year
+
+The days of a year are clustered into a small number of representative
+days based on the hourly temperatures and the daytype (working day or
+holiday). The representative days are used as the temporal resolution of
+the model run of a weather region: the technologies, load profiles and
+enduses are calculated for the representative days only (..., nr_of_days, 24)
+and full (365, 24) arrays are only rebuilt from the day to representative
+day mapping when summing the fuels (see `EnergyModel.sum_submodels_yh`).
+"""
+import sys
+import numpy as np
+from energy_demand.basic import date_handling
+
+def get_daytypes(list_dates):
+    """Get daytype of every day
+
+    Parameters
+    ----------
+    list_dates : list
+        Dates of every day in a year
+
+    Returns
+    -------
+    daytypes : array
+        Daytype of every day (0: working day, 1: holiday), shape: (365,)
+    """
+    daytypes = [date_handling.get_weekday_type(yearday) == 'holiday' for yearday in list_dates[:365]]
+
+    return np.array(daytypes, dtype=int)
+
+def distribute_nr_of_days(group_sizes, nr_of_days):
+    """Distribute representative days to groups proportionally to group size
+
+    Parameters
+    ----------
+    group_sizes : array
+        Number of days of every group
+    nr_of_days : int
+        Total number of representative days
+
+    Returns
+    -------
+    group_nr_of_days : array
+        Number of representative days of every group
+
+    Note
+    ----
+    Every non-empty group gets at least one day. The remaining
+    days are given to the groups most below their proportional share.
+    """
+    group_sizes = np.asarray(group_sizes)
+    non_empty = group_sizes > 0
+
+    if nr_of_days < np.sum(non_empty) or nr_of_days > np.sum(group_sizes):
+        sys.exit("Error: The number of representative days must be between {} and {}".format(
+            np.sum(non_empty), np.sum(group_sizes)))
+
+    quota = nr_of_days * group_sizes / float(np.sum(group_sizes))
+    group_nr_of_days = np.maximum(np.floor(quota).astype(int), non_empty)
+
+    while np.sum(group_nr_of_days) < nr_of_days:
+        missing = np.where(group_nr_of_days < group_sizes, quota - group_nr_of_days, -np.inf)
+        group_nr_of_days[np.argmax(missing)] += 1
+
+    return group_nr_of_days
+
+def cluster_days(features, nr_of_clusters, iterations=50):
+    """Cluster days with k-means and select the day closest to every centroid
+
+    Parameters
+    ----------
+    features : array
+        Features of every day, shape: (days, features)
+    nr_of_clusters : int
+        Number of clusters
+    iterations : int
+        Maximum number of iterations
+
+    Returns
+    -------
+    rep_days : array
+        Position of representative day of every cluster, shape: (nr_of_clusters,)
+    labels : array
+        Cluster of every day, shape: (days,)
+
+    Note
+    ----
+    The centroids are initialised with days evenly spread across the
+    days sorted by their mean, which makes the clustering deterministic
+    """
+    order = np.argsort(np.mean(features, axis=1), kind='stable')
+    init_days = order[np.linspace(0, len(order) - 1, nr_of_clusters).astype(int)]
+    centroids = features[init_days]
+
+    labels = np.zeros((len(features)), dtype=int)
+    for _ in range(iterations):
+        distances = np.sum((features[:, np.newaxis, :] - centroids[np.newaxis]) ** 2, axis=2)
+        new_labels = np.argmin(distances, axis=1)
+
+        # Keep centroids of empty clusters
+        counts = np.bincount(new_labels, minlength=nr_of_clusters)
+        sums = np.zeros(centroids.shape)
+        np.add.at(sums, new_labels, features)
+        filled = counts > 0
+        centroids[filled] = sums[filled] / counts[filled, np.newaxis]
+
+        if np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+
+    # Medoid: day of cluster closest to centroid
+    distances = np.sum((features[:, np.newaxis, :] - centroids[np.newaxis]) ** 2, axis=2)
+    distances[labels[:, np.newaxis] != np.arange(nr_of_clusters)[np.newaxis]] = np.inf
+    rep_days = np.argmin(distances, axis=0)
+
+    # Remove empty clusters
+    used_clusters = np.unique(labels)
+    rep_days = rep_days[used_clusters]
+    labels = np.searchsorted(used_clusters, labels)
+
+    return rep_days, labels
+
+class RepresentativeDays(object):
+    """Representative days of a weather year
+
+    Parameters
+    ----------
+    temp_yh : array
+        Temperature of every hour, shape: (365, 24)
+    daytypes : array
+        Daytype of every day, shape: (365,)
+    nr_of_days : int
+        Number of representative days
+
+    Note
+    ----
+    - Days are only clustered with days of the same daytype
+    - The representative days are sorted by yearday, i.e. if
+      `nr_of_days` is 365 every day represents itself
+    - The representative days provide the same interface as a
+      `TemporalResolution` (`shape`, `weights`, `hourly`, `reduce`,
+      `expand` and `sum_y`). The value of an hour of a representative
+      day is the mean value of this hour of all represented days
+    """
+    def __init__(self, temp_yh, daytypes, nr_of_days):
+        """Constructor
+        """
+        daytypes = np.asarray(daytypes)
+        group_daytypes = np.unique(daytypes)
+        group_nr_of_days = distribute_nr_of_days(
+            [np.sum(daytypes == daytype) for daytype in group_daytypes], nr_of_days)
+
+        rep_days = []
+        day_to_rep_day = np.zeros((365), dtype=int)
+        for daytype, group_nr in zip(group_daytypes, group_nr_of_days):
+            group_days = np.flatnonzero(daytypes == daytype)
+            group_rep_days, labels = cluster_days(temp_yh[group_days], group_nr)
+
+            day_to_rep_day[group_days] = group_days[group_rep_days][labels]
+            rep_days.extend(group_days[group_rep_days])
+
+        self.rep_days = np.sort(rep_days)
+        self.nr_of_days = len(self.rep_days)
+
+        # Position of the representative day of every day
+        self.day_to_rep = np.searchsorted(self.rep_days, day_to_rep_day)
+
+        # Days sorted by representative day and first day of every representative day
+        self.order_days = np.argsort(self.day_to_rep, kind='stable')
+        self.rep_day_starts = np.searchsorted(
+            self.day_to_rep[self.order_days], np.arange(self.nr_of_days))
+
+        # Shape of arrays and number of hours represented by every hour
+        self.hourly = True
+        self.shape = (self.nr_of_days, 24)
+        self.weights = np.repeat(np.bincount(
+            self.day_to_rep, minlength=self.nr_of_days).astype(float)[:, np.newaxis], 24, axis=1)
+
+    def reduce(self, values_yh):
+        """Reduce values of every day to the representative days
+
+        Parameters
+        ----------
+        values_yh : array
+            Values of every day, shape: (..., 365, 24)
+
+        Returns
+        -------
+        values_rep : array
+            Mean values of the represented days, shape: (..., nr_of_days, 24)
+        """
+        values_sum = np.add.reduceat(
+            np.asarray(values_yh)[..., self.order_days, :], self.rep_day_starts, axis=-2)
+
+        return values_sum / self.weights
+
+    def expand(self, values_rep):
+        """Rebuild values of every day from representative days
+
+        Parameters
+        ----------
+        values_rep : array
+            Values of representative days, shape: (..., nr_of_days, 24)
+
+        Returns
+        -------
+        values_yh : array
+            Values of every day, shape: (..., 365, 24)
+        """
+        return np.asarray(values_rep)[..., self.day_to_rep, :]
+
+    def sum_y(self, values_rep):
+        """Yearly sum of values of representative days
+
+        Parameters
+        ----------
+        values_rep : array
+            Values of representative days, shape: (..., nr_of_days, 24)
+
+        Returns
+        -------
+        values_y : array
+            Sum of all hours of the year, shape: (...)
+        """
+        return np.sum(values_rep * self.weights, axis=(-2, -1))
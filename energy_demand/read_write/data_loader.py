@@ -1,13 +1,15 @@
 """Loads all necessary data
 """
 import os
+import sys
 import csv
 import numpy as np
 from energy_demand.read_write import read_data
 from energy_demand.read_write import read_weather_data
 from energy_demand.read_write import write_data
+from energy_demand.read_write import shape_archive
 from energy_demand.basic import unit_conversions
-from energy_demand.plotting import plotting_results
+from energy_demand.basic import temporal_resolution
 
 def dummy_data_generation(base_data):
     """TODO: REPLACE WITH NEWCASTLE DATA
@@ -120,12 +122,20 @@ def load_paths(path_main, local_data_path):
         'path_main': path_main,
 
         'path_scripts_data': os.path.join(path_main, 'data', 'data_scripts'),
+        'path_time_intervals': os.path.join(path_main, 'time_intervals.yaml'),
         'path_assumptions_db': os.path.join(path_main, 'data', 'data_scripts', 'assumptions_from_db'),
+        'path_validation_elec_cache': os.path.join(path_main, 'data', 'data_scripts', 'validation_elec_demand_2015.npz'),
+        'path_region_hierarchy': os.path.join(path_main, 'data', 'scenario_and_base_data', 'lookup_region_hierarchy.csv'),
+        'path_region_hierarchy_cache': os.path.join(path_main, 'data', 'data_scripts', 'region_hierarchy.npz'),
         
         # Paths to txt shapes
         'path_rs_load_profile_txt': os.path.join(path_main, 'data', 'data_scripts', 'load_profiles', 'rs_submodel'),
         'path_ss_load_profile_txt': os.path.join(path_main, 'data', 'data_scripts', 'load_profiles', 'ss_submodel'),
 
+        # Paths to binary shape archives
+        'path_rs_load_profile_archive': os.path.join(path_main, 'data', 'data_scripts', 'load_profiles', 'rs_submodel_archive'),
+        'path_ss_load_profile_archive': os.path.join(path_main, 'data', 'data_scripts', 'load_profiles', 'ss_submodel_archive'),
+
         # Path for dwelling stock assumptions
         'path_dwtype_lu': os.path.join(path_main, 'data', 'submodel_residential', 'lookup_dwelling_type.csv'),
         'path_hourly_gas_shape_resid': os.path.join(path_main, 'data', 'submodel_residential', 'SANSOM_residential_gas_hourly_shape.csv'),
@@ -136,6 +146,7 @@ def load_paths(path_main, local_data_path):
         # Path for model outputs
         'path_txt_service_tech_by_p': os.path.join(path_main, 'model_output', 'rs_service_tech_by_p.txt'),
         'path_out_stats_cProfile': os.path.join(path_main, 'model_output', 'stats_cProfile.txt'),
+        'path_result_store': os.path.join(path_main, 'model_output', 'result_store'),
 
         # Path to all technologies
         'path_technologies': os.path.join(path_main, 'data', 'scenario_and_base_data', 'technology_base_scenario.csv'),
@@ -206,12 +217,22 @@ def load_data_profiles(data):
     """
     """
     # --------------------
-    # Collect load profiles from txt files (needs to be preprocssed with scripts)
+    # Collect load profiles (needs to be preprocssed with scripts). The
+    # binary shape archives are used if available, otherwise the txt files
     # --------------------
-    print("...read in load shapes from txt files")
-    data = rs_collect_shapes_from_txts(data, data['paths']['path_rs_load_profile_txt'])
-
-    data = ss_collect_shapes_from_txts(data, data['paths']['path_ss_load_profile_txt'])
+    if shape_archive.archive_exists(data['paths']['path_rs_load_profile_archive']):
+        print("...read in load shapes from rs shape archive")
+        data = rs_collect_shapes_from_archive(data, data['paths']['path_rs_load_profile_archive'])
+    else:
+        print("...read in load shapes from rs txt files")
+        data = rs_collect_shapes_from_txts(data, data['paths']['path_rs_load_profile_txt'])
+
+    if shape_archive.archive_exists(data['paths']['path_ss_load_profile_archive']):
+        print("...read in load shapes from ss shape archive")
+        data = ss_collect_shapes_from_archive(data, data['paths']['path_ss_load_profile_archive'])
+    else:
+        print("...read in load shapes from ss txt files")
+        data = ss_collect_shapes_from_txts(data, data['paths']['path_ss_load_profile_txt'])
 
     # -- From Carbon Trust (service sector data) read out enduse specific shapes
     data['ss_all_tech_shapes_dh'], data['ss_all_tech_shapes_yd'] = ss_read_out_shapes_enduse_all_tech(
@@ -219,6 +240,53 @@ def load_data_profiles(data):
 
     return data
 
+def load_temporal_resolution(data):
+    """Load the temporal resolution of the results
+
+    Parameters
+    ----------
+    data : dict
+        Data container (with loaded assumptions)
+
+    Return
+    ------
+    resolution : TemporalResolution
+        Temporal resolution as defined in `sim_param`
+    """
+    if data['sim_param']['representative_days'] and data['sim_param']['temporal_resolution'] != 'hourly':
+        sys.exit("Error: Representative days can only be used with an hourly temporal resolution")
+
+    return temporal_resolution.TemporalResolution(
+        data['sim_param']['temporal_resolution'],
+        data['sim_param']['base_yr'],
+        data['paths']['path_time_intervals'])
+
+def load_region_hierarchy(data):
+    """Load the hierarchy of the modelled regions
+
+    Parameters
+    ----------
+    data : dict
+        Data container (with loaded regions)
+
+    Return
+    ------
+    region_hierarchy : RegionHierarchy or None
+        Region hierarchy (`None` if no lookup file is provided)
+
+    Note
+    ----
+    The region hierarchy (and scipy) is only imported if a lookup file exists
+    """
+    if not os.path.isfile(data['paths']['path_region_hierarchy']):
+        return None
+
+    from energy_demand.geography import region_hierarchy
+    return region_hierarchy.load_region_hierarchy(
+        data['paths']['path_region_hierarchy'],
+        list(data['lu_reg']),
+        data['paths']['path_region_hierarchy_cache'])
+
 def load_data_temperatures(path_scripts_data):
     """Read in cleaned temperature and weather station data
 
@@ -377,6 +445,72 @@ def ss_collect_shapes_from_txts(data, path_to_txts):
 
     return data
 
+def rs_collect_shapes_from_archive(data, path_archive):
+    """Collect residential shapes from the binary shape archive
+
+    Parameters
+    ----------
+    data : dict
+        Data
+    path_archive : str
+        Path to shape archive folder
+
+    Return
+    ------
+    data : dict
+        Data
+    """
+    data['rs_shapes_dh'] = {}
+    data['rs_shapes_yd'] = {}
+
+    shapes = shape_archive.read_shape_archive(path_archive)
+
+    for enduse, shape in shapes.items():
+        data['rs_shapes_dh'][enduse] = {
+            'shape_peak_dh': shape['shape_peak_dh'],
+            'shape_non_peak_y_dh': shape['shape_non_peak_y_dh']}
+        data['rs_shapes_yd'][enduse] = {
+            'shape_peak_yd_factor': shape['shape_peak_yd_factor'],
+            'shape_non_peak_yd': shape['shape_non_peak_yd']}
+
+    return data
+
+def ss_collect_shapes_from_archive(data, path_archive):
+    """Collect service shapes from the binary shape archive
+
+    Parameters
+    ----------
+    data : dict
+        Data
+    path_archive : str
+        Path to shape archive folder (shapes named `sector__enduse`)
+
+    Return
+    ------
+    data : dict
+        Data
+    """
+    data['ss_shapes_dh'] = {}
+    data['ss_shapes_yd'] = {}
+
+    shapes = shape_archive.read_shape_archive(path_archive)
+
+    for joint_string_name, shape in shapes.items():
+        sector, enduse = joint_string_name.split("__")[:2]
+
+        if sector not in data['ss_shapes_dh']:
+            data['ss_shapes_dh'][sector] = {}
+            data['ss_shapes_yd'][sector] = {}
+
+        data['ss_shapes_dh'][sector][enduse] = {
+            'shape_peak_dh': shape['shape_peak_dh'],
+            'shape_non_peak_y_dh': shape['shape_non_peak_y_dh']}
+        data['ss_shapes_yd'][sector][enduse] = {
+            'shape_peak_yd_factor': shape['shape_peak_yd_factor'],
+            'shape_non_peak_yd': shape['shape_non_peak_yd']}
+
+    return data
+
 def create_enduse_dict(data, rs_fuel_raw_data_enduses):
     """Create dictionary with all residential enduses and store in data dict
 
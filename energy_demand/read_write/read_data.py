@@ -6,21 +6,19 @@ import csv
 import numpy as np
 from energy_demand.technologies import technologies_related
 from energy_demand.read_write import read_weather_data
+from energy_demand.read_write import service_archive
 # pylint: disable=I0011,C0321,C0301,C0103, C0325
 
 def load_script_data(data):
     """Load data generated by scripts
     """
     # Read in Services (from script data)
-    data['assumptions']['rs_service_tech_by_p'] = read_service_data_service_tech_by_p(os.path.join(data['paths']['path_scripts_data'], 'services', 'rs_service_tech_by_p.csv'))
-    data['assumptions']['ss_service_tech_by_p'] = read_service_data_service_tech_by_p(os.path.join(data['paths']['path_scripts_data'], 'services', 'ss_service_tech_by_p.csv'))
-    data['assumptions']['is_service_tech_by_p'] = read_service_data_service_tech_by_p(os.path.join(data['paths']['path_scripts_data'], 'services', 'is_service_tech_by_p.csv'))
-    data['assumptions']['rs_service_fueltype_by_p'] = read_service_fueltype_by_p(os.path.join(data['paths']['path_scripts_data'], 'services', 'rs_service_fueltype_by_p.csv'))
-    data['assumptions']['ss_service_fueltype_by_p'] = read_service_fueltype_by_p(os.path.join(data['paths']['path_scripts_data'], 'services', 'ss_service_fueltype_by_p.csv'))
-    data['assumptions']['is_service_fueltype_by_p'] = read_service_fueltype_by_p(os.path.join(data['paths']['path_scripts_data'], 'services', 'is_service_fueltype_by_p.csv'))
-    data['assumptions']['rs_service_fueltype_tech_by_p'] = read_service_fueltype_tech_by_p(os.path.join(data['paths']['path_scripts_data'], 'services', 'rs_service_fueltype_tech_by_p.csv'))
-    data['assumptions']['ss_service_fueltype_tech_by_p'] = read_service_fueltype_tech_by_p(os.path.join(data['paths']['path_scripts_data'], 'services', 'ss_service_fueltype_tech_by_p.csv'))
-    data['assumptions']['is_service_fueltype_tech_by_p'] = read_service_fueltype_tech_by_p(os.path.join(data['paths']['path_scripts_data'], 'services', 'is_service_fueltype_tech_by_p.csv'))
+    for submodel in ('rs', 'ss', 'is'):
+        service_tech_by_p, service_fueltype_tech_by_p, service_fueltype_by_p = read_service_by_p(
+            os.path.join(data['paths']['path_scripts_data'], 'services'), submodel)
+        data['assumptions']['{}_service_tech_by_p'.format(submodel)] = service_tech_by_p
+        data['assumptions']['{}_service_fueltype_by_p'.format(submodel)] = service_fueltype_by_p
+        data['assumptions']['{}_service_fueltype_tech_by_p'.format(submodel)] = service_fueltype_tech_by_p
 
     # Read technologies with more, less and constant service based on service switch assumptions (from script data)
     data['assumptions']['rs_tech_increased_service'] = read_installed_tech(os.path.join(data['paths']['path_scripts_data'], 'rs_tech_increased_service.csv'))
@@ -68,7 +66,7 @@ def load_script_data(data):
 
     return data
 
-def convert_out_format_es(data, model_run_object, sub_modules):
+def convert_out_format_es(data, model_run_object):
     """Adds total hourly fuel data into nested dict
 
     Parameters
@@ -76,7 +74,7 @@ def convert_out_format_es(data, model_run_object, sub_modules):
     data : dict
         Dict with own data
     model_run_object : object
-        Contains objects of the region
+        Model run with the model objects of all regions (`get_regional_yh`)
 
     Returns
     -------
@@ -86,25 +84,25 @@ def convert_out_format_es(data, model_run_object, sub_modules):
     print("...Convert to dict for energy_supply_model")
     control_total_sum = 0
     results = {}
-
-    for fueltype, fueltype_id in data['lu_fueltype'].items():
+    control_sums = {}
+    for fueltype in data['lu_fueltype']:
         results[fueltype] = []
-        control_sum = 0
-        for region_name in data['lu_reg']:
+        control_sums[fueltype] = 0
 
-            hourly_all_fuels = model_run_object.get_fuel_region_all_models_yh(
-                data['nr_of_fueltypes'],
-                region_name,
-                sub_modules,
-                'fuel_yh')
+    # The hourly fuel of every region is summed only once
+    for region_name in data['lu_reg']:
+        hourly_all_fuels = model_run_object.get_regional_yh(
+            data['nr_of_fueltypes'], region_name)
 
+        for fueltype, fueltype_id in data['lu_fueltype'].items():
             for day, day_demand in enumerate(hourly_all_fuels[fueltype_id]):
                 for hour, hour_demand in enumerate(day_demand):
                     result = (region_name, "{}_{}".format(day, hour), float(hour_demand), "units")
                     results[fueltype].append(result)
 
-                    control_sum += hour_demand
+                    control_sums[fueltype] += hour_demand
 
+    for fueltype, control_sum in control_sums.items():
         print("Model output: fueltype {}   {}".format(fueltype, control_sum))
         control_total_sum += control_sum
     print(" ----------")
@@ -603,6 +601,41 @@ def read_sig_param_tech(path_to_csv):
 
     return sig_param_tech
 
+def read_service_by_p(path_services, submodel):
+    """Read base year service shares of a submodel
+
+    Parameters
+    ----------
+    path_services : str
+        Path to services folder
+    submodel : str
+        Submodel prefix ('rs', 'ss' or 'is')
+
+    Returns
+    -------
+    service_tech_by_p : dict
+        Share of total service per technology
+    service_fueltype_tech_by_p : dict
+        Share of service of technologies within a fueltype
+    service_fueltype_by_p : dict
+        Share of total service per fueltype
+
+    Note
+    ----
+    The binary service archive is used if available, otherwise the csv files
+    """
+    path_archive = service_archive.archive_path(path_services, submodel)
+    if os.path.isfile(path_archive):
+        return service_archive.service_to_p(*service_archive.read_service_archive(path_archive))
+
+    return (
+        read_service_data_service_tech_by_p(
+            os.path.join(path_services, '{}_service_tech_by_p.csv'.format(submodel))),
+        read_service_fueltype_tech_by_p(
+            os.path.join(path_services, '{}_service_fueltype_tech_by_p.csv'.format(submodel))),
+        read_service_fueltype_by_p(
+            os.path.join(path_services, '{}_service_fueltype_by_p.csv'.format(submodel))))
+
 def read_service_fueltype_tech_by_p(path_to_csv):
     """Read 
     """
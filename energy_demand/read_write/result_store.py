@@ -0,0 +1,169 @@
+"""Store of aggregated results of every simulated year
+
+Only selected aggregated attributes of a yearly `EnergyModel` run are kept
+so that the model run object (and all its enduse objects) can be released
+after every year. Optionally, the results are spilled to disk and only
+loaded when read.
+"""
+import os
+import numpy as np
+
+# Separator of attribute and key of spilled dict results (cannot be
+# part of an attribute name, so the first occurrence splits the name)
+KEY_SEPARATOR = ':'
+
+class YearResults(object):
+    """Aggregated results of a simulation year
+
+    Parameters
+    ----------
+    curr_yr : int
+        Simulation year
+    results : dict
+        Aggregated results {attribute: value}
+    resolution : str
+        Temporal resolution of the results
+
+    Note
+    ----
+    The results are set as attributes so that they can be read
+    in the same way as from the `EnergyModel` object
+    """
+    def __init__(self, curr_yr, results, resolution='hourly'):
+        """Constructor
+        """
+        self.curr_yr = curr_yr
+        self.resolution = resolution
+
+        for attribute, value in results.items():
+            setattr(self, attribute, value)
+
+class ResultStore(object):
+    """Collection of the aggregated results of all simulated years
+
+    Parameters
+    ----------
+    attributes : list
+        Attributes of the model run object to store
+    path_spill : str
+        Folder to spill results to disk (if `None`, results are kept in memory)
+    resolution : TemporalResolution
+        Temporal resolution to aggregate hourly results (365, 24) to (if
+        `None`, hourly results are stored)
+
+    Note
+    ----
+    Iterating the store returns the `YearResults` of every year in the
+    order the years were added
+    """
+    def __init__(self, attributes, path_spill=None, resolution=None):
+        """Constructor
+        """
+        self.attributes = attributes
+        self.path_spill = path_spill
+        self.resolution = resolution
+
+        if resolution is None or resolution.resolution == 'hourly':
+            self.resolution_name = 'hourly'
+        else:
+            self.resolution_name = resolution.resolution
+        self.years = []
+        self.year_results = {}
+
+        if path_spill and not os.path.exists(path_spill):
+            os.makedirs(path_spill)
+
+    def add_year(self, curr_yr, model_run_object):
+        """Add the aggregated results of a yearly model run
+
+        Parameters
+        ----------
+        curr_yr : int
+            Simulation year
+        model_run_object : object
+            Model run object of simulation year
+        """
+        results = {}
+        for attribute in self.attributes:
+            results[attribute] = self.aggregate(getattr(model_run_object, attribute))
+
+        self.years.append(curr_yr)
+
+        if self.path_spill:
+            self.write_year(curr_yr, results)
+        else:
+            self.year_results[curr_yr] = YearResults(curr_yr, results, self.resolution_name)
+
+    def aggregate(self, value):
+        """Aggregate hourly arrays (or dict of arrays) to the temporal resolution
+        """
+        if self.resolution_name == 'hourly':
+            return value
+        elif isinstance(value, dict):
+            return {key: self.aggregate(key_value) for key, key_value in value.items()}
+        elif np.shape(value)[-2:] == (365, 24):
+            return self.resolution.aggregate(value)
+        else:
+            return value
+
+    def get_year(self, curr_yr):
+        """Get the aggregated results of a year
+
+        Parameters
+        ----------
+        curr_yr : int
+            Simulation year
+
+        Return
+        ------
+        year_results : YearResults
+            Aggregated results
+        """
+        if self.path_spill:
+            return self.read_year(curr_yr)
+        else:
+            return self.year_results[curr_yr]
+
+    def get_path_year(self, curr_yr):
+        """Path of spilled results of a year
+        """
+        return os.path.join(self.path_spill, 'results_{}.npz'.format(curr_yr))
+
+    def write_year(self, curr_yr, results):
+        """Write results of a year to disk
+
+        Note
+        ----
+        Dict results (e.g. per enduse) are stored with
+        the key `attribute:key`
+        """
+        arrays = {}
+        for attribute, value in results.items():
+            if isinstance(value, dict):
+                for key, key_value in value.items():
+                    arrays[attribute + KEY_SEPARATOR + key] = key_value
+            else:
+                arrays[attribute] = value
+
+        np.savez(self.get_path_year(curr_yr), **arrays)
+
+    def read_year(self, curr_yr):
+        """Read results of a year from disk
+        """
+        results = {}
+        with np.load(self.get_path_year(curr_yr)) as arrays:
+            for name in arrays.files:
+                if KEY_SEPARATOR in name:
+                    attribute, key = name.split(KEY_SEPARATOR, 1)
+                    results.setdefault(attribute, {})[key] = arrays[name]
+                else:
+                    results[name] = arrays[name]
+
+        return YearResults(curr_yr, results, self.resolution_name)
+
+    def __iter__(self):
+        for curr_yr in self.years:
+            yield self.get_year(curr_yr)
+
+    def __len__(self):
+        return len(self.years)
@@ -0,0 +1,138 @@
+"""Binary store for the base year energy service of technologies
+
+The base year energy service of a submodel is stored as a dense
+``(enduse, fueltype, technology)`` array in one ``.npz`` file together
+with the enduse and technology labels. The service shares per technology
+and fueltype are derived from this array when read.
+"""
+import os
+import numpy as np
+
+def archive_path(path_services, submodel):
+    """Path to the service archive of a submodel
+
+    Parameters
+    ----------
+    path_services : str
+        Path to services folder
+    submodel : str
+        Submodel prefix ('rs', 'ss' or 'is')
+
+    Returns
+    -------
+    path_archive : str
+        Path to archive file
+    """
+    return os.path.join(path_services, '{}_service_by.npz'.format(submodel))
+
+def write_service_archive(path_archive, enduses, technologies, tech_defined, service):
+    """Write the base year service of a submodel
+
+    Parameters
+    ----------
+    path_archive : str
+        Path to archive file
+    enduses : list
+        Enduses (first axis)
+    technologies : list
+        Technologies (third axis)
+    tech_defined : array
+        Criteria whether a technology is defined within a
+        fueltype of an enduse, shape: (enduse, fueltype, technology)
+    service : array
+        Base year service, shape: (enduse, fueltype, technology)
+    """
+    np.savez(
+        path_archive,
+        enduses=np.array(enduses, dtype=str),
+        technologies=np.array(technologies, dtype=str),
+        tech_defined=tech_defined,
+        service=service)
+
+def read_service_archive(path_archive):
+    """Read the base year service of a submodel
+
+    Parameters
+    ----------
+    path_archive : str
+        Path to archive file
+
+    Returns
+    -------
+    enduses : list
+        Enduses
+    technologies : list
+        Technologies
+    tech_defined : array
+        Criteria whether a technology is defined within a fueltype of an enduse
+    service : array
+        Base year service, shape: (enduse, fueltype, technology)
+    """
+    with np.load(path_archive) as archive:
+        return (
+            archive['enduses'].tolist(),
+            archive['technologies'].tolist(),
+            archive['tech_defined'],
+            archive['service'])
+
+def service_to_p(enduses, technologies, tech_defined, service):
+    """Calculate service shares of technologies and fueltypes
+
+    Parameters
+    ----------
+    enduses : list
+        Enduses
+    technologies : list
+        Technologies
+    tech_defined : array
+        Criteria whether a technology is defined within a fueltype of an enduse
+    service : array
+        Base year service, shape: (enduse, fueltype, technology)
+
+    Returns
+    -------
+    service_tech_by_p : dict
+        Share of total service per technology {enduse: {tech: share}}
+    service_fueltype_tech_by_p : dict
+        Share of service of technologies within a fueltype
+        {enduse: {fueltype: {tech: share}}}
+    service_fueltype_by_p : dict
+        Share of total service per fueltype {enduse: {fueltype: share}}
+
+    Note
+    ----
+    Shares of enduses or fueltypes without service are set to zero
+    """
+    service_fueltype = np.sum(service, axis=2)
+    service_tot = np.sum(service_fueltype, axis=1)
+
+    tech_by_p = np.divide(
+        np.sum(service, axis=1), service_tot[:, np.newaxis],
+        out=np.zeros((service.shape[0], service.shape[2])),
+        where=service_tot[:, np.newaxis] != 0)
+    fueltype_tech_by_p = np.divide(
+        service, service_fueltype[:, :, np.newaxis],
+        out=np.zeros(service.shape),
+        where=service_fueltype[:, :, np.newaxis] != 0)
+    fueltype_by_p = np.divide(
+        service_fueltype, service_tot[:, np.newaxis],
+        out=np.zeros(service_fueltype.shape),
+        where=service_tot[:, np.newaxis] != 0)
+
+    service_tech_by_p = {}
+    service_fueltype_tech_by_p = {}
+    service_fueltype_by_p = {}
+    for enduse_nr, enduse in enumerate(enduses):
+        enduse_techs = np.any(tech_defined[enduse_nr], axis=0)
+        service_tech_by_p[enduse] = {
+            tech: float(tech_by_p[enduse_nr, tech_nr])
+            for tech_nr, tech in enumerate(technologies) if enduse_techs[tech_nr]}
+        service_fueltype_tech_by_p[enduse] = {
+            fueltype: {
+                tech: float(fueltype_tech_by_p[enduse_nr, fueltype, tech_nr])
+                for tech_nr, tech in enumerate(technologies) if tech_defined[enduse_nr, fueltype, tech_nr]}
+            for fueltype in range(service.shape[1])}
+        service_fueltype_by_p[enduse] = {
+            fueltype: float(fueltype_by_p[enduse_nr, fueltype]) for fueltype in range(service.shape[1])}
+
+    return service_tech_by_p, service_fueltype_tech_by_p, service_fueltype_by_p
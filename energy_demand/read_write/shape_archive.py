@@ -0,0 +1,112 @@
+"""Binary store for pre-processed load shapes
+
+All shapes of a submodel are stacked into one ``.npy`` file per shape type
+and indexed by a json manifest. On reading, the arrays are memory-mapped
+so that shapes are only paged in when accessed and the pages can be
+shared between processes reading the same archive.
+"""
+import os
+import json
+import numpy as np
+
+# Shape types and the shape of a single entry
+SHAPE_TYPES = {
+    'shape_peak_dh': (24,),
+    'shape_non_peak_y_dh': (365, 24),
+    'shape_peak_yd_factor': (),
+    'shape_non_peak_yd': (365,)
+    }
+
+MANIFEST_NAME = 'manifest.json'
+
+def archive_exists(path_archive):
+    """Check whether a shape archive is stored in a folder
+
+    Parameters
+    ----------
+    path_archive : str
+        Path to archive folder
+
+    Returns
+    -------
+    exists : bool
+        True if a manifest is found
+    """
+    return os.path.isfile(os.path.join(path_archive, MANIFEST_NAME))
+
+def write_shape_archive(path_archive, shapes):
+    """Write all shapes of a submodel to a binary archive
+
+    Parameters
+    ----------
+    path_archive : str
+        Path to archive folder (is created if it does not exist)
+    shapes : dict
+        Shapes for every shape name (e.g. enduse or `sector__enduse`)
+        {name: {'shape_peak_dh': ..., 'shape_non_peak_y_dh': ...,
+        'shape_peak_yd_factor': ..., 'shape_non_peak_yd': ...}}
+
+    Note
+    ----
+    The manifest is written last so that an interrupted write
+    is not picked up by `archive_exists`
+    """
+    if not os.path.exists(path_archive):
+        os.makedirs(path_archive)
+
+    names = sorted(shapes)
+
+    for shape_type, entry_shape in SHAPE_TYPES.items():
+        stacked_shapes = np.zeros((len(names), ) + entry_shape, dtype=float)
+        for position, name in enumerate(names):
+            stacked_shapes[position] = shapes[name][shape_type]
+
+        np.save(
+            os.path.join(path_archive, shape_type + '.npy'),
+            stacked_shapes)
+
+    manifest = {
+        'names': names,
+        'shape_types': list(SHAPE_TYPES)
+        }
+    with open(os.path.join(path_archive, MANIFEST_NAME), 'w') as outfile:
+        json.dump(manifest, outfile)
+
+    return
+
+def read_shape_archive(path_archive):
+    """Read all shapes of a binary archive
+
+    Parameters
+    ----------
+    path_archive : str
+        Path to archive folder
+
+    Returns
+    -------
+    shapes : dict
+        Shapes for every shape name (see `write_shape_archive`)
+
+    Note
+    ----
+    The arrays are opened copy-on-write (`mmap_mode='c'`). Each shape is
+    a view into the mapped file and modifications are not written back.
+    """
+    with open(os.path.join(path_archive, MANIFEST_NAME), 'r') as infile:
+        manifest = json.load(infile)
+
+    stacked_shapes = {}
+    for shape_type in manifest['shape_types']:
+        stacked_shapes[shape_type] = np.load(
+            os.path.join(path_archive, shape_type + '.npy'), mmap_mode='c')
+
+    shapes = {}
+    for position, name in enumerate(manifest['names']):
+        shapes[name] = {}
+        for shape_type, stacked in stacked_shapes.items():
+            if SHAPE_TYPES[shape_type] == ():
+                shapes[name][shape_type] = float(stacked[position])
+            else:
+                shapes[name][shape_type] = stacked[position]
+
+    return shapes
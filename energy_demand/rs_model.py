@@ -7,17 +7,18 @@ The residential submodule models energy demand
 for the residential sector.
 """
 import energy_demand.enduse as endusefunctions
+from energy_demand.basic import fuel_adjustment
 
 class ResidentialModel(object):
     """Residential Submodel
     """
-    def __init__(self, data, region_object, enduse, sector):
+    def __init__(self, run_context, region_object, enduse, sector):
         """Constructor of ResidentialModel
 
         Parameters
         ----------
-        data : dict
-            Data
+        run_context : RunContext
+            Run context of simulation year
         region_object : dict
             Object of region
         enduse : string
@@ -30,47 +31,54 @@ class ResidentialModel(object):
         self.sector = sector
         self.enduse_object = self.create_enduse(
             region_object,
-            data
+            run_context
             )
 
         #TODO LATER ON: SUMMARY ACROSS AL SECTORS (to save on memory)
         #self.enduse_object_aggregated_across_all_sectors
 
-    def create_enduse(self, region_object, data):
+    def create_enduse(self, region_object, run_context):
         """Create enduse objects and add to list
 
         Parameters
         ----------
         region_object : object
             Region
-        data : dict
-            Data container
+        run_context : RunContext
+            Run context of simulation year
 
         Returns
         -------
         enduse_object : dict
             Object of an enduse
         """
+        submodel_context = run_context.submodels['rs_submodel']
+
         enduse_object = endusefunctions.Enduse(
             region_name=self.region_name,
-            data=data,
+            run_context=run_context,
             enduse=self.enduse,
             sector=self.sector,
             fuel=region_object.rs_enduses_fuel[self.enduse],
             tech_stock=region_object.rs_tech_stock,
-            heating_factor_y=region_object.rs_heating_factor_y,
-            cooling_factor_y=region_object.rs_cooling_factor_y,
-            fuel_switches=data['assumptions']['rs_fuel_switches'],
-            service_switches=data['assumptions']['rs_service_switches'],
-            fuel_tech_p_by=data['assumptions']['rs_fuel_tech_p_by'][self.enduse],
-            tech_increased_service=data['assumptions']['rs_tech_increased_service'],
-            tech_decreased_share=data['assumptions']['rs_tech_decreased_share'],
-            tech_constant_share=data['assumptions']['rs_tech_constant_share'],
-            installed_tech=data['assumptions']['rs_installed_tech'],
-            sig_param_tech=data['assumptions']['rs_sig_param_tech'],
-            enduse_overall_change_ey=data['assumptions']['enduse_overall_change_ey']['rs_model'],
+            fuel_switches=submodel_context.fuel_switches,
+            service_switches=submodel_context.service_switches,
+            fuel_tech_p_by=submodel_context.fuel_tech_p_by[self.enduse],
+            tech_increased_service=submodel_context.tech_increased_service,
+            tech_decreased_share=submodel_context.tech_decreased_share,
+            tech_constant_share=submodel_context.tech_constant_share,
+            installed_tech=submodel_context.installed_tech,
+            sig_param_tech=submodel_context.sig_param_tech,
             regional_profile_stock=region_object.rs_load_profiles,
-            dw_stock=data['rs_dw_stock']
+            fuel_factors=fuel_adjustment.get_fuel_factors(
+                self.enduse,
+                submodel_context.national_fuel_factors,
+                run_context.assumptions,
+                region_object.rs_heating_factor_y,
+                region_object.rs_cooling_factor_y,
+                submodel_context.driver_ratios.get_ratio(
+                    run_context.curr_yr, self.region_name, self.enduse)),
+            switch_plan=submodel_context.switch_plans.get(self.enduse)
             )
 
         return enduse_object
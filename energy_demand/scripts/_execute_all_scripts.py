@@ -1,65 +1,388 @@
 """Function to execute different scripts
+
+Every script is declared as a step with its input and output files.
+A step is only executed if one of its outputs is missing or older than
+its inputs and the content of the inputs changed since the step was last
+run. Steps which do not depend on each other are run in parallel processes.
 """
 import os
+import sys
+import json
+import hashlib
+import importlib
+import importlib.util
+import multiprocessing
+from collections import namedtuple
 
-def run(run_basic_scripts=False, run_scenario_scripts=True):
-    """Run scripts
+Step = namedtuple('Step', ['name', 'module', 'inputs', 'outputs'])
+Step.__doc__ = """Script with its input and output files or folders"""
+
+def list_files(paths):
+    """List all files of files or folders
 
     Parameters
     ----------
-    run_basic_scripts : bool,default=False
-        If `True` all basic scripts are run
-    run_scenario_scripts : bool
-        If `True` all scenario scripts are run
+    paths : list
+        Paths to files or folders
+
+    Returns
+    -------
+    files : list
+        All existing files (files in folders are listed recursively)
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for folder, _, file_names in sorted(os.walk(path)):
+                files.extend(os.path.join(folder, file_name) for file_name in sorted(file_names))
+        elif os.path.isfile(path):
+            files.append(path)
+
+    return files
+
+def hash_files(paths):
+    """Hash the content of files or folders
+
+    Parameters
+    ----------
+    paths : list
+        Paths to files or folders
+
+    Returns
+    -------
+    hash_value : str
+        Hash of the content (and relative position) of all files
+    """
+    hash_value = hashlib.sha1()
+    for path in list_files(paths):
+        hash_value.update(os.path.basename(path).encode('utf-8'))
+        with open(path, 'rb') as file_to_hash:
+            for block in iter(lambda: file_to_hash.read(1 << 20), b''):
+                hash_value.update(block)
+
+    return hash_value.hexdigest()
+
+def get_step_inputs(step):
+    """Get inputs of a step including the source file of the script
+    """
+    module_spec = importlib.util.find_spec(step.module)
+
+    return list(step.inputs) + [module_spec.origin]
+
+def is_up_to_date(step, recorded_hashes):
+    """Check whether the outputs of a step are up to date
+
+    Parameters
+    ----------
+    step : Step
+        Step
+    recorded_hashes : dict
+        Hash of the inputs of every step when it was last run
+
+    Returns
+    -------
+    up_to_date : bool
+        Criteria whether the step can be skipped
 
     Note
     ----
-    If `run_basic_scripts` is true, all scripts are executed
-    which only need to be executed once, independently of the scenario.
-    E.g. load profiles are loaded from raw files
+    The outputs are up to date if all outputs exist and either
+    the oldest output is newer than the newest input or the
+    content of the inputs did not change since the last run
+    """
+    if not all(os.path.exists(path) for path in step.outputs):
+        return False
 
-    `run_scenario_scripts` needs to be run everytime scenario
-    assumptiosn are changed
+    output_files = list_files(step.outputs)
+    if not output_files:
+        return False
+
+    inputs = get_step_inputs(step)
+    input_files = list_files(inputs)
+
+    if input_files:
+        newest_input = max(os.path.getmtime(path) for path in input_files)
+        oldest_output = min(os.path.getmtime(path) for path in output_files)
+        if oldest_output >= newest_input:
+            return True
+
+    return recorded_hashes.get(step.name) == hash_files(inputs)
+
+def get_step_levels(steps):
+    """Group steps into levels of steps which do not depend on each other
+
+    Parameters
+    ----------
+    steps : list
+        Steps in execution order
+
+    Returns
+    -------
+    levels : list
+        Steps of every level. The steps of a level
+        only depend on steps of previous levels
+
+    Note
+    ----
+    A step depends on an earlier step if one of its
+    inputs is (or lies within) an output of the earlier step
     """
-    path_main = os.path.join(os.path.dirname(os.path.abspath(__file__))[:-21])
-    local_data_path = r'Y:\01-Data_NISMOD\data_energy_demand'
+    def depends_on(step, other_step):
+        for path_input in step.inputs:
+            for path_output in other_step.outputs:
+                if path_input == path_output or path_input.startswith(path_output + os.sep):
+                    return True
+        return False
 
-    # Assumptions are written out to csv files
-    from energy_demand.assumptions import assumptions
-    assumptions.run()
+    step_levels = {}
+    for step_nr, step in enumerate(steps):
+        step_levels[step.name] = 1 + max(
+            [step_levels[other_step.name] for other_step in steps[:step_nr] if depends_on(step, other_step)] + [-1])
+
+    levels = [[] for _ in range(max(step_levels.values()) + 1)] if steps else []
+    for step in steps:
+        levels[step_levels[step.name]].append(step)
+
+    return levels
+
+def run_script(module, path_main, local_data_path):
+    """Run the `run` function of a script
+
+    Parameters
+    ----------
+    module : str
+        Module of script
+    path_main : str
+        Main path
+    local_data_path : str
+        Local data path
+    """
+    importlib.import_module(module).run(path_main, local_data_path)
+
+def record_step(step, recorded_hashes, path_hashes):
+    """Record the input hashes of a step which was run
+
+    Parameters
+    ----------
+    step : Step
+        Step
+    recorded_hashes : dict
+        Hash of the inputs of every step when it was last run
+    path_hashes : str
+        Path to file with the recorded input hashes of every step
+    """
+    recorded_hashes[step.name] = hash_files(get_step_inputs(step))
+
+    with open(path_hashes, 'w') as hash_file:
+        json.dump(recorded_hashes, hash_file, indent=4, sort_keys=True)
+
+def run_steps(steps, path_main, local_data_path, path_hashes, force=False, parallel=True):
+    """Run all steps which are not up to date
+
+    Parameters
+    ----------
+    steps : list
+        Steps in execution order
+    path_main : str
+        Main path
+    local_data_path : str
+        Local data path
+    path_hashes : str
+        Path to file with the recorded input hashes of every step
+    force : bool, default=False
+        If `True`, all steps are run
+    parallel : bool, default=True
+        If `True`, independent steps are run in parallel processes
+
+    Returns
+    -------
+    steps_run : list
+        Names of steps which were run
+    """
+    if os.path.isfile(path_hashes):
+        with open(path_hashes, 'r') as hash_file:
+            recorded_hashes = json.load(hash_file)
+    else:
+        recorded_hashes = {}
+
+    steps_run = []
+    for level in get_step_levels(steps):
+        steps_to_run = []
+        for step in level:
+            if not force and is_up_to_date(step, recorded_hashes):
+                print("... skip script {} (up to date)".format(step.name))
+            else:
+                steps_to_run.append(step)
+
+        if parallel and len(steps_to_run) > 1:
+            # Processes are not daemonic as scripts can use worker processes
+            processes = [
+                multiprocessing.Process(
+                    target=run_script, args=(step.module, path_main, local_data_path), name=step.name)
+                for step in steps_to_run]
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join()
+
+            # Record successful steps before exiting so that they are not run again
+            for step, process in zip(steps_to_run, processes):
+                if process.exitcode == 0:
+                    record_step(step, recorded_hashes, path_hashes)
+                    steps_run.append(step.name)
+
+            steps_failed = [process.name for process in processes if process.exitcode != 0]
+            if steps_failed:
+                sys.exit("Error: Script {} failed".format(", ".join(steps_failed)))
+        else:
+            for step in steps_to_run:
+                run_script(step.module, path_main, local_data_path)
+                record_step(step, recorded_hashes, path_hashes)
+                steps_run.append(step.name)
+
+    return steps_run
+
+def get_steps(path_main, local_data_path, run_basic_scripts, run_scenario_scripts):
+    """Declare the inputs and outputs of every script
+
+    Parameters
+    ----------
+    path_main : str
+        Main path
+    local_data_path : str
+        Local data path
+    run_basic_scripts : bool
+        If `True` basic scripts are added
+    run_scenario_scripts : bool
+        If `True` scenario scripts are added
+
+    Returns
+    -------
+    steps : list
+        Steps in execution order
+    """
+    from energy_demand.read_write import data_loader
+    paths = data_loader.load_paths(path_main, local_data_path)['paths']
+
+    path_scripts_data = paths['path_scripts_data']
+    path_weather_data = os.path.join(path_scripts_data, 'weather_data')
+    path_services = os.path.join(path_scripts_data, 'services')
+    path_disaggregated = os.path.join(path_scripts_data, 'disaggregated')
+
+    # Inputs used by all scenario scripts
+    fuel_inputs = [
+        paths['path_rs_fuel_raw_data_enduses'],
+        paths['path_ss_fuel_raw_data_enduses'],
+        paths['path_is_fuel_raw_data_enduses']]
+    assumption_inputs = [
+        os.path.join(path_main, 'energy_demand', 'assumptions'),
+        paths['path_technologies'],
+        paths['rs_path_fuel_switches'],
+        paths['ss_path_fuel_switches'],
+        paths['is_path_fuel_switches'],
+        paths['rs_path_service_switch'],
+        paths['ss_path_service_switch'],
+        paths['is_path_industry_switch']]
+
+    services = [
+        os.path.join(path_services, '{}_{}.csv'.format(submodel, name))
+        for submodel in ('rs', 'ss', 'is')
+        for name in ('service_tech_by_p', 'service_fueltype_tech_by_p', 'service_fueltype_by_p')] + [
+            os.path.join(path_services, '{}_service_by.npz'.format(submodel)) for submodel in ('rs', 'ss', 'is')]
+
+    steps = []
 
     # Scripts which need to be run for generating raw data
     if run_basic_scripts:
+        steps += [
 
-        # Read in temperature data from raw files
-        import s_raw_weather_data
-        s_raw_weather_data.run(path_main, local_data_path)
+            # Read in temperature data from raw files
+            Step(
+                'raw_weather_data', 'energy_demand.scripts.s_raw_weather_data',
+                [paths['folder_path_weater_data'], paths['folder_path_weater_stations']],
+                [os.path.join(path_weather_data, 'weather_stations.csv'),
+                 os.path.join(path_weather_data, 'weather_data.csv')]),
 
-        # Read in residenital submodel shapes
-        import s_rs_raw_shapes
-        s_rs_raw_shapes.run(path_main, local_data_path)
+            # Read in residenital submodel shapes
+            Step(
+                'rs_raw_shapes', 'energy_demand.scripts.s_rs_raw_shapes',
+                [paths['path_bd_e_load_profiles'], paths['path_rs_fuel_raw_data_enduses']],
+                [paths['path_rs_load_profile_archive']]),
 
-        # Read in service submodel shapes
-        import s_ss_raw_shapes
-        s_ss_raw_shapes.run(path_main, local_data_path)
+            # Read in service submodel shapes
+            Step(
+                'ss_raw_shapes', 'energy_demand.scripts.s_ss_raw_shapes',
+                [paths['folder_raw_carbon_trust'], paths['path_ss_fuel_raw_data_enduses']],
+                [paths['path_ss_load_profile_archive']])]
 
     # Scripts which need to be run for every different scenario
     if run_scenario_scripts:
+        steps += [
+            Step(
+                'change_temp', 'energy_demand.scripts.s_change_temp',
+                [os.path.join(path_weather_data, 'weather_data.csv')] + fuel_inputs + assumption_inputs,
+                [os.path.join(path_weather_data, 'weather_data_changed_climate.csv')]),
+            Step(
+                'fuel_to_service', 'energy_demand.scripts.s_fuel_to_service',
+                fuel_inputs + assumption_inputs,
+                services),
+            Step(
+                'generate_sigmoid', 'energy_demand.scripts.s_generate_sigmoid',
+                services + fuel_inputs + assumption_inputs,
+                [os.path.join(path_scripts_data, '{}_{}.csv'.format(submodel, name))
+                 for submodel in ('rs', 'ss', 'is')
+                 for name in (
+                     'installed_tech', 'sig_param_tech', 'tech_increased_service',
+                     'tech_decreased_share', 'tech_constant_share')]),
+            Step(
+                'disaggregation', 'energy_demand.scripts.s_disaggregation',
+                [os.path.join(path_weather_data, 'weather_stations.csv'),
+                 os.path.join(path_weather_data, 'weather_data.csv')] + fuel_inputs + assumption_inputs,
+                [os.path.join(path_disaggregated, '{}_fueldata_disagg.csv'.format(submodel))
+                 for submodel in ('rs', 'ss', 'is', 'ts')])]
+
+    return steps
+
+def run(run_basic_scripts=False, run_scenario_scripts=True, force=False, parallel=True):
+    """Run scripts
+
+    Parameters
+    ----------
+    run_basic_scripts : bool,default=False
+        If `True` all basic scripts are run
+    run_scenario_scripts : bool
+        If `True` all scenario scripts are run
+    force : bool, default=False
+        If `True` scripts are run even if their outputs are up to date
+    parallel : bool, default=True
+        If `True` independent scripts are run in parallel processes
 
-        import s_change_temp
-        s_change_temp.run(path_main, local_data_path)
+    Note
+    ----
+    If `run_basic_scripts` is true, all scripts are executed
+    which only need to be executed once, independently of the scenario.
+    E.g. load profiles are loaded from raw files
 
-        import s_fuel_to_service
-        s_fuel_to_service.run(path_main, local_data_path)
+    `run_scenario_scripts` needs to be run everytime scenario
+    assumptiosn are changed. Only the scripts whose inputs changed
+    are executed.
+    """
+    path_main = os.path.join(os.path.dirname(os.path.abspath(__file__))[:-21])
+    local_data_path = r'Y:\01-Data_NISMOD\data_energy_demand'
 
-        import s_generate_sigmoid
-        s_generate_sigmoid.run(path_main, local_data_path)
+    steps = get_steps(path_main, local_data_path, run_basic_scripts, run_scenario_scripts)
 
-        import s_disaggregation
-        s_disaggregation.run(path_main, local_data_path)
+    run_steps(
+        steps,
+        path_main,
+        local_data_path,
+        os.path.join(path_main, 'data', 'data_scripts', 'script_input_hashes.json'),
+        force=force,
+        parallel=parallel)
 
     print("...  finished running all scripts")
     return
 
-# Execute script
-run(run_basic_scripts=False, run_scenario_scripts=True)
+# Execute script (guarded as the service shape script uses worker processes)
+if __name__ == '__main__':
+    run(run_basic_scripts=False, run_scenario_scripts=True)
@@ -4,6 +4,7 @@ import os
 import numpy as np
 from energy_demand.assumptions import assumptions
 from energy_demand.read_write import data_loader
+from energy_demand.read_write import service_archive
 from energy_demand.technologies import technologies_related
 
 def write_service_fueltype_by_p(path_to_txt, data):
@@ -85,113 +86,144 @@ def write_service_tech_by_p(path_to_txt, data):
 
     return
 
-def init_nested_dict_brackets(first_level_keys, second_level_keys):
-    """Initialise a nested dictionary with two levels
-
-    Parameters
-    ----------
-    first_level_keys : list
-        First level data
-    second_level_keys : list
-        Data to add in nested dict
-
-    Returns
-    -------
-    nested_dict : dict
-        Nested 2 level dictionary
+def ss_sum_fuel_enduse_sectors(ss_fuel_raw_data_enduses, ss_enduses, nr_fueltypes):
+    """Aggregated fuel for all sectors according to enduse
     """
-    nested_dict = {}
+    aggregated_fuel_enduse = {}
 
-    for first_level_key in first_level_keys:
-        nested_dict[first_level_key] = {}
-        for second_level_key in second_level_keys:
-            nested_dict[first_level_key][second_level_key] = {}
+    for enduse in ss_enduses:
+        aggregated_fuel_enduse[str(enduse)] = np.zeros((nr_fueltypes))
 
-    return nested_dict
+    # Iterate and sum fuel per enduse
+    for _, fuels_sector in ss_fuel_raw_data_enduses.items():
+        for enduse, fuels_enduse in fuels_sector.items():
+            aggregated_fuel_enduse[enduse] += fuels_enduse
 
-def init_nested_dict_zero(first_level_keys, second_level_keys):
-    """Initialise a nested dictionary with two levels
+    return aggregated_fuel_enduse
+
+def compile_fuel_tech_p_by(fuel_p_tech_by, enduses, nr_fueltypes):
+    """Compile fuel shares of technologies into an array
 
     Parameters
     ----------
-    first_level_keys : list
-        First level data
-    second_level_keys : list
-        Data to add in nested dict
+    fuel_p_tech_by : dict
+        Assumed fraction of fuel for each technology within
+        a fueltype {enduse: {fueltype: {tech: share}}}
+    enduses : list
+        Enduses
+    nr_fueltypes : int
+        Number of fueltypes
 
     Returns
     -------
-    nested_dict : dict
-        Nested 2 level dictionary
+    technologies : list
+        All technologies of the enduses (sorted)
+    fuel_tech_share : array
+        Fuel share of technologies, shape: (enduse, fueltype, technology)
+    tech_defined : array
+        Criteria whether a technology is defined within a fueltype of an enduse
     """
-    nested_dict = {}
+    technologies = sorted(set(
+        tech for enduse in enduses for tech_shares in fuel_p_tech_by[enduse].values() for tech in tech_shares))
+    tech_index = {tech: tech_nr for tech_nr, tech in enumerate(technologies)}
 
-    for first_level_key in first_level_keys:
-        nested_dict[first_level_key] = {}
-        for second_level_key in second_level_keys:
-            nested_dict[first_level_key][second_level_key] = 0
+    fuel_tech_share = np.zeros((len(enduses), nr_fueltypes, len(technologies)))
+    tech_defined = np.zeros((len(enduses), nr_fueltypes, len(technologies)), dtype=bool)
+    for enduse_nr, enduse in enumerate(enduses):
+        for fueltype, tech_shares in fuel_p_tech_by[enduse].items():
+            for tech, share in tech_shares.items():
+                fuel_tech_share[enduse_nr, fueltype, tech_index[tech]] = share
+                tech_defined[enduse_nr, fueltype, tech_index[tech]] = True
 
-    return nested_dict
+    return technologies, fuel_tech_share, tech_defined
 
-def init_dict_brackets(first_level_keys):
-    """Initialise a  dictionary with one level
+def get_tech_eff_by(technologies, technology_list, hybrid_technologies, tech_stock):
+    """Get national base year efficiency of technologies
 
     Parameters
     ----------
-    first_level_keys : list
-        First level data
+    technologies : list
+        Technologies
+    technology_list : dict
+        Technologies of each technology type
+    hybrid_technologies : dict
+        Hybrid technologies
+    tech_stock : dict
+        Technology assumptions
 
     Returns
     -------
-    one_level_dict : dict
-         dictionary
-    """
-    one_level_dict = {}
+    eff_by : array
+        Efficiency of technologies, shape: (technology,)
 
-    for first_key in first_level_keys:
-        one_level_dict[first_key] = {}
-
-    return one_level_dict
-
-def sum_2_level_dict(two_level_dict):
-    """Sum all entries in a two level dict
+    Note
+    ----
+    A constant efficiency (temperature difference of 10 degrees
+    for heat pumps) is assumed for the full year
+    """
+    eff_by = np.zeros((len(technologies)))
+    for tech_nr, tech in enumerate(technologies):
+        tech_type = technologies_related.get_tech_type(tech, technology_list)
+
+        # Get efficiency depending whether hybrid or regular technology or heat pumps for base year
+        if tech_type == 'hybrid_tech':
+            eff_by[tech_nr] = hybrid_technologies[tech]['average_efficiency_national_by']
+        elif tech_type == 'heat_pump':
+            eff_by[tech_nr] = technologies_related.eff_heat_pump(
+                temp_diff=10,
+                efficiency_intersect=tech_stock[tech]['eff_by']
+                )
+        elif tech_type == 'dummy_tech':
+            eff_by[tech_nr] = 1
+        else:
+            eff_by[tech_nr] = tech_stock[tech]['eff_by']
+
+    return eff_by
+
+def calc_service_by(technology_list, hybrid_technologies, nr_fueltypes, fuel_p_tech_by, fuels, tech_stock):
+    """Convert base year fuel of every enduse, fueltype and technology to energy service
 
     Parameters
     ----------
-    two_level_dict : dict
-        Nested dict
+    technology_list : dict
+        Technologies of each technology type
+    hybrid_technologies : dict
+        Hybrid technologies
+    nr_fueltypes : int
+        Number of fueltypes
+    fuel_p_tech_by : dict
+        Assumed fraction of fuel for each technology within a fueltype
+    fuels : dict
+        Base year fuel demand of every enduse
+    tech_stock : dict
+        Technology assumptions
 
     Returns
     -------
-    tot_sum : float
-        Number of all entries in nested dict
+    enduses : list
+        Enduses
+    technologies : list
+        Technologies
+    tech_defined : array
+        Criteria whether a technology is defined within a fueltype of an enduse
+    service : array
+        Base year service, shape: (enduse, fueltype, technology)
+
+    Note
+    ----
+    Energy service = fuel of technology * efficiency
     """
-    '''tot_sum = 0
-    for i in two_level_dict:
-        for j in two_level_dict[i]:
-            tot_sum += two_level_dict[i][j]
-    '''
-    tot_sum = 0
-    for _, j in two_level_dict.items():
-        tot_sum += sum(j.values())
+    enduses = list(fuels)
+    technologies, fuel_tech_share, tech_defined = compile_fuel_tech_p_by(
+        fuel_p_tech_by, enduses, nr_fueltypes)
 
-    return tot_sum
-
-
-def ss_sum_fuel_enduse_sectors(ss_fuel_raw_data_enduses, ss_enduses, nr_fueltypes):
-    """Aggregated fuel for all sectors according to enduse
-    """
-    aggregated_fuel_enduse = {}
+    eff_by = get_tech_eff_by(technologies, technology_list, hybrid_technologies, tech_stock)
 
-    for enduse in ss_enduses:
-        aggregated_fuel_enduse[str(enduse)] = np.zeros((nr_fueltypes))
+    fuel = np.array([fuels[enduse] for enduse in enduses], dtype=float).reshape(len(enduses), nr_fueltypes)
 
-    # Iterate and sum fuel per enduse
-    for _, fuels_sector in ss_fuel_raw_data_enduses.items():
-        for enduse, fuels_enduse in fuels_sector.items():
-            aggregated_fuel_enduse[enduse] += fuels_enduse
+    service = np.einsum('eft,ef,t->eft', fuel_tech_share, fuel, eff_by)
 
-    return aggregated_fuel_enduse
+    return enduses, technologies, tech_defined, service
 
 def get_service_fueltype_tech(technology_list, hybrid_technologies, lu_fueltypes, fuel_p_tech_by, fuels, tech_stock):
     """Calculate total energy service percentage of each technology
@@ -236,88 +268,9 @@ def get_service_fueltype_tech(technology_list, hybrid_technologies, lu_fueltypes
     Because regional efficiencies may differ within regions, the fuel distribution within
     the fueltypes may also differ
     """
-    # Energy service per technology for base year
-    service = init_nested_dict_brackets(fuels, lu_fueltypes.values())
-
-     # Percentage of total energy service per technology for base year
-    service_tech_by_p = init_dict_brackets(fuels)
-
-    # Percentage of service per technologies within the fueltypes
-    service_fueltype_tech_by_p = init_nested_dict_brackets(fuels, lu_fueltypes.values())
-
-    # Percentage of service per fueltype
-    service_fueltype_by_p = init_nested_dict_zero(service_tech_by_p.keys(), range(len(lu_fueltypes)))
-
-    for enduse, fuel in fuels.items():
-        for fueltype, fuel_fueltype in enumerate(fuel):
-            tot_service_fueltype = 0
-
-            for tech in fuel_p_tech_by[enduse][fueltype]:
-                service[enduse][fueltype][tech] = 0
-
-            # Iterate technologies to calculate share of energy service depending on fuel and efficiencies
-            for tech, fuel_alltech_by in fuel_p_tech_by[enduse][fueltype].items():
-
-                # Fuel share based on defined fuel shares within fueltype (share of fuel * total fuel)
-                fuel_tech = fuel_alltech_by * fuel_fueltype
-                #print("------------Tech: {}  {} ".format(fuel_alltech_by, fuel_fueltype))
-
-                # Get technology type
-                tech_type = technologies_related.get_tech_type(tech, technology_list)
-
-                # Get efficiency depending whether hybrid or regular technology or heat pumps for base year
-                if tech_type == 'hybrid_tech':
-                    eff_tech = hybrid_technologies[tech]['average_efficiency_national_by']
-                elif tech_type == 'heat_pump':
-                    eff_tech = technologies_related.eff_heat_pump(
-                        temp_diff=10,
-                        efficiency_intersect=tech_stock[tech]['eff_by']
-                        )
-                elif tech_type == 'dummy_tech':
-                    eff_tech = 1
-                else:
-                    eff_tech = tech_stock[tech]['eff_by']
-
-                # Energy service of end use: Service == Fuel of technoloy * efficiency
-                service_fueltype_tech = fuel_tech * eff_tech
-                print("SERVICE NATIONA LCALCUATION: {} {} {}  {}  {}".format(enduse, tech, fuel_tech, eff_tech, service_fueltype_tech))
-
-                # Add energy service demand
-                service[enduse][fueltype][tech] += service_fueltype_tech
-
-                # Total energy service demand within a fueltype
-                tot_service_fueltype += service_fueltype_tech
-
-            # Calculate percentage of service enduse within fueltype
-            for tech in fuel_p_tech_by[enduse][fueltype]:
-                if tot_service_fueltype == 0: # No fuel in this fueltype
-                    service_fueltype_tech_by_p[enduse][fueltype][tech] = 0
-                    service_fueltype_by_p[enduse][fueltype] += 0
-                else:
-                    service_fueltype_tech_by_p[enduse][fueltype][tech] = (1 / tot_service_fueltype) * service[enduse][fueltype][tech]
-                    service_fueltype_by_p[enduse][fueltype] += service[enduse][fueltype][tech]
-
-        # Calculate percentage of service of all technologies
-        total_service = sum_2_level_dict(service[enduse])
-
-        # Percentage of energy service per technology
-        for fueltype, technology_service_enduse in service[enduse].items():
-            for technology, service_tech in technology_service_enduse.items():
-                service_tech_by_p[enduse][technology] = (1 / total_service) * service_tech
-                #print("Technology_enduse: " + str(technology) + str("  ") + str(service_tech))
-
-        print("Total Service base year for enduse {}  :  {}".format(enduse, total_service))
-
-        # Convert service per enduse
-        for fueltype in service_fueltype_by_p[enduse]:
-            service_fueltype_by_p[enduse][fueltype] = (1.0 / total_service) * service_fueltype_by_p[enduse][fueltype]
-
-    '''# Assert does not work for endues with no defined technologies
-    # --------
-    # Test if the energy service for all technologies is 100%
-    # Test if within fueltype always 100 energy service
-    '''
-    return service_tech_by_p, service_fueltype_tech_by_p, service_fueltype_by_p
+    return service_archive.service_to_p(
+        *calc_service_by(
+            technology_list, hybrid_technologies, len(lu_fueltypes), fuel_p_tech_by, fuels, tech_stock))
 
 def run(path_main, local_data_path):
     """Function to run script
@@ -331,72 +284,48 @@ def run(path_main, local_data_path):
     base_data = data_loader.load_fuels(base_data)
     base_data['assumptions'] = assumptions.load_assumptions(base_data)
 
-    # RESIDENTIAL: Convert base year fuel input assumptions to energy service
-    rs_service_tech_by_p, rs_service_fueltype_tech_by_p, rs_service_fueltype_by_p = get_service_fueltype_tech(
-        base_data['assumptions']['technology_list'],
-        base_data['assumptions']['hybrid_technologies'],
-        base_data['lu_fueltype'],
-        base_data['assumptions']['rs_fuel_tech_p_by'],
-        base_data['rs_fuel_raw_data_enduses'],
-        base_data['assumptions']['technologies']
-        )
-
-    # SERVICE: Convert base year fuel input assumptions to energy service
-    fuels_aggregated_across_sectors = ss_sum_fuel_enduse_sectors(
-        base_data['ss_fuel_raw_data_enduses'],
-        base_data['ss_all_enduses'],
-        base_data['nr_of_fueltypes'])
-    ss_service_tech_by_p, ss_service_fueltype_tech_by_p, ss_service_fueltype_by_p = get_service_fueltype_tech(
-        base_data['assumptions']['technology_list'],
-        base_data['assumptions']['hybrid_technologies'],
-        base_data['lu_fueltype'],
-        base_data['assumptions']['ss_fuel_tech_p_by'],
-        fuels_aggregated_across_sectors,
-        base_data['assumptions']['technologies']
-        )
-
-    # INDUSTRY
-    fuels_aggregated_across_sectors = ss_sum_fuel_enduse_sectors(
-        base_data['is_fuel_raw_data_enduses'],
-        base_data['is_all_enduses'],
-        base_data['nr_of_fueltypes'])
-    is_service_tech_by_p, is_service_fueltype_tech_by_p, is_service_fueltype_by_p = get_service_fueltype_tech(
-        base_data['assumptions']['technology_list'],
-        base_data['assumptions']['hybrid_technologies'],
-        base_data['lu_fueltype'],
-        base_data['assumptions']['is_fuel_tech_p_by'],
-        fuels_aggregated_across_sectors,
-        base_data['assumptions']['technologies']
-        )
-
-    # Write to csv files
-    write_service_tech_by_p(
-        os.path.join(path_out, 'rs_service_tech_by_p.csv'),
-        rs_service_tech_by_p)
-    write_service_tech_by_p(
-        os.path.join(path_out, 'ss_service_tech_by_p.csv'),
-        ss_service_tech_by_p)
-    write_service_tech_by_p(
-        os.path.join(path_out, 'is_service_tech_by_p.csv'),
-        is_service_tech_by_p)
-    write_service_fueltype_tech_by_p(
-        os.path.join(path_out, 'rs_service_fueltype_tech_by_p.csv'), 
-        rs_service_fueltype_tech_by_p)
-    write_service_fueltype_tech_by_p(
-        os.path.join(path_out, 'ss_service_fueltype_tech_by_p.csv'),
-        ss_service_fueltype_tech_by_p)
-    write_service_fueltype_tech_by_p(
-        os.path.join(path_out, 'is_service_fueltype_tech_by_p.csv'),
-        is_service_fueltype_tech_by_p)
-    write_service_fueltype_by_p(
-        os.path.join(path_out, 'rs_service_fueltype_by_p.csv'),
-        rs_service_fueltype_by_p)
-    write_service_fueltype_by_p(
-        os.path.join(path_out, 'ss_service_fueltype_by_p.csv'),
-        ss_service_fueltype_by_p)
-    write_service_fueltype_by_p(
-        os.path.join(path_out, 'is_service_fueltype_by_p.csv'),
-        is_service_fueltype_by_p)
+    # Base year fuel of every enduse (aggregated across sectors for service and industry)
+    fuels = {
+        'rs': base_data['rs_fuel_raw_data_enduses'],
+        'ss': ss_sum_fuel_enduse_sectors(
+            base_data['ss_fuel_raw_data_enduses'],
+            base_data['ss_all_enduses'],
+            base_data['nr_of_fueltypes']),
+        'is': ss_sum_fuel_enduse_sectors(
+            base_data['is_fuel_raw_data_enduses'],
+            base_data['is_all_enduses'],
+            base_data['nr_of_fueltypes'])
+        }
+
+    for submodel in ('rs', 'ss', 'is'):
+
+        # Convert base year fuel input assumptions to energy service
+        enduses, technologies, tech_defined, service = calc_service_by(
+            base_data['assumptions']['technology_list'],
+            base_data['assumptions']['hybrid_technologies'],
+            base_data['nr_of_fueltypes'],
+            base_data['assumptions']['{}_fuel_tech_p_by'.format(submodel)],
+            fuels[submodel],
+            base_data['assumptions']['technologies']
+            )
+
+        # Write to binary archive
+        service_archive.write_service_archive(
+            service_archive.archive_path(path_out, submodel), enduses, technologies, tech_defined, service)
+
+        # Write to csv files
+        service_tech_by_p, service_fueltype_tech_by_p, service_fueltype_by_p = service_archive.service_to_p(
+            enduses, technologies, tech_defined, service)
+
+        write_service_tech_by_p(
+            os.path.join(path_out, '{}_service_tech_by_p.csv'.format(submodel)),
+            service_tech_by_p)
+        write_service_fueltype_tech_by_p(
+            os.path.join(path_out, '{}_service_fueltype_tech_by_p.csv'.format(submodel)),
+            service_fueltype_tech_by_p)
+        write_service_fueltype_by_p(
+            os.path.join(path_out, '{}_service_fueltype_by_p.csv'.format(submodel)),
+            service_fueltype_by_p)
 
     print("... finished script {}".format(os.path.basename(__file__)))
     return
@@ -1,12 +1,13 @@
-"""Read residential raw files and store to txt
+"""Read residential raw files and store to binary shape archive
 """
 import os
 import csv
-from datetime import date
 import numpy as np
 from energy_demand.scripts import s_shared_functions
+from energy_demand.profiles import profile_kernels
 from energy_demand.read_write import read_data
 from energy_demand.read_write import data_loader
+from energy_demand.read_write import shape_archive
 
 def read_csv(path_to_csv):
     """This function reads in CSV files and skips header row.
@@ -38,66 +39,46 @@ def read_csv(path_to_csv):
 
     return np.array(service_switches) # Convert list into array
 
-def get_hes_load_shapes(appliances_hes_matching, year_raw_values, hes_y_peak, enduse):
-    """Read in raw HES data and generate shapes
+def get_hes_load_shapes(year_raw_values, hes_y_peak):
+    """Generate shapes of all HES appliances from raw HES data
 
-    Calculate peak day demand
+    All appliances are processed at once with
+    reductions along the day and hour axes
 
     Parameters
     ----------
-    appliances_hes_matching : dict
-        HES appliances are matched witch enduses
-    year_raw_values : data
-        Yearly values from raw
-    hes_y_peak : data
-        Peak raw values
-    enduse : string
-        enduse
+    year_raw_values : array
+        Yearly values from raw, shape: (365, 24, appliances)
+    hes_y_peak : array
+        Peak raw values, shape: (24, appliances)
 
     Returns
     -------
-    shape_peak_yd_factor : float
-        Peak day demand (Calculate factor which can be used to
-        multiply yearly demand to generate peak demand)
-    shape_peak_yh : float
-        Peak demand of each hours of peak day
+    shape_peak_dh : array
+        Shape of peak day (hourly values of peak day), shape: (24, appliances)
+    shape_non_peak_y_dh : array
+        Daily shape of every day, shape: (365, 24, appliances)
+    shape_peak_yd_factor : array
+        Peak day demand (Factor which can be used to multiply yearly
+        demand to generate peak demand), shape: (appliances,)
+    shape_non_peak_yd : array
+        Share of yearly demand of every day, shape: (365, appliances)
 
-    Notes
-    -----
-    The HES appliances are matched with enduses
+    Note
+    ----
+    If there is no demand (total or of a day), the shape is set to zero
     """
-    # Match enduse with HES appliance ID (see look_up table in original files for more information)
-    if enduse in appliances_hes_matching:
-        hes_app_id = appliances_hes_matching[enduse]
-    else:
-        print("...The enduse has not HES ID and thus shape")
-
-    # Total yearly demand of hes_app_id
-    tot_enduse_y = np.sum(year_raw_values[:, :, hes_app_id])
-
-    # ---Peak calculation Get peak daily load shape
-
-    # Calculate amount of energy demand for peak day of hes_app_id
-    peak_h_values = hes_y_peak[:, hes_app_id]
-
-    # Shape of peak day (hourly values of peak day) #1.0/tot_peak_demand_d * peak_h_values
-    shape_peak_dh = s_shared_functions.absolute_to_relative(peak_h_values)
-
-    # Maximum daily demand
-    tot_peak_demand_d = np.sum(peak_h_values)
-
-    # Factor to calculate daily peak demand from yearly demand
-    shape_peak_yd_factor = (1.0 / tot_enduse_y) * tot_peak_demand_d
-
-    # ---Calculate non-peak shapes
-    shape_non_peak_yd = np.zeros((365))
-    shape_non_peak_y_dh = np.zeros((365, 24))
+    # Total yearly and daily demand of every appliance
+    tot_d = np.sum(year_raw_values, axis=1)
+    tot_y = np.sum(tot_d, axis=0)
 
-    for day in range(365):
-        day_values = year_raw_values[day, :, hes_app_id]
+    # Maximum daily demand (demand of peak day)
+    tot_peak_demand_d = np.sum(hes_y_peak, axis=0)
 
-        shape_non_peak_yd[day] = (1.0 / tot_enduse_y) * np.sum(day_values)
-        shape_non_peak_y_dh[day] = (1.0 / np.sum(day_values)) * day_values # daily shape
+    shape_peak_dh = profile_kernels.safe_divide(hes_y_peak, tot_peak_demand_d)
+    shape_peak_yd_factor = profile_kernels.safe_divide(tot_peak_demand_d, tot_y)
+    shape_non_peak_yd = profile_kernels.safe_divide(tot_d, tot_y)
+    shape_non_peak_y_dh = profile_kernels.safe_divide(year_raw_values, tot_d[:, np.newaxis, :])
 
     return shape_peak_dh, shape_non_peak_y_dh, shape_peak_yd_factor, shape_non_peak_yd
 
@@ -118,27 +99,10 @@ def assign_hes_data_to_year(nr_of_appliances, hes_data, base_yr):
     year_raw_values : array
         Energy data for every day in the base year for every appliances
     """
-    year_raw_values = np.zeros((365, 24, nr_of_appliances), dtype=float)
+    daytype_index, month_index = s_shared_functions.get_daytype_month_index(base_yr)
 
-    # Create list with all dates of a whole year
-    list_dates = s_shared_functions.fullyear_dates(
-        start=date(base_yr, 1, 1),
-        end=date(base_yr, 12, 31)
-        )
-
-    # Assign every date to the place in the array of the year
-    for yearday in list_dates:
-        month_python = yearday.timetuple().tm_mon - 1 # - 1 because in _info: Month 1 = Jan
-        yearday_python = yearday.timetuple().tm_yday - 1 # - 1 because in _info: 1.Jan = 1
-        daytype = s_shared_functions.get_weekday_type(yearday)
-
-        if daytype == 'holiday':
-            daytype = 1
-        else:
-            daytype = 0
-
-        # Get day from HES raw data array
-        year_raw_values[yearday_python] = hes_data[daytype][month_python]
+    # Gather day of HES raw data array for every yearday
+    year_raw_values = hes_data[daytype_index, month_index, :, :nr_of_appliances]
 
     return year_raw_values
 
@@ -154,8 +118,6 @@ def read_hes_data(paths_hes, nr_app_type_lu):
         Path to HES raw data file
     nr_app_type_lu : dict
         Number of appliances (defines size of container to store data)
-    day_type_lu : dict
-        Look-up table for daytypes
 
     Returns
     -------
@@ -187,24 +149,20 @@ def read_hes_data(paths_hes, nr_app_type_lu):
     # Read in raw HES data from CSV
     raw_elec_data = read_csv(paths_hes)
 
-    # Iterate raw data of hourly eletrictiy demand
-    for row in raw_elec_data:
-        month, daytype, appliance_typ = int(row[0]), int(row[1]), int(row[2])
-        k_header = 3 #Row in Excel where energy data start
-
-        for hour in range(24):
-            hourly_value = float(row[k_header])
-
-            # if coldest (see HES file)
-            if daytype == 2:
-                hes_y_coldest[hour][appliance_typ] = hourly_value
-                k_header += 1
-            elif daytype == 3:
-                hes_y_warmest[hour][appliance_typ] = hourly_value
-                k_header += 1
-            else:
-                hes_data[daytype][month][hour][appliance_typ] = hourly_value
-                k_header += 1
+    month = raw_elec_data[:, 0].astype(int)
+    daytype = raw_elec_data[:, 1].astype(int)
+    appliance_typ = raw_elec_data[:, 2].astype(int)
+    hourly_values = raw_elec_data[:, 3:27].astype(float) # Columns where energy data start
+
+    # Coldest and warmest day (see HES file)
+    coldest = daytype == 2
+    warmest = daytype == 3
+    hes_y_coldest[:, appliance_typ[coldest]] = hourly_values[coldest].T
+    hes_y_warmest[:, appliance_typ[warmest]] = hourly_values[warmest].T
+
+    # Weekend and working days
+    other = ~(coldest | warmest)
+    hes_data[daytype[other], month[other], :, appliance_typ[other]] = hourly_values[other]
 
     return hes_data, hes_y_coldest, hes_y_warmest
 
@@ -224,8 +182,8 @@ def run(path_main, local_data_path):
     data = data_loader.load_paths(path_main, local_data_path)
     sim_param = data['assumptions']['sim_param']
     
-    path_rs_txt_shapes = os.path.join(
-        path_main, 'data', 'data_scripts', 'load_profiles', 'rs_submodel')
+    path_rs_shape_archive = os.path.join(
+        path_main, 'data', 'data_scripts', 'load_profiles', 'rs_submodel_archive')
     path_rs_fuel_raw_data = os.path.join(
         path_main, 'data', 'submodel_residential', 'data_residential_by_fuel_end_uses.csv')
 
@@ -259,28 +217,29 @@ def run(path_main, local_data_path):
 
     _, rs_enduses = read_data.read_csv_base_data_resid(path_rs_fuel_raw_data)
 
+    # Generate HES load shapes of all appliances
+    shape_peak_dh, shape_non_peak_y_dh, shape_peak_yd_factor, shape_non_peak_yd = get_hes_load_shapes(
+        year_raw_hes_values,
+        hes_y_peak
+        )
+
     # Load shape for all enduses
+    rs_shapes = {}
     for enduse in rs_enduses:
         if enduse not in hes_appliances_matching:
             print("Warning: The enduse {} is not defined in hes_appliances_matching".format(enduse))
         else:
-            # Generate HES load shapes
-            shape_peak_dh, shape_non_peak_y_dh, shape_peak_yd_factor, shape_non_peak_yd = get_hes_load_shapes(
-                hes_appliances_matching,
-                year_raw_hes_values,
-                hes_y_peak,
-                enduse
-                )
-
-            # Write txt files
-            s_shared_functions.create_txt_shapes(
-                enduse,
-                path_rs_txt_shapes,
-                shape_peak_dh,
-                shape_non_peak_y_dh,
-                shape_peak_yd_factor,
-                shape_non_peak_yd
-                )
+            # Match enduse with HES appliance ID (see look_up table in original files)
+            hes_app_id = hes_appliances_matching[enduse]
+
+            rs_shapes[enduse] = {
+                'shape_peak_dh': shape_peak_dh[:, hes_app_id],
+                'shape_non_peak_y_dh': shape_non_peak_y_dh[:, :, hes_app_id],
+                'shape_peak_yd_factor': shape_peak_yd_factor[hes_app_id],
+                'shape_non_peak_yd': shape_non_peak_yd[:, hes_app_id]}
+
+    # Write all shapes to binary shape archive
+    shape_archive.write_shape_archive(path_rs_shape_archive, rs_shapes)
 
     print("... finished script {}".format(os.path.basename(__file__)))
     return
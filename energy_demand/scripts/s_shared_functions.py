@@ -6,6 +6,7 @@ from datetime import date
 from datetime import timedelta
 import json
 import numpy as np
+from energy_demand.profiles import profile_kernels
 
 def create_txt_shapes(
         end_use,
@@ -90,6 +91,39 @@ def fullyear_dates(start, end):
 
     return list_dates
 
+def get_daytype_month_index(base_yr):
+    """Get daytype and month of every day of a year as index arrays
+
+    Parameters
+    ----------
+    base_yr : int
+        Year
+
+    Returns
+    -------
+    daytype_index : array
+        Daytype of every yearday (0: working day, 1: holiday), shape: (365,)
+    month_index : array
+        Month of every yearday (0: January), shape: (365,)
+
+    Note
+    ----
+    Only the first 365 days are considered, i.e. in
+    a leap year the 31. of December is omitted
+    """
+    list_dates = fullyear_dates(
+        start=date(base_yr, 1, 1),
+        end=date(base_yr, 12, 31))[:365]
+
+    daytype_index = np.zeros((365), dtype=int)
+    month_index = np.zeros((365), dtype=int)
+    for yearday_python, yearday in enumerate(list_dates):
+        if get_weekday_type(yearday) == 'holiday':
+            daytype_index[yearday_python] = 1
+        month_index[yearday_python] = yearday.month - 1
+
+    return daytype_index, month_index
+
 def read_assumption_sim_param(path_to_csv):
     """Read assumptions from dict
 
@@ -144,16 +178,9 @@ def absolute_to_relative(absolute_array):
 
     Note
     ----
-    - If the total sum is zero, return an array with zeros and raise a warning
+    - If the total sum is zero, return an array with zeros
     """
-    try:
-        relative_array = (1 / np.sum(absolute_array)) * absolute_array
-        relative_array[np.isnan(relative_array)] = 0
-    except ZeroDivisionError:
-        # If the total sum is zero, return same array
-        relative_array = absolute_array
-
-    return relative_array
+    return profile_kernels.normalise(absolute_array)
 
 def get_weekday_type(date_to_test):
     """Gets the weekday of a date
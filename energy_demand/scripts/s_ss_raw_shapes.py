@@ -3,35 +3,129 @@
 import os
 import sys
 import csv
+import multiprocessing
 from datetime import date
 import numpy as np
 from energy_demand.read_write import read_data
 from energy_demand.scripts import s_shared_functions
+from energy_demand.profiles import profile_kernels
 from energy_demand.assumptions import assumptions
 from energy_demand.read_write import data_loader
+from energy_demand.read_write import shape_archive
 
-def dict_init_carbon_trust():
-    """Helper function to initialise dict
+def read_carbon_trust_file(path_csv_file):
+    """Read a single csv file of the carbon trust dataset and
+    aggregate the hourly demand by daytype and month
+
+    Parameters
+    ----------
+    path_csv_file : str
+        Path to csv file with half-hourly values of one site
+
+    Returns
+    -------
+    sum_dh : array
+        Summed hourly demand for every daytype and month, shape: (2, 12, 24)
+    count_dh : array
+        Number of summed days for every daytype and month, shape: (2, 12)
+    max_dh_shape : array or None
+        Daily shape of the day with maximum demand (None if the
+        file does not cover a full year)
+
+    Note
+    ----
+    - Only files which cover more than one year are used and
+      only the data of the first year is used
+    - Rows with not 48 half-hourly values are skipped
+    - Days without any demand (e.g. missing readings) are skipped, i.e.
+      they neither count for the average of their daytype and month
+      nor for the day with maximum demand
+    - Leap years are shifted to the following year and the 29. of Feb.
+      is skipped
     """
-    carbon_trust_raw = {}
-    for day in range(365):
-        day_dict_h = {k: [] for k in range(24)}
-        carbon_trust_raw[day] = day_dict_h
+    sum_dh = np.zeros((2, 12, 24))
+    count_dh = np.zeros((2, 12))
+
+    # Only the rows of the first year are kept, i.e. memory stays constant
+    rows = []
+    count_row = -1
+    with open(path_csv_file, 'r') as csv_file:
+        read_lines = csv.reader(csv_file, delimiter=',')
+        _headings = next(read_lines)
+
+        for count_row, row in enumerate(read_lines):
+            if count_row <= 365 and len(row) == 49:
+                rows.append(row)
+
+    # Skip file if not more than one year is in csv file
+    if count_row <= 365:
+        return sum_dh, count_dh, None
+
+    daytypes, months, demand_dh = [], [], []
+    for row in rows:
+        day, month, year = [int(date_entry) for date_entry in row[0].split("/")[:3]]
+
+        # Redefine yearday to another year and skip 29. of Feb.
+        if is_leap_year(year):
+            year = year + 1 # Shift whole dataset to another year
+            if month == 2 and day == 29:
+                continue
+
+        if s_shared_functions.get_weekday_type(date(year, month, day)) == 'holiday':
+            daytypes.append(1)
+        else:
+            daytypes.append(0)
+        months.append(month - 1)
+        demand_dh.append(row[1:])
+
+    if not demand_dh:
+        return sum_dh, count_dh, None
+
+    # Summarise half hour data to hourly
+    demand_dh = np.array(demand_dh, dtype=float).reshape(-1, 24, 2).sum(axis=2)
+    daily_sum = demand_dh.sum(axis=1)
+
+    # Skip days without demand
+    with_demand = daily_sum != 0
+    if not with_demand.any():
+        return sum_dh, count_dh, None
+
+    daytypes = np.array(daytypes)[with_demand]
+    months = np.array(months)[with_demand]
+    demand_dh = demand_dh[with_demand]
+    daily_sum = daily_sum[with_demand]
+
+    # Aggregate demand according to daytype and month
+    np.add.at(sum_dh, (daytypes, months), demand_dh)
+    np.add.at(count_dh, (daytypes, months), 1)
 
-    return carbon_trust_raw
+    # Shape of the day with maximum demand (last one if several)
+    max_day = len(daily_sum) - 1 - np.argmax(daily_sum[::-1])
+    max_dh_shape = demand_dh[max_day] / daily_sum[max_day]
 
-def read_raw_carbon_trust_data(folder_path):
+    return sum_dh, count_dh, max_dh_shape
+
+def read_raw_carbon_trust_data(folder_path, processes=None):
     """Read in raw carbon trust dataset (used for service sector)
 
     Parameters
     ----------
-    foder_path : string
+    folder_path : string
         Path to folder with stored csv files
+    processes : int
+        Number of worker processes to read the csv files (if `None`,
+        the number of cpus is used; if 1, files are read sequentially)
 
     Returns
     -------
-
-    TODO:
+    load_shape_dh : array
+        Daily shape of every day, shape: (365, 24)
+    load_peak_shape_dh : array
+        Averaged shape of the maximum day of every csv file, shape: (24,)
+    shape_peak_yd_factor : float
+        Factor to calculate peak day demand from yearly demand
+    shape_non_peak_yd : array
+        Share of yearly demand of every day, shape: (365,)
 
     Note
     -----
@@ -42,185 +136,54 @@ def read_raw_carbon_trust_data(folder_path):
     4. Get the hourly shape of this day
     5. Calculate total demand of every day
     6. Assign percentag of total daily demand to each hour
-    """
-    def initialise_main_dict():
-        """Helper function to initialise dict
-        """
-        out_dict_av = {0: {}, 1: {}}
-        for dtype in out_dict_av:
-            month_dict = {}
-            for month in range(12):
-                month_dict[month] = {k: [] for k in range(24)}
-            out_dict_av[dtype] = month_dict
-        return out_dict_av
-
-    def initialise_out_dict_av():
-        """Helper function to initialise dict"""
-        out_dict_av = {0: {}, 1: {}}
-        for dtype in out_dict_av:
-            month_dict = {}
-            for month in range(12):
-                month_dict[month] = {k: 0 for k in range(24)}
-            out_dict_av[dtype] = month_dict
-        return out_dict_av
-
-
-    # Get all files in folder
-    all_csv_in_folder = os.listdir(folder_path)
-    main_dict = initialise_main_dict()
-    carbon_trust_raw = dict_init_carbon_trust()
-
-    nr_of_line_entries = 0
-    dict_max_dh_shape = {}
-
-    # Itreateu folder with csv files
-    for path_csv_file in all_csv_in_folder:
-        path_csv_file = os.path.join(folder_path, path_csv_file)
-
-        # Read csv file
-        with open(path_csv_file, 'r') as csv_file:
-            print("path_csv_file: " + str(path_csv_file))
-            read_lines = csv.reader(csv_file, delimiter=',')
-            _headings = next(read_lines)
-            max_d_demand = 0 # Used for searching maximum
-
-            # Count number of lines in CSV file
-            row_data = []
-            for count_row, row in enumerate(read_lines):
-                row_data.append(row)
-            #print("Number of lines in csv file: " + str(count_row))
-
-            # Calc yearly demand based on one year data measurements
-            if count_row > 365: # if more than one year is in csv file
-                print("FILE covers a full year---------------------------")
-
-                # Test if file has correct form and not more entries than 48 half-hourly entries
-                for day, row in enumerate(row_data):
-                    if len(row) != 49:
-                        continue # Skip row
-
-                    # Use only data of one year
-                    if day > 365:
-                        continue
-
-                    load_shape_dh = np.zeros((24))
-
-                    row[1:] = map(float, row[1:]) # Convert all values except date into float values
-                    daily_sum = sum(row[1:]) # Total daily sum
-                    nr_of_line_entries += 1 # Nr of lines added
-                    day = int(row[0].split("/")[0])
-                    month = int(row[0].split("/")[1])
-                    year = int(row[0].split("/")[2])
-
-                    # Redefine yearday to another year and skip 28. of Feb.
-                    if is_leap_year(int(year)) is True:
-                        year = year + 1 # Shift whole dataset to another year
-                        if month == 2 and day == 29:
-                            continue #skip leap day
-
-                    date_row = date(year, month, day)
-                    daytype = s_shared_functions.get_weekday_type(date_row)
-
-                    if daytype == 'holiday':
-                        daytype = 1
-                    else:
-                        daytype = 0
-
-                    yearday_python = date_row.timetuple().tm_yday - 1 # - 1 because in _info: 1.Jan = 1
-                    month_python = month - 1 # Month Python
-
-                    h_day, cnt, control_sum = 0, 0, 0
-
-                    # -----------------------------------------------
-                    # Iterate half hour data and summarise to hourly
-                    # -----------------------------------------------
-                    for data_h in row[1:]:  # Skip first date row in csv file
-                        cnt += 1
-                        if cnt == 2:
-                            demand_h = first_data_h + data_h
-                            control_sum += abs(demand_h)
-
-                            # Add demand
-                            carbon_trust_raw[yearday_python][h_day].append(demand_h)
-
-                            # Store demand according to daytype (aggregated by doing so)
-                            main_dict[daytype][month_python][h_day].append(demand_h)
-
-                            if daily_sum == 0: # Skip row if no demand of the day
-                                load_shape_dh[h_day] = 0
-                                continue
-                            else:
-                                load_shape_dh[h_day] = (1.0 / daily_sum) * demand_h
-
-                            cnt = 0
-                            h_day += 1
-
-                        # Value lagging behind one iteration
-                        first_data_h = data_h
-
-                    # Test if this is the day with maximum demand of this CSV file
-                    if daily_sum >= max_d_demand:
-                        max_d_demand = daily_sum
-                        max_dh_shape = load_shape_dh
 
-                    # Check if 100 %
-                    np.testing.assert_almost_equal(control_sum, daily_sum, decimal=7, err_msg="")
-
-                # Add load shape of maximum day in csv file
-                dict_max_dh_shape[path_csv_file] = max_dh_shape
+    The files are read in parallel and only running sums and counts
+    per daytype and month are kept (see `read_carbon_trust_file`)
+    """
+    paths_csv_file = [
+        os.path.join(folder_path, path_csv_file) for path_csv_file in os.listdir(folder_path)]
+
+    if processes == 1:
+        file_results = map(read_carbon_trust_file, paths_csv_file)
+    else:
+        with multiprocessing.Pool(processes) as pool:
+            file_results = pool.map(read_carbon_trust_file, paths_csv_file)
+
+    # Merge the results of all files
+    sum_dh = np.zeros((2, 12, 24))
+    count_dh = np.zeros((2, 12))
+    max_dh_shapes = []
+    for file_sum_dh, file_count_dh, max_dh_shape in file_results:
+        sum_dh += file_sum_dh
+        count_dh += file_count_dh
+        if max_dh_shape is not None:
+            max_dh_shapes.append(max_dh_shape)
 
     # ---------------
     # Data processing
     # ---------------
 
-    # --Average average maxium peak dh of every csv file
-    load_peak_average_dh = np.zeros((24))
-    for peak_shape_dh in dict_max_dh_shape.values():
-        load_peak_average_dh += peak_shape_dh
-    load_peak_shape_dh = load_peak_average_dh / len(dict_max_dh_shape)
-
-    # -----------------------------------------------
-    # Calculate average load shapes for every month
-    # -----------------------------------------------
-    # -- Average (initialise dict)
-    out_dict_av = initialise_out_dict_av()
-
-    for daytype in main_dict:
-        for month in main_dict[daytype]:
-            for hour in main_dict[daytype][month]:
-                nr_of_entries = len(main_dict[daytype][month][hour])
-                if nr_of_entries != 0:
-                    out_dict_av[daytype][month][hour] = sum(main_dict[daytype][month][hour]) / nr_of_entries
+    # --Average maxium peak dh of every csv file
+    load_peak_shape_dh = np.mean(max_dh_shapes, axis=0)
+
+    # Calculate average load shapes for every daytype and month
+    av_dh = profile_kernels.safe_divide(sum_dh, count_dh[:, :, np.newaxis])
 
     # ----------------------------------------------------------
     # Distribute raw data into base year depending on daytype
     # ----------------------------------------------------------
-    year_data = assign_data_to_year(out_dict_av, 2015)
+    year_data = assign_data_to_year(av_dh, 2015)
 
-    # Calculate yearly sum
-    yearly_demand = np.sum(year_data)
+    # Calculate daily sums and create load_shape_dh (daily shapes)
+    daily_demand, load_shape_dh = profile_kernels.factorise(year_data, axis=1)
 
     # Calculate shape_peak_yd_factor
-    max_demand_d = 0
-    for yearday, carbon_trust_d in enumerate(year_data):
-        daily_sum = np.sum(carbon_trust_d)
-        if daily_sum > max_demand_d:
-            max_demand_d = daily_sum
-
-    shape_peak_yd_factor = (1.0 / yearly_demand) * max_demand_d
-
-    # Create load_shape_dh
-    load_shape_dh = np.zeros((365, 24))
-    for day, dh_values in enumerate(year_data):
-        load_shape_dh[day] = s_shared_functions.absolute_to_relative(dh_values) # daily shape
+    shape_peak_yd_factor = profile_kernels.peak_factor(daily_demand)
 
     np.testing.assert_almost_equal(np.sum(load_shape_dh), 365, decimal=2, err_msg="")
 
     # Calculate shape_non_peak_yd
-    shape_non_peak_yd = np.zeros((365))
-    for yearday, carbon_trust_d in enumerate(year_data):
-        shape_non_peak_yd[yearday] = np.sum(carbon_trust_d)
-    shape_non_peak_yd = (1.0 / yearly_demand) * shape_non_peak_yd
+    shape_non_peak_yd = profile_kernels.normalise(daily_demand)
 
     np.testing.assert_almost_equal(np.sum(shape_non_peak_yd), 1, decimal=2, err_msg="")
 
@@ -235,31 +198,19 @@ def assign_data_to_year(carbon_trust_data, base_yr):
 
     Parameters
     ----------
-    carbon_trust_data : data
-        Raw data
+    carbon_trust_data : array
+        Averaged data for every daytype and month, shape: (2, 12, 24)
     base_yr : int
         Base Year
-    """
-    shape_non_peak_y_dh = np.zeros((365, 24))
-
-    # Create list with all dates of a whole year
-    list_dates = s_shared_functions.fullyear_dates(start=date(base_yr, 1, 1), end=date(base_yr, 12, 31))
-
-    # Assign every date to the place in the array of the year
-    for yearday in list_dates:
-        month_python = yearday.timetuple().tm_mon - 1 # - 1 because in _info: Month 1 = Jan
-        yearday_python = yearday.timetuple().tm_yday - 1 # - 1 because in _info: 1.Jan = 1
-        daytype = s_shared_functions.get_weekday_type(yearday)
-        if daytype == 'holiday':
-            daytype = 1
-        else:
-            daytype = 0
 
-        _data = carbon_trust_data[daytype][month_python] # Get day from HES raw data array
+    Returns
+    -------
+    shape_non_peak_y_dh : array
+        Data of every day of the base year, shape: (365, 24)
+    """
+    daytype_index, month_index = s_shared_functions.get_daytype_month_index(base_yr)
 
-        # Add values to yearly
-        _data = np.array(list(_data.items()))
-        shape_non_peak_y_dh[yearday_python] = np.array(_data[:, 1], dtype=float)
+    shape_non_peak_y_dh = carbon_trust_data[daytype_index, month_index]
 
     return shape_non_peak_y_dh
 
@@ -277,6 +228,8 @@ def run(path_main, local_data_path):
         base_data['nr_of_fueltypes'])
 
     # Iterate sectors and read in shape
+    ss_shapes = {}
+    carbon_trust_shapes = {}
     for sector in ss_sectors:
 
         # Match electricity shapes for every sector
@@ -331,21 +284,24 @@ def run(path_main, local_data_path):
                 else:
                     folder_path = sector_folder_path_elec
 
-            # Read in shape from carbon trust metering trial dataset
-            shape_non_peak_y_dh, load_peak_shape_dh, shape_peak_yd_factor, shape_non_peak_yd = read_raw_carbon_trust_data(
-                folder_path)
+            # Read in shape from carbon trust metering trial dataset (once per folder)
+            if folder_path not in carbon_trust_shapes:
+                carbon_trust_shapes[folder_path] = read_raw_carbon_trust_data(folder_path)
+
+            shape_non_peak_y_dh, load_peak_shape_dh, shape_peak_yd_factor, shape_non_peak_yd = carbon_trust_shapes[folder_path]
 
-            # Write shapes to txt
             joint_string_name = str(sector) + "__" + str(enduse)
 
-            s_shared_functions.create_txt_shapes(
-                joint_string_name,
-                os.path.join(path_main, 'data', 'data_scripts', 'load_profiles', 'ss_submodel'),
-                load_peak_shape_dh,
-                shape_non_peak_y_dh,
-                shape_peak_yd_factor,
-                shape_non_peak_yd
-                )
+            ss_shapes[joint_string_name] = {
+                'shape_peak_dh': load_peak_shape_dh,
+                'shape_non_peak_y_dh': shape_non_peak_y_dh,
+                'shape_peak_yd_factor': shape_peak_yd_factor,
+                'shape_non_peak_yd': shape_non_peak_yd}
+
+    # Write all shapes to binary shape archive
+    shape_archive.write_shape_archive(
+        os.path.join(path_main, 'data', 'data_scripts', 'load_profiles', 'ss_submodel_archive'),
+        ss_shapes)
 
     # ---------------------
     # Compare Jan and Jul
@@ -4,19 +4,20 @@ Service Submodel
 
 """
 import energy_demand.enduse as endusefunctions
+from energy_demand.basic import fuel_adjustment
 
 # pylint: disable=I0011,C0321,C0301,C0103,C0325,no-member
 
 class ServiceModel(object):
     """Service Submodel
     """
-    def __init__(self, data, region_object, enduse, sector):
+    def __init__(self, run_context, region_object, enduse, sector):
         """Constructor of ResidentialModel
 
         Parameters
         ----------
-        data : dict
-            Data
+        run_context : RunContext
+            Run context of simulation year
         region_object : dict
             Object of region
         enduse : string
@@ -27,19 +28,19 @@ class ServiceModel(object):
         self.region_name = region_object.region_name
         self.enduse = enduse
         self.sector = sector
-        self.fuels_all_enduses = data['ss_fueldata_disagg'][self.region_name][self.sector]
+        self.fuels_all_enduses = region_object.ss_enduses_sectors_fuels[self.sector]
 
-        self.enduse_object = self.create_enduse(region_object, data)
+        self.enduse_object = self.create_enduse(region_object, run_context)
 
-    def create_enduse(self, region_object, data):
+    def create_enduse(self, region_object, run_context):
         """Create enduse for service sector
 
         Parameters
         ----------
         region_object : object
             Region
-        data : dict
-            Data container
+        run_context : RunContext
+            Run context of simulation year
 
         Returns
         -------
@@ -47,26 +48,33 @@ class ServiceModel(object):
             Object of an enduse
         """
         # Add enduse to ServiceSector
+        submodel_context = run_context.submodels['ss_submodel']
+
         enduse_object = endusefunctions.Enduse(
             region_name=self.region_name,
-            data=data,
+            run_context=run_context,
             enduse=self.enduse,
             sector=self.sector,
             fuel=self.fuels_all_enduses[self.enduse],
             tech_stock=region_object.ss_tech_stock,
-            heating_factor_y=region_object.ss_heating_factor_y,
-            cooling_factor_y=region_object.ss_cooling_factor_y,
-            fuel_switches=data['assumptions']['ss_fuel_switches'],
-            service_switches=data['assumptions']['ss_service_switches'],
-            fuel_tech_p_by=data['assumptions']['ss_fuel_tech_p_by'][self.enduse],
-            tech_increased_service=data['assumptions']['ss_tech_increased_service'],
-            tech_decreased_share=data['assumptions']['ss_tech_decreased_share'],
-            tech_constant_share=data['assumptions']['ss_tech_constant_share'],
-            installed_tech=data['assumptions']['ss_installed_tech'],
-            sig_param_tech=data['assumptions']['ss_sig_param_tech'],
-            enduse_overall_change_ey=data['assumptions']['enduse_overall_change_ey']['ss_model'],
+            fuel_switches=submodel_context.fuel_switches,
+            service_switches=submodel_context.service_switches,
+            fuel_tech_p_by=submodel_context.fuel_tech_p_by[self.enduse],
+            tech_increased_service=submodel_context.tech_increased_service,
+            tech_decreased_share=submodel_context.tech_decreased_share,
+            tech_constant_share=submodel_context.tech_constant_share,
+            installed_tech=submodel_context.installed_tech,
+            sig_param_tech=submodel_context.sig_param_tech,
             regional_profile_stock=region_object.ss_load_profiles,
-            dw_stock=data['ss_dw_stock']
+            fuel_factors=fuel_adjustment.get_fuel_factors(
+                self.enduse,
+                submodel_context.national_fuel_factors,
+                run_context.assumptions,
+                region_object.ss_heating_factor_y,
+                region_object.ss_cooling_factor_y,
+                submodel_context.driver_ratios.get_ratio(
+                    run_context.curr_yr, self.region_name, self.enduse)),
+            switch_plan=submodel_context.switch_plans.get(self.enduse)
         )
 
         return enduse_object
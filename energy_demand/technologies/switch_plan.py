@@ -0,0 +1,243 @@
+"""National switch plans
+
+The sigmoid diffusion of technologies is defined nationally (no regional
+variation), i.e. the service shares of the technologies affected by fuel
+or service switches only depend on the simulation year. The switch plan
+of every enduse is therefore calculated once per year and applied in every
+region to the regional service with array operations.
+"""
+import numpy as np
+from energy_demand.technologies import diffusion_technologies as diffusion
+
+class SwitchPlan(object):
+    """Switch plan of an enduse for a simulation year
+
+    Parameters
+    ----------
+    enduse : str
+        Enduse
+    curr_yr : int
+        Current year
+    fuel_switches : list
+        Fuel switches
+    installed_tech : dict
+        Technologies installed with fuel switches per enduse
+    sig_param_tech : dict
+        Sigmoid diffusion parameters
+    tech_increased_service : dict
+        Technologies with increased service per enduse (service switches)
+    tech_decreased_share : dict
+        Technologies with decreased service per enduse (service switches)
+    tech_constant_share : dict
+        Technologies with constant service per enduse (service switches)
+
+    Note
+    ----
+    - `diffusion_cy` contains the service share of the current year of every
+      technology with a diffusion (installed or increased service)
+    - `replaced_fueltypes` contains for every installed technology the
+      replaced fueltypes and the share of the fuel which is switched
+    """
+    def __init__(
+            self,
+            enduse,
+            curr_yr,
+            fuel_switches,
+            installed_tech,
+            sig_param_tech,
+            tech_increased_service,
+            tech_decreased_share,
+            tech_constant_share
+        ):
+        """Constructor
+        """
+        self.enduse = enduse
+
+        self.installed_tech = list(installed_tech.get(enduse, []))
+        self.tech_increased_service = list(tech_increased_service.get(enduse, []))
+        self.tech_decreased_share = list(tech_decreased_share.get(enduse, []))
+        self.tech_constant_share = list(tech_constant_share.get(enduse, []))
+
+        # Service share of current year of diffused technologies
+        self.diffusion_cy = {}
+        for tech in set(self.installed_tech + self.tech_increased_service):
+            self.diffusion_cy[tech] = diffusion.sigmoid_function(
+                curr_yr,
+                sig_param_tech[enduse][tech]['l_parameter'],
+                sig_param_tech[enduse][tech]['midpoint'],
+                sig_param_tech[enduse][tech]['steepness'])
+
+        # Replaced fueltypes and switched fuel share of every installed technology
+        self.replaced_fueltypes = {tech: [] for tech in self.installed_tech}
+        for fuelswitch in fuel_switches:
+            if fuelswitch['enduse'] == enduse and fuelswitch['technology_install'] in self.replaced_fueltypes:
+                self.replaced_fueltypes[fuelswitch['technology_install']].append(
+                    (fuelswitch['enduse_fueltype_replace'], fuelswitch['share_fuel_consumption_switched']))
+
+    def apply_service_switch(self, tot_service_h_cy, service_tech_by_p, technologies):
+        """Apply service switch to regional service
+
+        Parameters
+        ----------
+        tot_service_h_cy : array
+            Hourly service of all technologies
+        service_tech_by_p : array
+            Fraction of service per technology, shape: (technology,)
+        technologies : list
+            Technologies (order of technology axis)
+
+        Returns
+        -------
+        service_tech_cy : array
+            Service per technology in current year after switch,
+            shape: (technology, 365, 24)
+
+        Note
+        ----
+        The service which is fulfilled by new technologies is
+        substracted of the replaced technologies proportionally
+        to the base year distribution of these technologies.
+        Technologies not affected by the switch have no service.
+        """
+        tech_index = {tech: tech_nr for tech_nr, tech in enumerate(technologies)}
+        techs = self.tech_increased_service + self.tech_decreased_share + self.tech_constant_share
+        service_tech_cy_p = np.array([service_tech_by_p[tech_index[tech]] for tech in techs], dtype=float)
+
+        nr_incr = len(self.tech_increased_service)
+        nr_decr = len(self.tech_decreased_share)
+
+        # Service gain of technologies with increased service
+        diffusion_incr = np.array(
+            [self.diffusion_cy[tech] for tech in self.tech_increased_service], dtype=float)
+        diff_service_incr = diffusion_incr - service_tech_cy_p[:nr_incr]
+        service_tech_cy_p[:nr_incr] = diffusion_incr
+
+        # Substract service gain proportionally to the base year share of decreasing technologies
+        service_decr_cy_p = service_tech_cy_p[nr_incr:nr_incr + nr_decr]
+        if np.sum(service_decr_cy_p) == 0:
+            service_decr_rel = np.zeros((nr_decr))
+        else:
+            service_decr_rel = service_decr_cy_p / float(np.sum(service_decr_cy_p))
+
+        for diff_service in diff_service_incr:
+            service_decr_cy_p -= service_decr_rel * diff_service
+
+            # Because of rounding errors the service may fall below zero
+            # (therfore set to zero)
+            service_decr_cy_p[service_decr_cy_p < 0] = 0
+
+        service_tech_p = np.zeros((len(technologies)))
+        for tech, share in zip(techs, service_tech_cy_p):
+            service_tech_p[tech_index[tech]] = share
+
+        # Multiply share of each tech with hourly service
+        return service_tech_p[:, np.newaxis, np.newaxis] * tot_service_h_cy
+
+    def apply_fuel_switch(self, tot_service_h_cy, service_tech, technologies, service_fueltype_tech_cy_p, service_fueltype_cy_p, fuel_tech_p_by, resolution=None):
+        """Apply fuel switch to regional service
+
+        Parameters
+        ----------
+        tot_service_h_cy : array
+            Total regional service for every hour
+        service_tech : array
+            Service for every technology, shape: (technology, 365, 24)
+        technologies : list
+            Technologies (order of technology axis)
+        service_fueltype_tech_cy_p : dict
+            Fraction of service per fueltype, technology for current year
+        service_fueltype_cy_p : dict
+            Fraction of service per fueltype in current year
+        fuel_tech_p_by : dict
+            Fuel share per technology of every fueltype
+        resolution : TemporalResolution or RepresentativeDays
+            Temporal resolution of the service (if `None`, hourly)
+
+        Returns
+        -------
+        service_tech_after_switch : array
+            Service of every technology on a hourly basis, shape: (technology, 365, 24)
+
+        Note
+        ----
+        - The service of an installed technology is its diffusion share
+          of the total service. The added service is substracted of the
+          technologies of the replaced fueltypes proportionally to their
+          share of service within the fueltype.
+        - The reductions of every installed technology are applied
+          to all technologies at once
+        - If the service of a replaced technology falls below zero
+          (e.g. because of different regional efficiencies), it is set to zero
+        """
+        tech_index = {tech: tech_nr for tech_nr, tech in enumerate(technologies)}
+        service_tech_stacked = np.array(service_tech, dtype=float)
+
+        if resolution is None:
+            sum_y = lambda service: np.sum(service, axis=(1, 2))
+        else:
+            sum_y = resolution.sum_y
+
+        for tech_installed in self.installed_tech:
+            service_tech_installed_cy = self.diffusion_cy[tech_installed] * tot_service_h_cy
+            service_tech_stacked[tech_index[tech_installed]] = service_tech_installed_cy
+
+            # Total replaced service across the replaced fueltypes
+            tot_service_tech_instal_p = sum(
+                service_fueltype_cy_p[fueltype] * share_switched
+                for fueltype, share_switched in self.replaced_fueltypes[tech_installed])
+
+            if tot_service_tech_instal_p == 0:
+                continue
+
+            # Share of replaced service of every technology of the replaced fueltypes
+            reduction_p = np.zeros((len(technologies)))
+            replaced = np.zeros((len(technologies)), dtype=bool)
+            for fueltype, share_switched in self.replaced_fueltypes[tech_installed]:
+                service_fueltype_p = (service_fueltype_cy_p[fueltype] * share_switched) / tot_service_tech_instal_p
+
+                for tech in fuel_tech_p_by[fueltype]:
+                    reduction_p[tech_index[tech]] += service_fueltype_tech_cy_p[fueltype][tech] * service_fueltype_p
+                    replaced[tech_index[tech]] = True
+
+            service_tech_stacked -= reduction_p[:, np.newaxis, np.newaxis] * service_tech_installed_cy
+            service_tech_stacked[replaced & (sum_y(service_tech_stacked) < 0)] = 0
+
+        return service_tech_stacked
+
+def create_switch_plans(enduses, curr_yr, fuel_switches, service_switches, installed_tech, sig_param_tech, tech_increased_service, tech_decreased_share, tech_constant_share):
+    """Create switch plans of all enduses with switches
+
+    Parameters
+    ----------
+    enduses : list
+        Enduses of submodel
+    curr_yr : int
+        Current year
+
+    Returns
+    -------
+    switch_plans : dict
+        Switch plan of every enduse with a fuel or service switch
+
+    Note
+    ----
+    The other arguments are the switch assumptions of a submodel
+    as described in `SwitchPlan`
+    """
+    enduses_with_switch = set(
+        [switch['enduse'] for switch in fuel_switches] + [switch['enduse'] for switch in service_switches])
+
+    switch_plans = {}
+    for enduse in enduses:
+        if enduse in enduses_with_switch:
+            switch_plans[enduse] = SwitchPlan(
+                enduse,
+                curr_yr,
+                fuel_switches,
+                installed_tech,
+                sig_param_tech,
+                tech_increased_service,
+                tech_decreased_share,
+                tech_constant_share)
+
+    return switch_plans
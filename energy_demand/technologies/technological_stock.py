@@ -3,15 +3,93 @@
 import sys
 import numpy as np
 from energy_demand.technologies import technologies_related
+from energy_demand.basic import temporal_resolution
 from energy_demand.profiles import load_profile
+from energy_demand.profiles import profile_kernels
 #pylint: disable=I0011, C0321, C0301, C0103, C0325, R0902, R0913, no-member, E0213
 
+# Technology types whose efficiencies depend on the temperatures of a weather station
+TEMP_DEP_TECH_TYPES = ['heat_pump', 'hybrid_tech']
+
+# Codes of the technology types of compiled technology stocks
+TECH_TYPE_CODES = {
+    'regular_tech': 0,
+    'boiler_heating_tech': 1,
+    'storage_heating_electricity': 2,
+    'secondary_heating_electricity': 3,
+    'heat_pump': 4,
+    'hybrid': 5,
+    'dummy_tech': 6
+    }
+
+def create_shared_technologies(data, technologies):
+    """Create all technologies which do not depend on temperatures
+
+    Parameters
+    ----------
+    data : dict
+        All data
+    technologies : list
+        Technologies
+
+    Returns
+    -------
+    shared_technologies : dict
+        Technology object of every temperature independent technology {tech_name: Technology}
+
+    Note
+    ----
+    The technologies are identical for all enduses and weather stations
+    of a simulation year. They are created once and shared by reference
+    by all technology stocks, therefore the arrays are set read only.
+    """
+    shared_technologies = {}
+
+    for technology_name in technologies:
+        if technology_name in shared_technologies:
+            continue
+
+        tech_type = technologies_related.get_tech_type(
+            technology_name, data['assumptions']['technology_list'])
+
+        if tech_type not in TEMP_DEP_TECH_TYPES:
+            tech_object = Technology(
+                technology_name, data, None, None, None, None, tech_type)
+
+            if tech_type != 'dummy_tech':
+                tech_object.fueltypes_yh_p_cy.flags.writeable = False
+                tech_object.fueltype_share_yh_all_h.flags.writeable = False
+
+            shared_technologies[technology_name] = tech_object
+
+    return shared_technologies
+
+def get_all_stock_technologies(data):
+    """Get all technologies of the technology stocks of all submodels
+
+    Parameters
+    ----------
+    data : dict
+        All data
+
+    Returns
+    -------
+    technologies : list
+        Technologies
+    """
+    technologies = []
+    for prefix in ['rs', 'ss', 'is']:
+        for enduse in data['{}_all_enduses'.format(prefix)]:
+            technologies += data['assumptions']['{}_specified_tech_enduse_by'.format(prefix)][enduse]
+
+    return technologies
+
 class TechStock(object):
     """Class of a technological stock of a year of the residential model
 
     The main class of the residential model.
     """
-    def __init__(self, stock_name, data, temp_by, temp_cy, t_base_heating_by, potential_enduses, t_base_heating_cy, enduse_technologies):
+    def __init__(self, stock_name, data, temp_by, temp_cy, t_base_heating_by, potential_enduses, t_base_heating_cy, enduse_technologies, shared_technologies=None, resolution=None):
         """Constructor of technologies for residential sector
 
         Parameters
@@ -23,7 +101,7 @@ class TechStock(object):
         temp_by : array
             Base year temperatures
         temp_cy : int
-            Current year temperatures
+            Current year temperatures (at the temporal resolution)
         t_base_heating_by : float
             Base temperature for heating
         potential_enduses : list
@@ -32,14 +110,30 @@ class TechStock(object):
             Base temperature current year
         enduse_technologies : list
             Technologies of technology stock
+        shared_technologies : dict
+            Temperature independent technologies (see `create_shared_technologies`).
+            If not provided, they are created for this stock
+        resolution : TemporalResolution or RepresentativeDays
+            Temporal resolution of the hourly attributes (if `None`, hourly)
 
         Notes
         -----
         - The shapes are given for different enduse as technology may be used
           in different enduses and either a technology specific shape is
           assigned or an overall enduse shape
+        - The current year temperatures are given at the resolution,
+          the base year temperatures for every hour (the representative
+          days are clustered on the current year temperatures)
+        - Only heat pumps and hybrid technologies are created for the
+          temperatures of the stock (once, even if used in several enduses).
+          All other technologies are the shared technology objects
         """
         self.stock_name = stock_name
+        if resolution is None:
+            resolution = temporal_resolution.TemporalResolution('hourly')
+        self.resolution = resolution
+        self.stacked_attributes = {}
+        self.compiled_enduses = {}
 
         self.stock_technologies = self.create_tech_stock(
             data,
@@ -48,7 +142,9 @@ class TechStock(object):
             t_base_heating_by,
             t_base_heating_cy,
             potential_enduses,
-            enduse_technologies
+            enduse_technologies,
+            shared_technologies,
+            resolution
             )
 
     def get_attribute_tech_stock(self, technology, enduse, attribute_to_get):
@@ -73,7 +169,7 @@ class TechStock(object):
             return tech_obj.tech_type
 
     @classmethod
-    def create_tech_stock(cls, data, temp_by, temp_cy, t_base_heating_by, t_base_heating_cy, enduses, technologies):
+    def create_tech_stock(cls, data, temp_by, temp_cy, t_base_heating_by, t_base_heating_cy, enduses, technologies, shared_technologies=None, resolution=None):
         """Create technologies and add to dict with key_tuple
 
         Parameters
@@ -92,35 +188,51 @@ class TechStock(object):
             Enduses of technology stock
         technologies : list
             Technologies of technology stock
+        shared_technologies : dict
+            Temperature independent technologies
+        resolution : TemporalResolution or RepresentativeDays
+            Temporal resolution of the hourly attributes
         """
+        if shared_technologies is None:
+            shared_technologies = create_shared_technologies(
+                data, [tech for enduse in enduses for tech in technologies[enduse]])
+
         stock_technologies = {}
+        temp_dep_technologies = {}
 
         for enduse in enduses:
             for technology_name in technologies[enduse]:
-                #print("         ...{}   {}".format(sector, technology))
-                tech_type = technologies_related.get_tech_type(technology_name, data['assumptions']['technology_list'])
-
-                if tech_type == 'hybrid_tech':
-                    # Create hybrid technology object
-                    tech_object = HybridTechnology(
-                        enduse,
-                        technology_name,
-                        data,
-                        temp_by,
-                        temp_cy,
-                        t_base_heating_by,
-                        t_base_heating_cy
-                        )
+                if technology_name in shared_technologies:
+                    tech_object = shared_technologies[technology_name]
+                elif technology_name in temp_dep_technologies:
+                    tech_object = temp_dep_technologies[technology_name]
                 else:
-                    tech_object = Technology(
-                        technology_name,
-                        data,
-                        temp_by,
-                        temp_cy,
-                        t_base_heating_by,
-                        t_base_heating_cy,
-                        tech_type
-                    )
+                    tech_type = technologies_related.get_tech_type(
+                        technology_name, data['assumptions']['technology_list'])
+
+                    if tech_type == 'hybrid_tech':
+                        # Create hybrid technology object
+                        tech_object = HybridTechnology(
+                            technology_name,
+                            data,
+                            temp_by,
+                            temp_cy,
+                            t_base_heating_by,
+                            t_base_heating_cy,
+                            resolution
+                            )
+                    else:
+                        tech_object = Technology(
+                            technology_name,
+                            data,
+                            temp_by,
+                            temp_cy,
+                            t_base_heating_by,
+                            t_base_heating_cy,
+                            tech_type,
+                            resolution
+                        )
+                    temp_dep_technologies[technology_name] = tech_object
 
                 stock_technologies[(technology_name, enduse)] = tech_object
 
@@ -147,6 +259,8 @@ class TechStock(object):
 
         if attribute_to_get == 'service_distr_hybrid_h_p':
             return tech_object.service_distr_hybrid_h_p
+        elif attribute_to_get == 'fuel_distr_hybrid_h_p':
+            return tech_object.fuel_distr_hybrid_h_p
         elif attribute_to_get == 'eff_cy':
             return tech_object.eff_cy
         elif attribute_to_get == 'eff_by':
@@ -158,12 +272,208 @@ class TechStock(object):
         elif attribute_to_get == 'tech_high_temp_fueltype':
             return tech_object.tech_high_temp_fueltype
         elif attribute_to_get == 'fueltypes_yh_p_cy':
+            if tech_object.tech_type == 'hybrid':
+                return tech_object.calc_fueltypes_yh_p_cy()
             return tech_object.fueltypes_yh_p_cy
         elif attribute_to_get == 'fueltype_share_yh_all_h':
             return tech_object.fueltype_share_yh_all_h
         else:
             sys.exit("Error: Attribute not found")
 
+    def get_tech_attr_stacked(self, enduse, technologies, attribute_to_get, shape=None):
+        """Get an attribute of several technologies stacked along a technology axis
+
+        Parameters
+        ----------
+        enduse : str
+            Enduse
+        technologies : list
+            Technologies (order of technology axis)
+        attribute_to_get : str
+            Attribute of technology to get
+        shape : tuple
+            Shape to broadcast the attribute of every technology to (if `None`,
+            the attributes are broadcast to a common shape). The result is
+            a read only view which is only dense along the axes on which
+            any technology varies
+
+        Return
+        ------
+        tech_attributes : array
+            Attribute of every technology, shape: (technology, ...)
+
+        Note
+        ----
+        The stacked attributes are kept (read only) because they are the same
+        for all regions using this technology stock
+        """
+        key = (enduse, tuple(technologies), attribute_to_get, shape)
+
+        if key not in self.stacked_attributes:
+            values = [
+                self.get_tech_attr(enduse, tech, attribute_to_get) for tech in technologies]
+
+            # Common shape of all technologies (the scalar also allows
+            # a single technology with older numpy versions)
+            common_shape = np.broadcast(0, *values).shape
+            if shape is not None:
+                common_shape = (1, ) * (len(shape) - len(common_shape)) + common_shape
+
+            tech_attributes = np.zeros((len(values), ) + common_shape)
+            for tech_nr, value in enumerate(values):
+                tech_attributes[tech_nr] = value
+            tech_attributes.flags.writeable = False
+
+            # Broadcast without copying (e.g. scalar efficiencies of all hours)
+            if shape is not None:
+                tech_attributes = np.broadcast_to(
+                    tech_attributes, (len(values), ) + tuple(shape))
+
+            self.stacked_attributes[key] = tech_attributes
+
+        return self.stacked_attributes[key]
+
+    def compile_enduse(self, enduse, technologies):
+        """Get the compiled technology stock of the technologies of an enduse
+
+        Parameters
+        ----------
+        enduse : str
+            Enduse
+        technologies : list
+            Technologies (order of technology axis)
+
+        Return
+        ------
+        enduse_tech_stock : EnduseTechStock
+            Attributes of all technologies of the enduse
+
+        Note
+        ----
+        The compiled stocks are kept because they are the same
+        for all regions using this technology stock
+        """
+        key = (enduse, tuple(technologies))
+
+        if key not in self.compiled_enduses:
+            self.compiled_enduses[key] = EnduseTechStock(self, enduse, technologies)
+
+        return self.compiled_enduses[key]
+
+class EnduseTechStock(object):
+    """Attributes of the technologies of an enduse stacked
+    along a technology axis (order of `technologies`)
+
+    Parameters
+    ----------
+    tech_stock : TechStock
+        Technology stock
+    enduse : str
+        Enduse
+    technologies : list
+        Technologies
+
+    Note
+    ----
+    - Efficiencies are given at the temporal resolution of the stock,
+      shape: (technology, 365, 24) if hourly (if all efficiencies are
+      scalars, they are broadcast views of a (technology, 1, 1) array)
+    - `eff_by_y` is the sum of the efficiency attribute as defined
+      in the technology (the scalar efficiency or the sum over all hours)
+    - `fueltype_p` is the share of yearly fuel of every fueltype,
+      shape: (technology, fueltype)
+    - Technologies use a single fueltype (`single_fueltypes`), except
+      hybrid technologies which use two fueltypes (`hybrid_fueltypes`,
+      shape: (hybrid, 2)) with hourly shares (`hybrid_fueltypes_yh_p`,
+      shape: (hybrid, 2, 365, 24) if hourly)
+    - All arrays are read only
+    """
+    def __init__(self, tech_stock, enduse, technologies):
+        """Constructor
+        """
+        self.enduse = enduse
+        self.technologies = list(technologies)
+        self.tech_index = {tech: tech_nr for tech_nr, tech in enumerate(self.technologies)}
+
+        self.tech_types = np.array([
+            TECH_TYPE_CODES[tech_stock.get_attribute_tech_stock(tech, enduse, 'tech_type')]
+            for tech in self.technologies], dtype=int)
+
+        resolution = tech_stock.resolution
+        self.eff_by = tech_stock.get_tech_attr_stacked(enduse, self.technologies, 'eff_by', resolution.shape)
+        self.eff_cy = tech_stock.get_tech_attr_stacked(enduse, self.technologies, 'eff_cy', resolution.shape)
+
+        self.eff_by_y = np.zeros((len(self.technologies)))
+        for tech_nr, tech in enumerate(self.technologies):
+            eff_by = tech_stock.get_tech_attr(enduse, tech, 'eff_by')
+            if np.ndim(eff_by) == 2:
+                self.eff_by_y[tech_nr] = resolution.sum_y(eff_by)
+            else:
+                self.eff_by_y[tech_nr] = np.sum(eff_by)
+
+        self.fueltype_share_yh_all_h = tech_stock.get_tech_attr_stacked(
+            enduse, self.technologies, 'fueltype_share_yh_all_h')
+
+        self.fueltype_p = profile_kernels.normalise(self.fueltype_share_yh_all_h, axis=1)
+
+        # Fueltypes of single and hybrid technologies
+        self.single_tech_nrs = np.flatnonzero(~self.is_tech_type(['hybrid']))
+        self.single_fueltypes = np.argmax(self.fueltype_share_yh_all_h[self.single_tech_nrs], axis=1)
+
+        self.hybrid_tech_nrs = np.flatnonzero(self.is_tech_type(['hybrid']))
+        self.hybrid_fueltypes = np.zeros((len(self.hybrid_tech_nrs), 2), dtype=int)
+        self.hybrid_fueltypes_yh_p = np.zeros((len(self.hybrid_tech_nrs), 2) + resolution.shape)
+        for hybrid_nr, tech_nr in enumerate(self.hybrid_tech_nrs):
+            tech = self.technologies[tech_nr]
+            fuel_distr_hybrid_h_p = tech_stock.get_tech_attr(enduse, tech, 'fuel_distr_hybrid_h_p')
+
+            self.hybrid_fueltypes[hybrid_nr] = [
+                tech_stock.get_tech_attr(enduse, tech, 'tech_low_temp_fueltype'),
+                tech_stock.get_tech_attr(enduse, tech, 'tech_high_temp_fueltype')]
+            self.hybrid_fueltypes_yh_p[hybrid_nr, 0] = fuel_distr_hybrid_h_p['low']
+            self.hybrid_fueltypes_yh_p[hybrid_nr, 1] = fuel_distr_hybrid_h_p['high']
+
+        for array in [
+                self.tech_types, self.eff_by_y, self.fueltype_p, self.single_tech_nrs,
+                self.single_fueltypes, self.hybrid_tech_nrs, self.hybrid_fueltypes,
+                self.hybrid_fueltypes_yh_p]:
+            array.flags.writeable = False
+
+    def get_fueltypes_dh(self, day_nr):
+        """Get share of every fueltype of every technology for every hour of a day
+
+        Parameters
+        ----------
+        day_nr : int
+            Day of the temporal resolution
+
+        Return
+        ------
+        fueltypes_dh : array
+            Share of every fueltype, shape: (technology, fueltype, 24)
+        """
+        fueltypes_dh = np.zeros((len(self.technologies), self.fueltype_p.shape[1], 24))
+
+        fueltypes_dh[self.single_tech_nrs, self.single_fueltypes] = 1.0
+        fueltypes_dh[self.hybrid_tech_nrs[:, np.newaxis], self.hybrid_fueltypes] = self.hybrid_fueltypes_yh_p[:, :, day_nr]
+
+        return fueltypes_dh
+
+    def is_tech_type(self, tech_types):
+        """Criteria of every technology whether it is of one of the technology types
+
+        Parameters
+        ----------
+        tech_types : list
+            Technology types
+
+        Return
+        ------
+        crit_tech_type : array
+            Criteria for every technology, shape: (technology,)
+        """
+        return np.isin(self.tech_types, [TECH_TYPE_CODES[tech_type] for tech_type in tech_types])
+
 class Technology(object):
     """Technology Class
 
@@ -183,12 +493,19 @@ class Technology(object):
         Base temperature current year
     tech_type : str
         Technology type
+    resolution : TemporalResolution or RepresentativeDays
+        Temporal resolution of the current year temperatures (if `None`, hourly)
 
     Notes
     -----
-
+    - The temperatures are only used for heat pumps (`None` can be
+      passed for all other technologies)
+    - The base year temperatures are given for every hour. The base year
+      efficiencies of heat pumps are reduced to the temporal resolution
+    - The fueltype of single fueltype technologies is constant for all
+      hours, i.e. the shares are broadcast to any temporal resolution
     """
-    def __init__(self, tech_name, data, temp_by, temp_cy, t_base_heating, t_base_heating_cy, tech_type):
+    def __init__(self, tech_name, data, temp_by, temp_cy, t_base_heating, t_base_heating_cy, tech_type, resolution=None):
         """Contructor
         """
         if tech_name == 'dummy_tech':
@@ -217,6 +534,8 @@ class Technology(object):
                     temp_by,
                     data['assumptions']['technologies'][tech_name]['eff_by'],
                     t_base_heating)
+                if resolution is not None:
+                    self.eff_by = resolution.reduce(self.eff_by)
 
                 self.eff_cy = technologies_related.get_heatpump_eff(
                     temp_cy,
@@ -254,7 +573,8 @@ class Technology(object):
         Return
         ------
         fueltypes_yh : array
-            Fraction of fueltype for every hour and for all fueltypes
+            Fraction of fueltype for all fueltypes, shape: (fueltype, 1, 1)
+            (the fraction is the same for every day and hour)
 
         Note
         ----
@@ -263,9 +583,9 @@ class Technology(object):
 
         Example
         -------
-        array[fueltype_input][day][hour] = 1.0 # This specific hour is served with fueltype_input by 100%
+        array[fueltype_input][0][0] = 1.0 # Every hour is served with fueltype_input by 100%
         """
-        fueltypes_yh = np.zeros((len_fueltypes, 365, 24))
+        fueltypes_yh = np.zeros((len_fueltypes, 1, 1))
 
         # Insert for the single fueltype for every hour the share to 1.0
         fueltypes_yh[fueltype] = 1.0
@@ -277,8 +597,6 @@ class HybridTechnology(object):
 
     Parameters
     ----------
-    enduse : string
-        Enduse
     tech_name : string
         Name of hybrid technology
     data : dict
@@ -291,6 +609,8 @@ class HybridTechnology(object):
         Base temperature heating
     t_base_heating_cy : flaot
         Base temperature heating
+    resolution : TemporalResolution or RepresentativeDays
+        Temporal resolution of the current year temperatures (if `None`, hourly)
 
     Returns
     -------
@@ -301,10 +621,9 @@ class HybridTechnology(object):
     - The higher temperature technology is always an electric heat pump
     - The lower temperature (used for peak)
     """
-    def __init__(self, enduse, tech_name, data, temp_by, temp_cy, t_base_heating_by, t_base_heating_cy):
+    def __init__(self, tech_name, data, temp_by, temp_cy, t_base_heating_by, t_base_heating_cy, resolution=None):
         """
         """
-        self.enduse = enduse
         self.tech_name = tech_name
         self.tech_type = 'hybrid'
 
@@ -317,6 +636,8 @@ class HybridTechnology(object):
         self.eff_tech_low_by = data['assumptions']['technologies'][self.tech_low_temp]['eff_by']
         self.eff_tech_high_by = technologies_related.get_heatpump_eff(
             temp_by, data['assumptions']['technologies'][self.tech_high_temp]['eff_by'], t_base_heating_by)
+        if resolution is not None:
+            self.eff_tech_high_by = resolution.reduce(self.eff_tech_high_by)
 
         # Efficiencies
         self.eff_tech_low_cy = technologies_related.calc_eff_cy(
@@ -347,12 +668,7 @@ class HybridTechnology(object):
             data['assumptions']['technologies'][tech_name]['hybrid_cutoff_temp_high']
             )
 
-        # Shares of fueltype for every hour for multiple fueltypes
-        self.fueltypes_yh_p_cy = self.calc_hybrid_fueltypes_p(data['nr_of_fueltypes'])
-
-        self.fueltype_share_yh_all_h = load_profile.calc_fueltype_share_yh_all_h(
-            self.fueltypes_yh_p_cy)
-
+        # Base year efficiency (weighted according to service for hybrid technologies)
         self.eff_by = self.calc_hybrid_eff(
             self.eff_tech_low_by, self.eff_tech_high_by)
 
@@ -360,6 +676,13 @@ class HybridTechnology(object):
         self.eff_cy = self.calc_hybrid_eff(
             self.eff_tech_low_cy, self.eff_tech_high_cy)
 
+        # Shares of the low and high temperature fueltype for every hour (of every day)
+        self.nr_of_fueltypes = data['nr_of_fueltypes']
+        self.resolution = resolution
+        self.fuel_distr_hybrid_h_p = self.calc_hybrid_fueltypes_p(self.service_distr_hybrid_h_p)
+        self.fueltype_share_yh_all_h = self.calc_hybrid_fueltype_share_yh_all_h(
+            self.fuel_distr_hybrid_h_p)
+
     @classmethod
     def service_hybrid_tech_low_high_h_p(cls, temp_cy, hybrid_cutoff_temp_low, hybrid_cutoff_temp_high):
         """Calculate fraction of service for every hour within each hour
@@ -403,7 +726,7 @@ class HybridTechnology(object):
 
         return tech_low_high_p
 
-    def calc_hybrid_eff(self, eff_tech_low, eff_tech_high):
+    def calc_hybrid_eff(self, eff_tech_low, eff_tech_high, service_distr_hybrid_h_p=None):
         """Calculate efficiency for every hour for hybrid technology
 
         The weighted efficiency for every hour is calculated based
@@ -415,6 +738,9 @@ class HybridTechnology(object):
             Efficiency of technology operating at lower temperatures
         eff_tech_high : float
             Efficiency of technology operating at higher temperatures
+        service_distr_hybrid_h_p : dict, default=None
+            Fraction of service of the lower and higher temperature technology
+            (if `None`, ``self.service_distr_hybrid_h_p``)
 
         Return
         ------
@@ -425,48 +751,96 @@ class HybridTechnology(object):
         -----
         It is assumed that the temperature operating at higher temperatures is a heat pump
         """
+        if service_distr_hybrid_h_p is None:
+            service_distr_hybrid_h_p = self.service_distr_hybrid_h_p
+
         # (Service fraction high tech * efficiency) + (Service fraction low tech * efficiency) (all are 365,24 arrays)
-        eff_hybrid_yh = (self.service_distr_hybrid_h_p['high'] * eff_tech_high) + (self.service_distr_hybrid_h_p['low'] * eff_tech_low)
+        eff_hybrid_yh = (service_distr_hybrid_h_p['high'] * eff_tech_high) + (service_distr_hybrid_h_p['low'] * eff_tech_low)
 
         return eff_hybrid_yh
 
-    def calc_hybrid_fueltypes_p(self, nr_fueltypes):
-        """Calculate share of fueltypes for every hour for hybrid technology
+    def calc_hybrid_fueltypes_p(self, service_distr_hybrid_h_p):
+        """Calculate share of the two fueltypes for every hour for hybrid technology
 
         Parameters
-        -----------
-        nr_fueltypes : int
-            Number of fuels
+        ----------
+        service_distr_hybrid_h_p : dict
+            Fraction of service of the lower and higher temperature
+            technology (of the same days as the base year efficiency)
 
         Return
         ------
-        fueltypes_yh : array
-            The share of fuel given for the fueltypes (fueltpes, days, hours)
+        fuel_distr_hybrid_h_p : dict
+            Share of fuel of the lower and higher temperature
+            technology for every hour {'low': array, 'high': array}
 
         Note
         -----
         -   The distribution to different fueltypes is only valid within an hour,
             i.e. the fuel is not distributed across the day. This means that within
-            an hour the array always sums up to 1 (=100%) across the fueltypes.
+            an hour the shares always sum up to 1 (=100%).
 
         -   The higer temperature technolgy is always a heat pump
 
         -   Fueltypes of both technologies must be different
-        """
-        # Calculate hybrid efficiency
-        hybrid_eff_yh = self.calc_hybrid_eff(self.eff_tech_low_by, self.eff_tech_high_by)
 
-        # Calculate fuel fractions
-        fuel_low_h = self.service_distr_hybrid_h_p['low'] / hybrid_eff_yh
-        fuel_high_h = self.service_distr_hybrid_h_p['high'] / hybrid_eff_yh
+        -   Only the shares of the two fueltypes of the hybrid technology are
+            stored (`tech_low_temp_fueltype` and `tech_high_temp_fueltype`).
+            The shares of all fueltypes are built with `calc_fueltypes_yh_p_cy`
+        """
+        # Calculate fuel fractions (with base year hybrid efficiency)
+        fuel_low_h = service_distr_hybrid_h_p['low'] / self.eff_by
+        fuel_high_h = service_distr_hybrid_h_p['high'] / self.eff_by
 
         tot_fuel_h = fuel_low_h + fuel_high_h
 
         # Assign share of total fuel for respective fueltypes
-        fueltypes_yh = np.zeros((nr_fueltypes, 365, 24))
-        _var = np.divide(1.0, tot_fuel_h)
+        return {
+            'low': profile_kernels.safe_divide(fuel_low_h, tot_fuel_h),
+            'high': profile_kernels.safe_divide(fuel_high_h, tot_fuel_h)}
+
+    def calc_hybrid_fueltype_share_yh_all_h(self, fuel_distr_hybrid_h_p):
+        """Calculate fuel share of every fueltype over all hours
+
+        Parameters
+        ----------
+        fuel_distr_hybrid_h_p : dict
+            Share of fuel of the lower and higher temperature technology for every hour
+
+        Returns
+        -------
+        fueltype_share_yh_all_h : array
+            Sum of fuel share of every fueltype for every hour
+
+        Note
+        ----
+        The shares are weighted with the number of hours of the
+        cells of the temporal resolution
+        """
+        if self.resolution is None:
+            sum_y = np.sum
+        else:
+            sum_y = self.resolution.sum_y
+
+        fueltype_share_yh_all_h = np.zeros((self.nr_of_fueltypes))
+        fueltype_share_yh_all_h[self.tech_low_temp_fueltype] = sum_y(fuel_distr_hybrid_h_p['low'])
+        fueltype_share_yh_all_h[self.tech_high_temp_fueltype] = sum_y(fuel_distr_hybrid_h_p['high'])
+
+        fueltype_share_yh_all_h *= (1.0 / 8760)
+
+        return fueltype_share_yh_all_h
+
+    def calc_fueltypes_yh_p_cy(self):
+        """Calculate share of all fueltypes for every hour
+
+        Return
+        ------
+        fueltypes_yh : array
+            The share of fuel given for the fueltypes (fueltpes, days, hours)
+        """
+        fueltypes_yh = np.zeros((self.nr_of_fueltypes, ) + np.shape(self.fuel_distr_hybrid_h_p['low']))
 
-        fueltypes_yh[self.tech_low_temp_fueltype] = _var * fuel_low_h
-        fueltypes_yh[self.tech_high_temp_fueltype] = _var * fuel_high_h
+        fueltypes_yh[self.tech_low_temp_fueltype] = self.fuel_distr_hybrid_h_p['low']
+        fueltypes_yh[self.tech_high_temp_fueltype] = self.fuel_distr_hybrid_h_p['high']
 
         return fueltypes_yh
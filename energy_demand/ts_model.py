@@ -9,7 +9,7 @@ from energy_demand.profiles import generic_shapes
 class OtherModel(object):
     """Other Model
     """
-    def __init__(self, region_object, enduse):
+    def __init__(self, region_object, enduse, resolution):
         """Constructor
 
         Parameters
@@ -22,9 +22,12 @@ class OtherModel(object):
             Enduse
         sector : string
             Service sector
+        resolution : TemporalResolution
+            Temporal resolution of the model run
         """
         self.region_name = region_object.region_name
         self.enduse = enduse
+        self.resolution = resolution
 
         # Transportation + agriculture
         self.fuels_reg = region_object.ts_fuels # + region_object.ag_fuels
@@ -34,6 +37,6 @@ class OtherModel(object):
     def create_enduse(self):
         """Create enduse
         """
-        model_object = generic_shapes.genericFlatEnduse(self.fuels_reg)
+        model_object = generic_shapes.genericFlatEnduse(self.fuels_reg, self.resolution)
 
         return model_object
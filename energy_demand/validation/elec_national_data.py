@@ -2,7 +2,6 @@
 # pylint: disable=I0011,C0321,C0301,C0103,C0325,no-member
 import os
 import sys
-import csv
 import numpy as np
 import matplotlib.pyplot as plt
 from energy_demand.basic import date_handling
@@ -44,9 +43,25 @@ def get_month_from_string(month_string):
 
     return int(month_int)
 
-def read_raw_elec_2015_data(path_to_csv):
+def read_raw_elec_2015_data(path_to_csv, path_cache=None):
     """Read in national electricity values provided in MW and convert to GWh
 
+    Parameters
+    ----------
+    path_to_csv : str
+        Path to csv file with half hourly national electricity data
+    path_cache : str
+        Path to binary cache file (.npz). If provided, the parsed
+        data is stored there and read from it as long as the cache
+        is newer than the csv file
+
+    Returns
+    -------
+    elec_data_INDO : array
+        Hourly national demand (INDO) [GWh], shape: (365, 24)
+    elec_data_ITSDO : array
+        Hourly transmission system demand (ITSDO) [GWh], shape: (365, 24)
+
     Note
     -----
     Half hourly measurements are aggregated to hourly values
@@ -54,99 +69,110 @@ def read_raw_elec_2015_data(path_to_csv):
     Necessary data preparation: On 29 March and 25 Octobre there are 46 and 48 values because of the changing of the clocks
     The 25 Octobre value is omitted, the 29 March hour interpolated in the csv file
     """
+    if path_cache and os.path.isfile(path_cache) and (
+            os.path.getmtime(path_cache) >= os.path.getmtime(path_to_csv)):
+        cached_data = np.load(path_cache)
+        return cached_data['elec_data_INDO'], cached_data['elec_data_ITSDO']
+
     year = 2015
 
     elec_data_INDO = np.zeros((365, 24))
     elec_data_ITSDO = np.zeros((365, 24))
 
-    # Read CSV file
-    with open(path_to_csv, 'r') as csvfile:
-        read_lines = csv.reader(csvfile, delimiter=',') # Read line
-        _headings = next(read_lines) # Skip first row
+    # Read CSV file (INDO - National Demand, ITSDO - Transmission System Demand)
+    raw_data = np.loadtxt(
+        path_to_csv, delimiter=',', skiprows=1, usecols=(0, 2, 4), dtype=str, ndmin=2)
+    nr_of_hours = raw_data.shape[0] // 2
 
-        hour = 0
-        counter_half_hour = 0
+    # Pair first and second half hour. Convert MW to GWH (input is MW
+    # aggregated for two half hourly measurements, therfore divide by 0.5)
+    half_hour_demand = raw_data[:nr_of_hours * 2, 1:].astype(float)
+    hour_elec_demand_gwh = unit_conversions.convert_mw_gwh(
+        half_hour_demand.reshape(nr_of_hours, 2, 2).sum(axis=1), 0.5)
 
-        for line in read_lines:
-            month = get_month_from_string(line[0].split("-")[1])
-            day = int(line[0].split("-")[0])
+    # Get yearday of every hour (from date of second half hour)
+    dates, date_index = np.unique(
+        raw_data[1:nr_of_hours * 2:2, 0], return_inverse=True)
+    yeardays = np.array([
+        date_handling.convert_date_to_yearday(
+            year,
+            get_month_from_string(date_string.split("-")[1]),
+            int(date_string.split("-")[0])) for date_string in dates], dtype=int)
 
-            # Get yearday
-            yearday = date_handling.convert_date_to_yearday(year, month, day)
+    yearday = yeardays[date_index]
+    hour = np.arange(nr_of_hours) % 24
 
-            if counter_half_hour == 1:
-                counter_half_hour = 0
+    elec_data_INDO[yearday, hour] = hour_elec_demand_gwh[:, 0]
+    elec_data_ITSDO[yearday, hour] = hour_elec_demand_gwh[:, 1]
 
-                # Sum value of first and second half hour
-                hour_elec_demand_INDO = half_hour_demand_INDO + float(line[2]) # INDO - National Demand
-                hour_elec_demand_ITSDO = half_hour_demand_ITSDO + float(line[4]) # ITSDO - Transmission System Demand
+    if path_cache:
+        np.savez(path_cache, elec_data_INDO=elec_data_INDO, elec_data_ITSDO=elec_data_ITSDO)
 
-                # Convert MW to GWH (input is MW aggregated for two half
-                # hourly measurements, therfore divide by 0.5)
-                hour_elec_demand_gwh_INDO = unit_conversions.convert_mw_gwh(hour_elec_demand_INDO, 0.5)
-                hour_elec_demand_gwh_ITSDO = unit_conversions.convert_mw_gwh(hour_elec_demand_ITSDO, 0.5)
+    return elec_data_INDO, elec_data_ITSDO
 
-                # Add to array
-                #print(" sdf  {}  {}  {}  ".format(yearday, hour, hour_elec_demand_gwh))
-                elec_data_INDO[yearday][hour] = hour_elec_demand_gwh_INDO
-                elec_data_ITSDO[yearday][hour] = hour_elec_demand_gwh_ITSDO
+def calc_validation_metrics(data_real, data_calculated):
+    """Calculate comparison metrics of real and modelled hourly values
 
-                hour += 1
-            else:
-                counter_half_hour += 1
+    Parameters
+    ----------
+    data_real : array
+        Real values, shape: (365, 24)
+    data_calculated : array
+        Modelled values, shape: (365, 24)
 
-                half_hour_demand_INDO = float(line[2]) # INDO - National Demand
-                half_hour_demand_ITSDO = float(line[4]) # Transmission System Demand
+    Returns
+    -------
+    metrics : dict
+        rmse : RMSE of all hours
+        diff_percent_h : Modelled values in % of real values, shape: (365, 24)
+        bias_h : Mean difference (real - modelled) of every hour, shape: (24,)
+        peak_h_error : Difference of the maximum hours (real - modelled)
+        peak_d_error : Difference of the maximum days (real - modelled)
 
-            if hour == 24:
-                hour = 0
+    Note
+    ----
+    RMSE fit criteria : Lower values of RMSE indicate better fit
+    """
+    diff_percent_h = np.zeros((365, 24))
+    np.divide(100 * data_calculated, data_real, out=diff_percent_h, where=data_real != 0)
 
-    return elec_data_INDO, elec_data_ITSDO
+    metrics = {
+        'rmse': basic_functions.rmse(data_real, data_calculated),
+        'diff_percent_h': diff_percent_h,
+        'bias_h': np.mean(data_real - data_calculated, axis=0),
+        'peak_h_error': np.max(data_real) - np.max(data_calculated),
+        'peak_d_error': np.max(np.sum(data_real, axis=1)) - np.max(np.sum(data_calculated, axis=1))
+        }
 
-def compare_results(name_fig, data, y_real_array_INDO, y_real_array_ITSDO, y_factored_INDO, y_calculated_array, title_left, days_to_plot):
+    return metrics
+
+def compare_results(name_fig, data, y_real_array_INDO, y_real_array_ITSDO, y_factored_INDO, y_calculated_array, title_left, days_to_plot, max_points=2000):
     """Compare national electrictiy demand data with model results
 
     Note
     ----
+    The RMSE is calculated with all hours, the plotted
+    lines are downsampled to `max_points`
+
     RMSE fit criteria : Lower values of RMSE indicate better fit
     https://stackoverflow.com/questions/17197492/root-mean-square-error-in-python
     """
     print("...compare elec results")
-    nr_of_h_to_plot = len(days_to_plot) * 24
-
-    x = range(nr_of_h_to_plot)
-
-    y_real_INDO = []
-    y_real_ITSDO = []
-    y_real_INDO_factored = []
-    y_calculated = []
-
-    for day in days_to_plot:
-        for hour in range(24):
-            y_real_INDO.append(y_real_array_INDO[day][hour])
-            y_real_ITSDO.append(y_real_array_ITSDO[day][hour])
-            y_calculated.append(y_calculated_array[day][hour])
-            y_real_INDO_factored.append(y_factored_INDO[day][hour])
-
-    # -------------------
-    # Smoothing algorithm
-    # -------------------
-    #y_calculated = savitzky_golay(y_calculated, 3, 3) # window size 51, polynomial order 3
+    y_real_INDO = y_real_array_INDO[days_to_plot].ravel()
+    y_real_ITSDO = y_real_array_ITSDO[days_to_plot].ravel()
+    y_real_INDO_factored = y_factored_INDO[days_to_plot].ravel()
+    y_calculated = y_calculated_array[days_to_plot].ravel()
 
     # RMSE
-    rmse_val_INDO = basic_functions.rmse(np.array(y_real_INDO), np.array(y_calculated))
-    rmse_val_ITSDO = basic_functions.rmse(np.array(y_real_ITSDO), np.array(y_calculated))
-    rmse_val_corrected = basic_functions.rmse(np.array(y_real_INDO_factored), np.array(y_calculated))
-    rmse_val_own_factor_correction = basic_functions.rmse(np.array(y_real_INDO), np.array(y_calculated))
-
-    # R squared
-    #slope, intercept, r_value, p_value, std_err = stats.linregress(np.array(y_real_INDO), np.array(y_calculated))
+    rmse_val_INDO = basic_functions.rmse(y_real_INDO, y_calculated)
+    rmse_val_ITSDO = basic_functions.rmse(y_real_ITSDO, y_calculated)
+    rmse_val_corrected = basic_functions.rmse(y_real_INDO_factored, y_calculated)
 
-    # plot points
-    plt.plot(x, y_real_INDO, color='black', label='TD') #'ro', markersize=1
-    plt.plot(x, y_real_ITSDO, color='grey', label='TSD') #'ro', markersize=1
-    plt.plot(x, y_real_INDO_factored, color='green', label='TD_factored') #'ro', markersize=1
-    plt.plot(x, y_calculated, color='red', label='modelled') #'ro', markersize=1
+    # plot points (downsampled to the resolution of the figure)
+    plt.plot(*plotting_program.downsample(y_real_INDO, max_points), color='black', label='TD') #'ro', markersize=1
+    plt.plot(*plotting_program.downsample(y_real_ITSDO, max_points), color='grey', label='TSD') #'ro', markersize=1
+    plt.plot(*plotting_program.downsample(y_real_INDO_factored, max_points), color='green', label='TD_factored') #'ro', markersize=1
+    plt.plot(*plotting_program.downsample(y_calculated, max_points), color='red', label='modelled') #'ro', markersize=1
 
     plt.xlim([0, 8760])
     plt.margins(x=0) #remove white space
@@ -164,28 +190,21 @@ def compare_results(name_fig, data, y_real_array_INDO, y_real_array_ITSDO, y_fac
 
     #plt.show()
 
-def compare_peak(name_fig, data, validation_elec_data_2015, peak_all_models_all_enduses_fueltype):
+def compare_peak(name_fig, data, validation_elec_data_2015, modelled_peak_dh):
     """Compare Peak electricity day with calculated peak energy demand
     """
     print("...compare elec peak results")
     # -------------------------------
     # Find maximumg peak in real data
     # -------------------------------
-    max_h_year = 0
-    max_day = "None"
-
-    for day in range(365):
-        max_h_day = np.max(validation_elec_data_2015[day])
-
-        if max_h_day > max_h_year:
-            max_h_year = max_h_day
-            max_day = day
+    max_day = int(np.argmax(np.max(validation_elec_data_2015, axis=1)))
+    max_h_year = np.max(validation_elec_data_2015[max_day])
 
     print("Max Peak Day:                    " + str(max_day))
     print("max_h_year (real):               " + str(max_h_year))
-    print("max_h_year (modelled):           " + str(np.max(peak_all_models_all_enduses_fueltype)))
+    print("max_h_year (modelled):           " + str(np.max(modelled_peak_dh)))
     print("Fuel max peak day (real):        " + str(np.sum(validation_elec_data_2015[max_day])))
-    print("Fuel max peak day (modelled):    " + str(np.sum(peak_all_models_all_enduses_fueltype)))
+    print("Fuel max peak day (modelled):    " + str(np.sum(modelled_peak_dh)))
 
     # -------------------------------
     # Compare values
@@ -194,7 +213,7 @@ def compare_peak(name_fig, data, validation_elec_data_2015, peak_all_models_all_
 
     plt.figure(figsize=plotting_program.cm2inch(8, 8))
 
-    plt.plot(x, peak_all_models_all_enduses_fueltype, color='red', label='modelled')
+    plt.plot(x, modelled_peak_dh, color='red', label='modelled')
     plt.plot(x, validation_elec_data_2015[max_day], color='green', label='real')
 
     # Y-axis ticks
@@ -214,25 +233,9 @@ def compare_peak(name_fig, data, validation_elec_data_2015, peak_all_models_all_
 def compare_results_hour_boxplots(name_fig, data, data_real, data_calculated):
     """Calculate differences for every hour and plot according to hour
     for the full year
-
-
     """
-    data_h_full_year = {}
-
-    for i in range(24):
-        data_h_full_year[i] = []
-
-    for yearday_python in range(365):
-        for hour in range(24):
-
-            # Calculate difference in electricity use
-            diff = data_real[yearday_python][hour] - data_calculated[yearday_python][hour]
-
-            # Differenc in % of real value
-            diff_percent = (100 / data_real[yearday_python][hour]) * data_calculated[yearday_python][hour]
-            # Add differene to list of specific hour
-
-            data_h_full_year[hour].append(diff_percent)
+    # Modelled electricity use in % of real value for every hour
+    diff_percent_h = calc_validation_metrics(data_real, data_calculated)['diff_percent_h']
 
     fig = plt.figure()
 
@@ -242,11 +245,8 @@ def compare_results_hour_boxplots(name_fig, data, data_real, data_calculated):
     ax.yaxis.grid(True, linestyle='-', which='major', color='lightgrey', alpha=0.5)
     ax.axhline(y=100, xmin=0, xmax=3, c="red", linewidth=1, zorder=0)
 
-    diff_values = []
-    for hour in range(24):
-        diff_values.append(np.asarray(data_h_full_year[hour]))
-
-    ax.boxplot(diff_values)
+    # One box for every hour (column)
+    ax.boxplot(diff_percent_h)
 
     plt.xticks(range(1, 25), range(24))
     #plt.margins(x=0) #remove white space
@@ -10,6 +10,44 @@ from energy_demand.basic import unit_conversions
 from energy_demand.plotting import plotting_program
 from energy_demand.basic import basic_functions
 
+def join_lad_demand(lad_infos_shapefile, reg_fuel_y, reg_index, fueltype, lu_reg):
+    """Join the real electricity demand of LADs with the modelled demand
+
+    Parameters
+    ----------
+    lad_infos_shapefile : dict
+        Infos of shapefile (dbf / csv)
+    reg_fuel_y : array
+        Yearly modelled fuel, shape: (fueltype, region)
+    reg_index : dict
+        Position of every region in `reg_fuel_y`
+    fueltype : int
+        Fueltype to compare
+    lu_reg : list
+        Modelled regions
+
+    Returns
+    -------
+    real_demand : dict
+        Real demand of every region which is in the shapefile
+    modelled_demand : dict
+        Modelled demand of the same regions
+    """
+    real_demand = {}
+    modelled_demand = {}
+
+    # Match ECUK sub-regional demand with geocode
+    for region_name in lu_reg:
+        if region_name in lad_infos_shapefile:
+
+            # --Sub Regional Electricity
+            #value_gwh = unit_conversions.convert_ktoe_gwh(lad_infos_shapefile[region_name]['elec_tot15']) # Add data (CHECK UNIT: TODO)TODO
+            real_demand[region_name] = lad_infos_shapefile[region_name]['elec_tot15'] #TODO: CHECK UNIT
+
+            modelled_demand[region_name] = reg_fuel_y[fueltype, reg_index[region_name]]
+
+    return real_demand, modelled_demand
+
 def compare_lad_regions(fig_name, data, lad_infos_shapefile, model_run_object, nr_of_fueltypes, lu_fueltypes, lu_reg):
     """Compare gas/elec demand for LADs
 
@@ -26,22 +64,14 @@ def compare_lad_regions(fig_name, data, lad_infos_shapefile, model_run_object, n
     """
     print("..Validation of spatial disaggregation")
     result_dict = {}
-    result_dict['REAL_electricity_demand'] = {}
-    result_dict['modelled_electricity_demand'] = {}
-
-    # Match ECUK sub-regional demand with geocode
-    for region_name in lu_reg:
-
-        # Iterate loaded data
-        for reg_csv_geocode in lad_infos_shapefile:
-            if reg_csv_geocode == region_name:
-
-                # --Sub Regional Electricity
-                #value_gwh = unit_conversions.convert_ktoe_gwh(lad_infos_shapefile[reg_csv_geocode]['elec_tot15']) # Add data (CHECK UNIT: TODO)TODO
-                result_dict['REAL_electricity_demand'][region_name] = lad_infos_shapefile[reg_csv_geocode]['elec_tot15'] #TODO: CHECK UNIT
 
-                all_fueltypes_reg_demand = model_run_object.get_regional_yh(nr_of_fueltypes, reg_csv_geocode)
-                result_dict['modelled_electricity_demand'][region_name] = np.sum(all_fueltypes_reg_demand[lu_fueltypes['electricity']])
+    # Real and modelled yearly demand of all LADs
+    result_dict['REAL_electricity_demand'], result_dict['modelled_electricity_demand'] = join_lad_demand(
+        lad_infos_shapefile,
+        model_run_object.get_regional_y(),
+        model_run_object.reg_index,
+        lu_fueltypes['electricity'],
+        lu_reg)
 
     # -----------------
     # Sort results according to size
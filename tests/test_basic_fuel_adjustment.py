@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Testing file ``fuel_adjustment.py``
+"""Testing"""
+import numpy as np
+from energy_demand.basic import fuel_adjustment
+
+def test_get_fuel_multiplier():
+    """Testing"""
+    assumptions = {
+        'enduse_space_heating': ['heating'],
+        'enduse_space_cooling': ['cooling'],
+        'savings_smart_meter': {'heating': 0.1},
+        'smart_meter_diff_params': {'sig_midpoint': 0, 'sig_steeppness': 1},
+        'smart_meter_p_by': 0.2,
+        'smart_meter_p_ey': 0.8,
+        'other_enduse_mode_info': {'diff_method': 'linear'}}
+    sim_param = {'base_yr': 2015, 'curr_yr': 2015, 'end_yr': 2050, 'sim_period_yrs': 36}
+
+    national_factors = fuel_adjustment.create_national_factors(
+        ['heating', 'cooling'], assumptions, {'heating': 0.9, 'cooling': 1.0}, sim_param)
+
+    # No smart meter and specific change in base year
+    assert national_factors['heating'] == {'smart_meter': 1, 'specific_change': 1}
+
+    fuel_factors = fuel_adjustment.get_fuel_factors(
+        'heating', national_factors, assumptions, 0.8, 1.2, 1.5)
+    assert fuel_factors['climate_change'] == 0.8
+    assert fuel_factors['scenario_driver'] == 1.5
+
+    fuel = np.array([10.0, 0, 5.0])
+    np.testing.assert_allclose(
+        fuel * fuel_adjustment.get_fuel_multiplier(fuel_factors), fuel * 0.8 * 1.5)
+
+    fuel_factors = fuel_adjustment.get_fuel_factors(
+        'cooling', national_factors, assumptions, 0.8, 1.2, 1.0)
+    assert fuel_adjustment.get_fuel_multiplier(fuel_factors) == 1.2
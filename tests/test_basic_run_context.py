@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Testing file ``run_context.py``
+"""Testing"""
+import pickle
+import pytest
+import numpy as np
+from energy_demand.basic import run_context
+from energy_demand.basic import scenario_drivers
+from energy_demand.technologies import diffusion_technologies as diffusion
+
+def test_create_run_context():
+    """Testing"""
+    assumptions = {key: {} for key in run_context.ENDUSE_ASSUMPTIONS}
+    assumptions['enduse_space_heating'] = ['enduse']
+    assumptions['other_enduse_mode_info'] = {'diff_method': 'linear'}
+    assumptions['savings_smart_meter'] = {}
+    assumptions['enduse_overall_change_ey'] = {
+        'rs_model': {'enduse': 0.5}, 'ss_model': {'enduse': 1.0}, 'is_model': {'enduse': 1.0}}
+    for prefix in ['rs', 'ss', 'is']:
+        for key in [
+                'fuel_switches', 'service_switches', 'fuel_tech_p_by', 'tech_increased_service',
+                'tech_decreased_share', 'tech_constant_share', 'installed_tech', 'sig_param_tech']:
+            assumptions['{}_{}'.format(prefix, key)] = {}
+    assumptions['not_used_in_enduses'] = {}
+
+    data = {
+        'sim_param': {'base_yr': 2015, 'curr_yr': 2020, 'end_yr': 2050, 'sim_period_yrs': 36},
+        'lu_fueltype': {'gas': 1, 'heat': 7},
+        'nr_of_fueltypes': 8,
+        'rs_all_enduses': ['enduse'],
+        'ss_all_enduses': ['enduse'],
+        'is_all_enduses': ['enduse'],
+        'assumptions': assumptions,
+        'non_regional_profile_stock': None,
+        'switch_plans': {'rs_model': {}, 'ss_model': {}, 'is_model': {}},
+        'scenario_driver_ratios': {
+            submodel: scenario_drivers.DriverRatios(
+                [2015, 2020, 2030], ['reg'], ['enduse'], np.array([[[1.0]], [[2.0]], [[3.0]]]))
+            for submodel in run_context.SUBMODELS}}
+
+    context = run_context.create_run_context(data)
+
+    assert context.lu_fueltype['heat'] == 7
+    assert 'not_used_in_enduses' not in context.assumptions
+    assert context.submodels['rs_submodel'].driver_ratios.years == [2015, 2020]
+    assert context.submodels['rs_submodel'].driver_ratios.get_ratio(2020, 'reg', 'enduse') == 2.0
+    assert context.submodels['rs_submodel'].national_fuel_factors['enduse'] == {
+        'smart_meter': 1, 'specific_change': diffusion.linear_diff(2015, 2020, 1.0, 0.5, 36)}
+
+    # Immutable and picklable
+    with pytest.raises(AttributeError):
+        context.curr_yr = 2030
+    assert pickle.loads(pickle.dumps(context)).curr_yr == context.curr_yr
@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Testing file ``scenario_drivers.py``
+"""Testing"""
+import numpy as np
+from energy_demand.basic import scenario_drivers
+
+class DummyDwellingStock(object):
+    """Dwelling stock with scenario driver of one enduse"""
+    def __init__(self, rs_space_heating):
+        self.rs_space_heating = rs_space_heating
+
+def test_create_driver_ratios():
+    """Testing"""
+    data = {
+        'sim_param': {'base_yr': 2015, 'sim_period': range(2015, 2021, 5)},
+        'lu_reg': {'reg_a': 'reg_a', 'reg_b': 'reg_b'},
+        'rs_all_enduses': ['rs_space_heating', 'rs_lighting'],
+        'ss_all_enduses': [],
+        'is_all_enduses': ['is_motors', 'is_other'],
+        'GVA': {2015: {'reg_a': 2.0, 'reg_b': 0.0}, 2020: {'reg_a': 3.0, 'reg_b': 1.0}},
+        'population': {2015: {'reg_a': 4.0, 'reg_b': 1.0}, 2020: {'reg_a': 2.0, 'reg_b': 1.0}},
+        'rs_dw_stock': {
+            'reg_a': {2015: DummyDwellingStock(10.0), 2020: DummyDwellingStock(15.0)},
+            'reg_b': {2015: DummyDwellingStock(10.0), 2020: DummyDwellingStock(5.0)}},
+        'assumptions': {'scenario_drivers': {'is_submodule': {'is_motors': ['GVA', 'population']}}}}
+
+    driver_ratios = scenario_drivers.create_driver_ratios(data)
+
+    # Dwelling stock drivers (enduses without attribute are not changed)
+    rs_ratios = driver_ratios['rs_submodel']
+    assert rs_ratios.get_ratio(2020, 'reg_a', 'rs_space_heating') == 1.5
+    assert rs_ratios.get_ratio(2020, 'reg_b', 'rs_space_heating') == 0.5
+    assert rs_ratios.get_ratio(2020, 'reg_a', 'rs_lighting') == 1.0
+    np.testing.assert_array_equal(rs_ratios.ratios[0], 1.0)
+
+    # Product of data drivers (base year value of zero is not changed)
+    is_ratios = driver_ratios['is_submodel']
+    assert is_ratios.get_ratio(2020, 'reg_a', 'is_motors') == 0.75
+    assert is_ratios.get_ratio(2020, 'reg_b', 'is_motors') == 1.0
+    assert is_ratios.get_ratio(2020, 'reg_a', 'is_other') == 1.0
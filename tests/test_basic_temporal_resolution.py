@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Testing file ``temporal_resolution.py``
+"""Testing"""
+import numpy as np
+from energy_demand.basic import temporal_resolution
+
+def test_convert_duration_to_h():
+    """Testing"""
+    assert temporal_resolution.convert_duration_to_h('P0H') == 0
+    assert temporal_resolution.convert_duration_to_h('P8759H') == 8759
+    assert temporal_resolution.convert_duration_to_h('P1DT2H') == 26
+
+def test_aggregate():
+    """Testing"""
+    fuel_yh = np.random.rand(2, 365, 24)
+
+    daily = temporal_resolution.TemporalResolution('daily')
+    np.testing.assert_allclose(daily.aggregate(fuel_yh), fuel_yh.sum(axis=2))
+
+    monthly = temporal_resolution.TemporalResolution('monthly', 2015)
+    fuel_monthly = monthly.aggregate(fuel_yh)
+    assert fuel_monthly.shape == (2, 12)
+    np.testing.assert_allclose(fuel_monthly[:, 0], fuel_yh[:, :31].sum(axis=(1, 2)))
+    np.testing.assert_allclose(fuel_monthly.sum(axis=1), fuel_yh.sum(axis=(1, 2)))
+
+def test_reduce_expand():
+    """Testing"""
+    fuel_yh = np.random.rand(2, 365, 24)
+
+    hourly = temporal_resolution.TemporalResolution('hourly')
+    assert hourly.shape == (365, 24)
+    assert hourly.reduce(fuel_yh) is fuel_yh
+    np.testing.assert_allclose(hourly.sum_y(fuel_yh), fuel_yh.sum(axis=(1, 2)))
+
+    monthly = temporal_resolution.TemporalResolution('monthly', 2015)
+    fuel_monthly = monthly.reduce(fuel_yh)
+    assert monthly.shape == (12, 1)
+    assert not monthly.hourly
+    assert fuel_monthly.shape == (2, 12, 1)
+    assert np.sum(monthly.weights) == 8760
+
+    # Mean of the hours of every month and yearly sums are kept
+    np.testing.assert_allclose(fuel_monthly[:, 1, 0], fuel_yh[:, 31:59].mean(axis=(1, 2)))
+    np.testing.assert_allclose(monthly.sum_y(fuel_monthly), fuel_yh.sum(axis=(1, 2)))
+    np.testing.assert_allclose(monthly.aggregate(monthly.expand(fuel_monthly)), monthly.aggregate(fuel_yh))
+    assert np.all(monthly.expand(fuel_monthly)[:, 31:59] == fuel_monthly[:, 1:2])
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Testing file ``enduse.py``
+"""Testing"""
+import numpy as np
+from energy_demand import enduse
+from energy_demand.basic import fuel_adjustment
+from energy_demand.profiles import load_profile
+from energy_demand.profiles import representative_days
+from energy_demand.technologies import technological_stock
+
+class DummyRunContext(object):
+    """Dummy run context"""
+    def __init__(self, profile_stock):
+        self.non_regional_profile_stock = profile_stock
+        self.curr_yr = 2020
+        self.sim_param = {'base_yr': 2015, 'curr_yr': 2020, 'end_yr': 2050, 'sim_period_yrs': 36}
+        self.lu_fueltype = {'oil': 0, 'gas': 1, 'electricity': 2}
+        self.assumptions = {
+            'hybrid_technologies': [],
+            'mode_constrained': False,
+            'enduse_space_heating': ['rs_space_heating'],
+            'heat_recovered': {}}
+
+def get_data():
+    """Testing"""
+    technologies = {
+        'boiler_gas': {'fuel_type': 1, 'eff_by': 0.8, 'eff_ey': 0.9},
+        'heat_pump_elec': {'fuel_type': 2, 'eff_by': 3.0, 'eff_ey': 4.0}}
+    for tech in technologies.values():
+        tech.update({'market_entry': 2015, 'eff_achieved': 1.0, 'diff_method': 'linear'})
+
+    return {
+        'nr_of_fueltypes': 3,
+        'sim_param': {'base_yr': 2015, 'curr_yr': 2020, 'end_yr': 2050, 'sim_period_yrs': 36},
+        'assumptions': {
+            'technologies': technologies,
+            'technology_list': {
+                'tech_heating_hybrid': [],
+                'tech_heating_temp_dep': ['heat_pump_elec'],
+                'tech_heating_const': ['boiler_gas'],
+                'primary_heating_electricity': [],
+                'secondary_heating_electricity': []}}}
+
+def get_profile_stock():
+    """Load profiles of a boiler and a heat pump"""
+    shape_yd = np.linspace(2, 1, 365) / np.sum(np.linspace(2, 1, 365))
+    shape_y_dh = {
+        'boiler_gas': np.full((365, 24), 1.0 / 24),
+        'heat_pump_elec': np.tile(np.linspace(1, 3, 24) / 48.0, (365, 1))}
+
+    profile_stock = load_profile.LoadProfileStock('profile_stock')
+    for tech in ['boiler_gas', 'heat_pump_elec']:
+        profile_stock.add_load_profile(
+            tech, [tech], ['rs_space_heating'], ['dummy_sector'],
+            shape_yd=shape_yd,
+            shape_yh=shape_yd[:, np.newaxis] * shape_y_dh[tech],
+            shape_y_dh=shape_y_dh[tech])
+
+    return profile_stock
+
+def create_enduse(tech_stock, profile_stock):
+    """Create space heating enduse"""
+    return enduse.Enduse(
+        'reg',
+        DummyRunContext(profile_stock),
+        'rs_space_heating',
+        'dummy_sector',
+        np.array([0, 100.0, 10.0]),
+        tech_stock,
+        [],
+        [],
+        {0: {}, 1: {'boiler_gas': 1.0}, 2: {'heat_pump_elec': 1.0}},
+        [],
+        [],
+        [],
+        [],
+        {},
+        profile_stock,
+        {factor_name: 1 for factor_name in fuel_adjustment.FACTOR_NAMES})
+
+def test_enduse_representative_days():
+    """Testing"""
+    data = get_data()
+    technologies = {'rs_space_heating': ['boiler_gas', 'heat_pump_elec']}
+    hours = np.linspace(-4, 4, 24)
+    temp_yh = np.linspace(15, -5, 365)[:, np.newaxis] + hours
+    rep_days = representative_days.RepresentativeDays(temp_yh, np.zeros((365), dtype=int), 10)
+
+    # Temperatures which are the same for all days of a representative day
+    temp_rep = rep_days.reduce(temp_yh)
+    temp_yh = rep_days.expand(temp_rep)
+
+    rep_stock = technological_stock.TechStock(
+        'rs_tech_stock', data, temp_yh, temp_rep, 15.5, ['rs_space_heating'], 15.5,
+        technologies, resolution=rep_days)
+    full_stock = technological_stock.TechStock(
+        'rs_tech_stock', data, temp_yh, temp_yh, 15.5, ['rs_space_heating'], 15.5, technologies)
+
+    profile_stock = get_profile_stock()
+    rep_enduse = create_enduse(rep_stock, profile_stock)
+    full_enduse = create_enduse(full_stock, profile_stock)
+
+    # Fuel is only calculated for the representative days
+    assert rep_enduse.resolution is rep_days
+    assert not rep_enduse.crit_factorised
+    assert rep_enduse.fuel_yh.shape == (3, 10, 24)
+    np.testing.assert_allclose(rep_enduse.fuel_yh, rep_days.reduce(full_enduse.fuel_yh))
+    np.testing.assert_allclose(
+        rep_days.sum_y(rep_enduse.fuel_yh), np.sum(full_enduse.fuel_yh, axis=(1, 2)))
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------
+# Testing file ``energy_model``
+# -------------------------
+
+import numpy as np
+
+from energy_demand import energy_model
+from energy_demand.basic import temporal_resolution
+from energy_demand.read_write import read_data
+
+HOURLY = temporal_resolution.TemporalResolution('hourly')
+
+class DummyEnduse(object):
+    """Dummy enduse with fuel at a temporal resolution"""
+    def __init__(self, fuel_yh, resolution):
+        self.crit_flat_profile = False
+        self.crit_factorised = False
+        self.fuel_yh = fuel_yh
+        self.resolution = resolution
+
+class DummyModelObject(object):
+    """Dummy submodel object"""
+    def __init__(self, region_name, enduse, fuel_yh, resolution=HOURLY):
+        self.region_name = region_name
+        self.enduse = enduse
+        self.enduse_object = DummyEnduse(fuel_yh, resolution)
+
+def get_model_run():
+    """Model run with the summed fuel of two regions"""
+    fuel_yh = np.zeros((2, 365, 24))
+    fuel_yh[1, 0, :2] = [1.0, 2.0]
+
+    submodels = [
+        ('rs_submodel', [
+            DummyModelObject('reg_B', 'rs_cold', fuel_yh),
+            DummyModelObject('reg_A', 'rs_cold', 3 * fuel_yh)]),
+        ('ss_submodel', [
+            DummyModelObject('reg_B', 'ss_cold', fuel_yh)])]
+
+    model_run = energy_model.EnergyModel.__new__(energy_model.EnergyModel)
+    model_run.reg_model_objects = model_run.index_model_objects(['reg_A', 'reg_B'], submodels)
+    _, _, model_run.reg_load_factor_season, model_run.peak_engine = model_run.sum_submodels_yh(
+        ['reg_A', 'reg_B'], 2, ['rs_submodel', 'ss_submodel'], model_run.reg_model_objects)
+    model_run.reg_index = model_run.peak_engine.reg_index
+
+    return model_run
+
+def test_get_regional_yh():
+    """Testing
+    """
+    model_run = get_model_run()
+
+    assert model_run.get_regional_yh(2, 'reg_A').shape == (2, 365, 24)
+    assert model_run.get_regional_yh(2, 'reg_A')[1, 0, 1] == 6.0
+    assert model_run.get_regional_yh(2, 'reg_B')[1, 0, 1] == 4.0
+
+def test_get_regional_y():
+    """Testing
+    """
+    model_run = get_model_run()
+
+    np.testing.assert_array_equal(model_run.get_regional_y(), [[0, 0], [9.0, 6.0]])
+
+def test_reg_load_factor_season():
+    """Testing
+    """
+    model_run = get_model_run()
+
+    # Only the first hours of the winter have fuel
+    np.testing.assert_allclose(
+        model_run.reg_load_factor_season['winter'][1],
+        [100 * 9.0 / (90 * 24) / 6.0, 100 * 6.0 / (90 * 24) / 4.0])
+    assert np.all(model_run.reg_load_factor_season['summer'] == 0)
+    assert not hasattr(model_run, 'reg_fuel_yh')
+
+def test_sum_submodels_resolution():
+    """Testing
+    """
+    monthly = temporal_resolution.TemporalResolution('monthly', 2015)
+    fuel_monthly = np.zeros((2, 12, 1))
+    fuel_monthly[1, 0] = 2.0
+    fuel_yh = np.zeros((2, 365, 24))
+    fuel_yh[1, 40, 3] = 5.0
+
+    submodels = [
+        ('rs_submodel', [
+            DummyModelObject('reg_A', 'rs_cold', fuel_monthly, monthly),
+            DummyModelObject('reg_A', 'rs_cold', fuel_monthly, monthly),
+            DummyModelObject('reg_A', 'rs_wet', fuel_yh)])]
+
+    model_run = energy_model.EnergyModel.__new__(energy_model.EnergyModel)
+    reg_model_objects = model_run.index_model_objects(['reg_A'], submodels)
+    fuels_yh, enduse_fuels_yh, _, peak_engine_object = model_run.sum_submodels_yh(
+        ['reg_A'], 2, ['rs_submodel'], reg_model_objects)
+
+    # Fuel of every month is expanded to its hours
+    assert enduse_fuels_yh['rs_submodel']['rs_cold'].shape == (2, 365, 24)
+    assert np.all(enduse_fuels_yh['rs_submodel']['rs_cold'][1, :31] == 4.0)
+    assert np.all(enduse_fuels_yh['rs_submodel']['rs_cold'][1, 31:] == 0)
+    np.testing.assert_allclose(
+        monthly.aggregate(fuels_yh['rs_submodel'])[1, :2], [4.0 * 31 * 24, 5.0])
+    np.testing.assert_array_equal(peak_engine_object.get_peak_h()[0], [0, 5.0])
+
+def test_convert_out_format_es():
+    """Testing
+    """
+    data = {
+        'lu_fueltype': {'gas': 0, 'electricity': 1},
+        'lu_reg': ['reg_B', 'reg_A'],
+        'nr_of_fueltypes': 2}
+
+    results = read_data.convert_out_format_es(data, get_model_run())
+
+    assert len(results['electricity']) == 2 * 8760
+    assert results['electricity'][0] == ('reg_B', '0_0', 2.0, 'units')
+    assert results['electricity'][8760 + 1] == ('reg_A', '0_1', 6.0, 'units')
+    assert sum(result[2] for result in results['gas']) == 0
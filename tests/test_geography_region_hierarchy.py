@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Testing file ``region_hierarchy.py``
+"""Testing"""
+import os
+import numpy as np
+from energy_demand.geography import region_hierarchy
+
+def test_load_region_hierarchy(tmpdir):
+    """Testing"""
+    path_csv = str(tmpdir.join('lookup_region_hierarchy.csv'))
+    path_cache = str(tmpdir.join('region_hierarchy.npz'))
+    with open(path_csv, 'w') as csv_file:
+        csv_file.write("lad,region,nation\nlad_a,north,england\nlad_b,south,england\nlad_c,north,england\nlad_d,wales,wales\n")
+
+    region_names = ['lad_d', 'lad_a', 'lad_b', 'lad_c']
+    hierarchy = region_hierarchy.load_region_hierarchy(path_csv, region_names, path_cache)
+    assert os.path.isfile(path_cache)
+
+    # Values of shape (fueltype, region, hour)
+    values = np.arange(2 * 4 * 3, dtype=float).reshape(2, 4, 3)
+    values_levels = hierarchy.aggregate_all(values, region_axis=1)
+
+    assert hierarchy.unit_names['region'] == ['north', 'south', 'wales']
+    np.testing.assert_array_equal(values_levels['region'][:, 0], values[:, 1] + values[:, 3])
+    np.testing.assert_array_equal(values_levels['region'][:, 2], values[:, 0])
+    np.testing.assert_array_equal(np.sum(values_levels['nation'], axis=1), np.sum(values, axis=1))
+
+    # Read from cache
+    hierarchy_cached = region_hierarchy.load_region_hierarchy(path_csv, region_names, path_cache)
+    np.testing.assert_array_equal(
+        hierarchy_cached.aggregate(values, 'nation', region_axis=1), values_levels['nation'])
+
+    # Cache is rebuilt if regions change
+    hierarchy_changed = region_hierarchy.load_region_hierarchy(path_csv, ['lad_a', 'lad_b'], path_cache)
+    assert hierarchy_changed.unit_names['region'] == ['north', 'south']
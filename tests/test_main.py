@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Testing file ``main.py``
+"""Testing"""
+import sys
+import subprocess
+import pytest
+from energy_demand import main
+
+def test_get_config(tmpdir):
+    """Testing"""
+    path_config = str(tmpdir.join('config.yml'))
+    with open(path_config, 'w') as config_file:
+        config_file.write("local_data_path: data_folder\ntemporal_resolution: daily\nspill_results: true\n")
+
+    config = main.get_config(main.parse_arguments(
+        ['--config', path_config, '--temporal-resolution', 'monthly']))
+
+    assert config['local_data_path'] == 'data_folder'
+    assert config['temporal_resolution'] == 'monthly'
+    assert config['spill_results'] is True
+    assert config['charts'] is False
+
+    with pytest.raises(SystemExit):
+        main.get_config(main.parse_arguments([]))
+
+def test_import_headless():
+    """Testing"""
+    modules = subprocess.check_output([
+        sys.executable, '-c',
+        "import sys, energy_demand.main; print(' '.join(sys.modules))"]).decode().split()
+
+    assert 'matplotlib' not in modules
+    assert 'energy_demand.plotting.chart_pack' not in modules
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------
+# Testing file ``chart_pack``
+# -------------------------
+
+import os
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+from energy_demand.plotting import chart_pack
+from energy_demand.plotting import plotting_results
+from energy_demand.read_write import result_store
+
+class DummyModelRun(object):
+    """Dummy model run object"""
+    def __init__(self, value):
+        self.rs_tot_fuels_all_enduses_y = np.zeros((2, 365, 24))
+        self.rs_tot_fuels_all_enduses_y[1] = value
+        self.rs_tot_fuels_all_enduses_y[1, 12, 5] = 10 * value
+        self.rs_tot_fuel_y_max_allenduse_fueltyp = np.array([0, 10 * value])
+        self.rs_tot_fuel_y_enduse_specific_h = {'rs_cold': np.full((2, 365, 24), value)}
+
+def get_results():
+    """Result store with two years"""
+    results = result_store.ResultStore([
+        'rs_tot_fuels_all_enduses_y',
+        'rs_tot_fuel_y_max_allenduse_fueltyp',
+        'rs_tot_fuel_y_enduse_specific_h'])
+    results.add_year(2015, DummyModelRun(1.0))
+    results.add_year(2016, DummyModelRun(2.0))
+
+    return results
+
+def get_chart_data(path_main):
+    """Data entries used in the plotting functions"""
+    return {
+        'paths': {'path_main': path_main},
+        'sim_param': {'sim_period_yrs': 2, 'sim_period': [2015, 2016]},
+        'lu_fueltype': {'gas': 0, 'electricity': 1},
+        'nr_of_fueltypes': 2}
+
+def test_sum_y():
+    """Testing
+    """
+    results_y = chart_pack.sum_y(
+        get_results(),
+        [
+            'rs_tot_fuels_all_enduses_y',
+            'rs_tot_fuel_y_max_allenduse_fueltyp',
+            'rs_tot_fuel_y_enduse_specific_h'])
+
+    assert [year_results.curr_yr for year_results in results_y] == [2015, 2016]
+    np.testing.assert_array_equal(results_y[1].rs_tot_fuels_all_enduses_y, [0, 2 * (8760 + 9)])
+    np.testing.assert_array_equal(results_y[1].rs_tot_fuel_y_max_allenduse_fueltyp, [0, 20])
+    np.testing.assert_array_equal(results_y[0].rs_tot_fuel_y_enduse_specific_h['rs_cold'], [8760, 8760])
+
+def test_slice_days():
+    """Testing
+    """
+    results_week = chart_pack.slice_days(
+        get_results(), ['rs_tot_fuels_all_enduses_y'], range(10, 17))
+
+    assert len(results_week) == 1
+    assert results_week[0].curr_yr == 2016
+    assert results_week[0].rs_tot_fuels_all_enduses_y.shape == (2, 7, 24)
+    assert results_week[0].rs_tot_fuels_all_enduses_y[1, 2, 5] == 20
+
+def test_plot_reduced_results(tmpdir):
+    """Testing
+    """
+    chart_data = get_chart_data(str(tmpdir))
+    results = get_results()
+    days_to_plot = range(10, 17)
+
+    # Peak hour chart from yearly sums
+    results_y = chart_pack.sum_y(results, ['rs_tot_fuel_y_max_allenduse_fueltyp'])
+    plotting_results.plot_fuels_peak_hour(
+        results_y, chart_data, 'rs_tot_fuel_y_max_allenduse_fueltyp')
+
+    axes = plt.gcf().get_axes()
+    assert len(axes) == 1
+    np.testing.assert_array_equal(axes[0].get_lines()[1].get_ydata(), [10, 20])
+    plt.close('all')
+
+    # Week chart from sliced days
+    os.makedirs(os.path.join(str(tmpdir), 'model_output', '01-charts'))
+    results_week = chart_pack.slice_days(results, ['rs_tot_fuels_all_enduses_y'], days_to_plot)
+    plotting_results.plot_fuels_tot_all_enduses_week(
+        'week.pdf', results_week, chart_data, 'rs_tot_fuels_all_enduses_y', days_to_plot)
+
+    lines = plt.gca().get_lines()
+    assert len(lines[1].get_ydata()) == 7 * 24
+    assert lines[1].get_ydata()[2 * 24 + 5] == 20
+    assert os.path.isfile(os.path.join(str(tmpdir), 'model_output', '01-charts', 'week.pdf'))
+    plt.close('all')
+
+def test_render_charts(tmpdir):
+    """Testing
+    """
+    chart_data = get_chart_data(str(tmpdir))
+    os.makedirs(os.path.join(str(tmpdir), 'model_output', '01-charts'))
+    results_y = chart_pack.sum_y(get_results(), ['rs_tot_fuels_all_enduses_y'])
+
+    chart_pack.render_charts(
+        [(plotting_results.plot_fuels_tot_all_enduses, ("total.pdf", results_y, chart_data, 'rs_tot_fuels_all_enduses_y'))],
+        processes=1)
+
+    assert os.path.isfile(os.path.join(str(tmpdir), 'model_output', '01-charts', 'total.pdf'))
+    assert plt.get_fignums() == []
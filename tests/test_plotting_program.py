@@ -0,0 +1,22 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------
+# Testing file ``plotting_program``
+# -------------------------
+
+import numpy as np
+
+from energy_demand.plotting import plotting_program
+
+def test_downsample():
+    """Testing
+    """
+    x_values, y_values = plotting_program.downsample(np.arange(10), 4)
+
+    np.testing.assert_array_equal(x_values, np.array([0, 3, 6, 9]))
+    np.testing.assert_array_equal(y_values, np.array([1, 4, 7, 9]))
+
+    # Not downsampled if less values than points
+    x_values, y_values = plotting_program.downsample(np.arange(3), 4)
+    np.testing.assert_array_equal(y_values, np.arange(3))
@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------
+# Testing file ``load_factors``
+# -------------------------
+
+import numpy as np
+
+from energy_demand.profiles import load_factors
+
+def test_calc_lf_h():
+    """Testing
+    """
+    fuel_yh = np.ones((2, 3, 365, 24))
+    fuel_yh[0, 0, 0, 0] = 2
+    fuel_yh[1] = 0
+
+    out_value = load_factors.calc_lf_h(fuel_yh)
+
+    assert out_value.shape == (2, 3)
+    np.testing.assert_almost_equal(out_value[0, 0], 100 * (8761 / 8760) / 2)
+    assert out_value[0, 1] == 100
+    assert out_value[1, 0] == 0
+
+def test_calc_lf_d():
+    """Testing
+    """
+    fuel_yd = np.ones((2, 365))
+    fuel_yd[0, 100] = 366
+
+    out_value = load_factors.calc_lf_d(fuel_yd)
+
+    np.testing.assert_almost_equal(out_value, np.array([100 * 2 / 366, 100]))
+
+def test_calc_lf_season():
+    """Testing
+    """
+    fuel_yh = np.ones((1, 365, 24))
+    fuel_yh[0, 200, 12] = 2
+
+    out_value = load_factors.calc_lf_season(fuel_yh)
+
+    assert out_value['winter'][0] == 100
+    assert out_value['summer'][0] < 100
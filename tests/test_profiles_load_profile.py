@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Testing file ``load_profile.py``
+"""Testing"""
+import numpy as np
+from energy_demand.profiles import load_profile
+from energy_demand.basic import temporal_resolution
+
+def test_load_profile_factorised():
+    """Testing"""
+    shape_yd = np.full((365), 1.0 / 365)
+    shape_y_dh = np.tile(np.full((24), 1.0 / 24), (365, 1))
+    shape_y_dh[::7] = np.linspace(0, 1, 24) / 12.0
+    shape_y_dh[3] = 0
+
+    load_profile_obj = load_profile.LoadProfile(
+        ['enduse'], 'profile', shape_yd, None, 1.0 / 365, np.full((24), 1.0 / 24), shape_y_dh)
+
+    # Only the distinct daily shapes are stored
+    assert load_profile_obj.shape_dh_types.shape == (3, 24)
+
+    np.testing.assert_almost_equal(load_profile_obj.shape_y_dh, shape_y_dh)
+    np.testing.assert_almost_equal(load_profile_obj.shape_yh, shape_yd[:, np.newaxis] * shape_y_dh)
+
+    # Full shapes are generated once and single days are read without them
+    assert load_profile_obj.shape_yh is load_profile_obj.shape_yh
+    np.testing.assert_almost_equal(load_profile_obj.get_shape_dh(7), shape_y_dh[7])
+    np.testing.assert_almost_equal(load_profile_obj.get_shape_dh(3), np.zeros((24)))
+
+    # Same profile if initialised with the yh shape
+    load_profile_yh = load_profile.LoadProfile(
+        ['enduse'], 'profile_yh', shape_yd, load_profile_obj.shape_yh, 1.0 / 365, np.full((24), 1.0 / 24))
+
+    np.testing.assert_almost_equal(load_profile_yh.shape_yh, load_profile_obj.shape_yh)
+    assert load_profile_yh.is_same_shape_yh(load_profile_yh)
+    assert not load_profile_yh.is_same_shape_yh(load_profile.LoadProfile(
+        ['enduse'], 'flat', shape_yd, None, 1.0 / 365, np.full((24), 1.0 / 24), np.full((365, 24), 1.0 / 24)))
+
+def test_load_profile_reduced():
+    """Testing"""
+    shape_yd = np.linspace(1, 2, 365) / np.sum(np.linspace(1, 2, 365))
+    shape_y_dh = np.tile(np.linspace(0, 1, 24) / 12.0, (365, 1))
+    load_profile_obj = load_profile.LoadProfile(
+        ['enduse'], 'profile', shape_yd, None, 1.0 / 365, np.full((24), 1.0 / 24), shape_y_dh)
+
+    assert load_profile_obj.get_reduced(None) is load_profile_obj
+    assert load_profile_obj.get_reduced(temporal_resolution.TemporalResolution('hourly')) is load_profile_obj
+
+    # Shapes of every day of the resolution (kept for the resolution)
+    daily = temporal_resolution.TemporalResolution('daily')
+    load_profile_daily = load_profile_obj.get_reduced(daily)
+    assert load_profile_daily is load_profile_obj.get_reduced(daily)
+    assert load_profile_daily.shape_yh.shape == (365, 1)
+    np.testing.assert_allclose(load_profile_daily.shape_yh[:, 0], shape_yd / 24)
+    np.testing.assert_allclose(daily.sum_y(load_profile_daily.shape_yh), 1)
+    np.testing.assert_allclose(load_profile.fuel_yd_to_yh(
+        load_profile_daily.shape_yh_d, load_profile_daily.shape_y_dh), load_profile_daily.shape_yh)
+
+def test_fuel_yd_to_yh():
+    """Testing"""
+    fuel_yd = np.ones((2, 365))
+    shape_y_dh = np.full((365, 24), 1.0 / 24)
+
+    fuel_yh = load_profile.fuel_yd_to_yh(fuel_yd, shape_y_dh)
+
+    assert fuel_yh.shape == (2, 365, 24)
+    np.testing.assert_almost_equal(np.sum(fuel_yh), 2 * 365)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------
+# Testing file ``peak_engine``
+# -------------------------
+
+import numpy as np
+import pytest
+
+from energy_demand.profiles import peak_engine
+
+def test_peak_engine():
+    """Testing
+    """
+    engine = peak_engine.PeakEngine(['reg_A', 'reg_B'], 2)
+
+    fuel_yh_a = np.ones((2, 365, 24))
+    fuel_yh_a[0, 10, 5] = 10
+    fuel_yh_b = np.ones((2, 365, 24))
+    fuel_yh_b[0, 10, 5] = 4
+    fuel_yh_b[0, 20, 3] = 12
+
+    engine.add_region_fuel_yh('reg_A', fuel_yh_a)
+    engine.add_region_fuel_yh('reg_B', fuel_yh_b)
+
+    # Coincident national peak
+    peak_h, peak_yearhour = engine.get_peak_h()
+    assert peak_h[0] == 14
+    assert peak_yearhour[0] == 10 * 24 + 5
+
+    # Regional peaks
+    np.testing.assert_array_equal(
+        engine.get_regional_peak_h(), np.array([[10, 12], [1, 1]]))
+
+    # Peak day and its profile
+    peak_d, peak_yearday = engine.get_peak_d('reg_B')
+    assert peak_yearday[0] == 20
+    assert peak_d[0] == 23 + 12
+    assert engine.get_peak_dh('reg_B')[0][3] == 12
+
+    np.testing.assert_array_equal(engine.get_peak_dh()[0], fuel_yh_a[0, 10] + fuel_yh_b[0, 10])
+
+    # Top national hours in descending order
+    top_k_h, top_k_yearhour = engine.get_top_k_h(2)
+    np.testing.assert_array_equal(top_k_h[0], np.array([14, 13]))
+    np.testing.assert_array_equal(top_k_yearhour[0], np.array([10 * 24 + 5, 20 * 24 + 3]))
+
+    # Only national hourly fuel is kept
+    assert not hasattr(engine, 'fuel_yh')
+
+    # Regional top hours
+    top_k_h, top_k_yearhour = engine.get_top_k_h(2, 'reg_B')
+    np.testing.assert_array_equal(top_k_h[0], np.array([12, 4]))
+    np.testing.assert_array_equal(top_k_yearhour[0], np.array([20 * 24 + 3, 10 * 24 + 5]))
+
+    with pytest.raises(SystemExit):
+        engine.get_top_k_h(engine.nr_of_top_h + 1, 'reg_B')
+
+def test_peak_engine_streamed():
+    """Testing
+    """
+    engine = peak_engine.PeakEngine(['reg_A', 'reg_B'], 2)
+    engine_summed = peak_engine.PeakEngine(['reg_A', 'reg_B'], 2)
+
+    rng = np.random.RandomState(2)
+    submodel_fuels_yh = rng.rand(3, 2, 365, 24)
+
+    # Fuel of every submodel is added on its own
+    for submodel_fuel_yh in submodel_fuels_yh:
+        engine.add_fuel_yh('reg_A', submodel_fuel_yh)
+    fuel_yh = engine.finish_region('reg_A')
+    engine.finish_region('reg_B')
+
+    engine_summed.add_region_fuel_yh('reg_A', np.sum(submodel_fuels_yh, axis=0))
+    engine_summed.add_region_fuel_yh('reg_B', np.zeros((2, 365, 24)))
+
+    np.testing.assert_allclose(fuel_yh, np.sum(submodel_fuels_yh, axis=0))
+    np.testing.assert_allclose(engine.get_peak_h()[0], engine_summed.get_peak_h()[0])
+    np.testing.assert_allclose(engine.get_regional_peak_h(), engine_summed.get_regional_peak_h())
+    np.testing.assert_allclose(engine.get_peak_dh('reg_A'), engine_summed.get_peak_dh('reg_A'))
+    assert engine.partial_fuel_yh == {}
+
+def test_peak_engine_region_added_twice():
+    """Testing
+    """
+    engine = peak_engine.PeakEngine(['reg_A'], 1)
+    engine.add_region_fuel_yh('reg_A', np.ones((1, 365, 24)))
+
+    with pytest.raises(SystemExit):
+        engine.add_region_fuel_yh('reg_A', np.ones((1, 365, 24)))
+    with pytest.raises(SystemExit):
+        engine.add_fuel_yh('reg_A', np.ones((1, 365, 24)))
+
+    # National fuel is not counted twice
+    assert engine.get_peak_h()[0][0] == 1
@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Testing file ``profile_kernels.py``
+"""Testing"""
+import numpy as np
+from energy_demand.profiles import profile_kernels
+
+def test_normalise():
+    """Testing"""
+    values = np.array([[1.0, 3.0], [0, 0], [2.0, np.nan]])
+
+    np.testing.assert_array_equal(
+        profile_kernels.normalise(values, axis=1), [[0.25, 0.75], [0, 0], [0, 0]])
+    np.testing.assert_array_equal(profile_kernels.normalise(np.zeros(3)), [0, 0, 0])
+    np.testing.assert_allclose(profile_kernels.normalise(np.array([1.0, 3.0])), [0.25, 0.75])
+
+    # Normalise in place
+    values = np.array([[2.0, 2.0], [0, 0]])
+    relative_values = profile_kernels.normalise(values, axis=1, out=values)
+    assert relative_values is values
+    np.testing.assert_array_equal(values, [[0.5, 0.5], [0, 0]])
+
+def test_factorise():
+    """Testing"""
+    values = np.array([[1.0, 3.0], [0, 0]])
+    total, relative_values = profile_kernels.factorise(values, axis=1)
+
+    np.testing.assert_array_equal(total, [4, 0])
+    np.testing.assert_array_equal(relative_values, [[0.25, 0.75], [0, 0]])
+
+def test_safe_divide():
+    """Testing"""
+    assert profile_kernels.safe_divide(1.0, 0) == 0
+    assert profile_kernels.safe_divide(1.0, 4) == 0.25
+
+    out = np.ones(3)
+    profile_kernels.safe_divide(np.array([1.0, 2.0, 3.0]), np.array([2.0, 0, np.inf]), out=out)
+    np.testing.assert_array_equal(out, [0.5, 0, 0])
+
+    assert profile_kernels.peak_factor(np.array([1.0, 3.0])) == 0.75
+    assert profile_kernels.peak_factor(np.zeros(2)) == 0
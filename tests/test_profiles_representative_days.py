@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Testing file ``representative_days.py``
+"""Testing"""
+import numpy as np
+from energy_demand.profiles import representative_days
+
+def test_distribute_nr_of_days():
+    """Testing"""
+    group_nr_of_days = representative_days.distribute_nr_of_days([250, 115], 10)
+
+    assert np.sum(group_nr_of_days) == 10
+    assert list(group_nr_of_days) == [7, 3]
+
+def test_representative_days():
+    """Testing"""
+    daytypes = np.zeros((365), dtype=int)
+    daytypes[::7] = 1
+    temp_yh = np.repeat(np.linspace(0, 20, 365)[:, np.newaxis], 24, axis=1)
+
+    rep_days = representative_days.RepresentativeDays(temp_yh, daytypes, 12)
+
+    assert rep_days.nr_of_days == 12
+    assert rep_days.shape == (12, 24)
+    assert np.sum(rep_days.weights) == 8760
+    assert rep_days.reduce(temp_yh).shape == (12, 24)
+    assert rep_days.expand(rep_days.reduce(temp_yh)).shape == (365, 24)
+
+    # Mean values of the represented days and yearly sums are kept
+    days = rep_days.day_to_rep == 3
+    np.testing.assert_allclose(rep_days.reduce(temp_yh)[3], np.mean(temp_yh[days], axis=0))
+    np.testing.assert_allclose(rep_days.sum_y(rep_days.reduce(temp_yh)), np.sum(temp_yh))
+
+    # Days are only represented by days of the same daytype
+    assert np.array_equal(daytypes[rep_days.rep_days][rep_days.day_to_rep], daytypes)
+
+    # Every day represents itself if all days are used
+    all_days = representative_days.RepresentativeDays(temp_yh, daytypes, 365)
+    np.testing.assert_array_equal(all_days.expand(all_days.reduce(temp_yh)), temp_yh)
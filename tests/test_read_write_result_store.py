@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------
+# Testing file ``result_store``
+# -------------------------
+
+import numpy as np
+
+from energy_demand.read_write import result_store
+
+class DummyModelRun(object):
+    """Dummy model run object"""
+    def __init__(self, value):
+        self.tot_fuels = np.full((2, 365, 24), value)
+        self.tot_fuel_enduse = {'rs_cold': np.full((2), value)}
+        self.not_stored = value
+
+def test_result_store():
+    """Testing
+    """
+    store = result_store.ResultStore(['tot_fuels', 'tot_fuel_enduse'])
+    store.add_year(2015, DummyModelRun(1.0))
+    store.add_year(2020, DummyModelRun(2.0))
+
+    assert len(store) == 2
+    assert [year_results.curr_yr for year_results in store] == [2015, 2020]
+    assert store.get_year(2020).tot_fuels[0, 0, 0] == 2.0
+    assert not hasattr(store.get_year(2020), 'not_stored')
+
+def test_result_store_spill(tmpdir):
+    """Testing
+    """
+    store = result_store.ResultStore(
+        ['tot_fuels', 'tot_fuel_enduse'], str(tmpdir.join('result_store')))
+    store.add_year(2015, DummyModelRun(3.0))
+
+    out_value = store.get_year(2015)
+
+    assert out_value.tot_fuels.shape == (2, 365, 24)
+    np.testing.assert_array_equal(out_value.tot_fuel_enduse['rs_cold'], np.full((2), 3.0))
+
+def test_result_store_spill_keys(tmpdir):
+    """Testing
+    """
+    store = result_store.ResultStore(
+        ['tot_fuel_enduse'], str(tmpdir.join('result_store')))
+
+    model_run = DummyModelRun(4.0)
+    model_run.tot_fuel_enduse = {
+        'rs_cold': np.full((2), 1.0),
+        'rs__cold': np.full((2), 2.0),
+        'rs:cold': np.full((2), 3.0)}
+    store.add_year(2015, model_run)
+
+    out_value = store.get_year(2015)
+
+    assert sorted(out_value.tot_fuel_enduse.keys()) == ['rs:cold', 'rs__cold', 'rs_cold']
+    np.testing.assert_array_equal(out_value.tot_fuel_enduse['rs__cold'], np.full((2), 2.0))
+    np.testing.assert_array_equal(out_value.tot_fuel_enduse['rs:cold'], np.full((2), 3.0))
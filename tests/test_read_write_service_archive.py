@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Testing file ``service_archive.py``
+"""Testing"""
+import numpy as np
+from energy_demand.read_write import service_archive
+from energy_demand.read_write import read_data
+from energy_demand.scripts import s_fuel_to_service
+
+def test_service_archive(tmpdir):
+    """Testing"""
+    fuel_p_tech_by = {
+        'heating': {0: {'boiler_gas': 1.0}, 1: {'boiler_elec': 0.5, 'storage': 0.5}, 2: {}},
+        'lighting': {0: {}, 1: {'lamp': 1.0}, 2: {}}}
+    fuels = {'heating': np.array([10.0, 4.0, 0.0]), 'lighting': np.array([0.0, 2.0, 0.0])}
+    technology_list = {
+        'tech_heating_hybrid': [], 'tech_heating_temp_dep': [], 'tech_heating_const': [],
+        'primary_heating_electricity': [], 'secondary_heating_electricity': []}
+    tech_stock = {'boiler_gas': {'eff_by': 0.5}, 'boiler_elec': {'eff_by': 1.0}, 'storage': {'eff_by': 1.0}, 'lamp': {'eff_by': 0.2}}
+
+    enduses, technologies, tech_defined, service = s_fuel_to_service.calc_service_by(
+        technology_list, {}, 3, fuel_p_tech_by, fuels, tech_stock)
+
+    service_archive.write_service_archive(
+        service_archive.archive_path(str(tmpdir), 'rs'), enduses, technologies, tech_defined, service)
+    service_tech_by_p, service_fueltype_tech_by_p, service_fueltype_by_p = read_data.read_service_by_p(
+        str(tmpdir), 'rs')
+
+    # Heating: gas service 5, electricity service 4
+    np.testing.assert_almost_equal(service_tech_by_p['heating']['boiler_gas'], 5.0 / 9.0)
+    np.testing.assert_almost_equal(service_fueltype_by_p['heating'][1], 4.0 / 9.0)
+    assert service_fueltype_tech_by_p['heating'][1] == {'boiler_elec': 0.5, 'storage': 0.5}
+    assert service_fueltype_tech_by_p['heating'][2] == {}
+    assert service_tech_by_p['lighting'] == {'lamp': 1.0}
@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------
+# Testing file ``shape_archive``
+# -------------------------
+
+import numpy as np
+
+from energy_demand.read_write import shape_archive
+
+def test_write_read_shape_archive(tmpdir):
+    """Testing
+    """
+    path_archive = str(tmpdir.join('rs_submodel_archive'))
+
+    shape_non_peak_y_dh = np.random.rand(365, 24)
+    shapes = {
+        'rs_cold': {
+            'shape_peak_dh': np.full((24), 1.0 / 24),
+            'shape_non_peak_y_dh': shape_non_peak_y_dh,
+            'shape_peak_yd_factor': 0.003,
+            'shape_non_peak_yd': np.full((365), 1.0 / 365)}
+        }
+
+    assert not shape_archive.archive_exists(path_archive)
+
+    shape_archive.write_shape_archive(path_archive, shapes)
+    assert shape_archive.archive_exists(path_archive)
+
+    out_value = shape_archive.read_shape_archive(path_archive)
+
+    assert list(out_value) == ['rs_cold']
+    assert out_value['rs_cold']['shape_peak_yd_factor'] == 0.003
+    np.testing.assert_array_equal(
+        out_value['rs_cold']['shape_non_peak_y_dh'], shape_non_peak_y_dh)
+    np.testing.assert_array_equal(
+        out_value['rs_cold']['shape_peak_dh'], shapes['rs_cold']['shape_peak_dh'])
+    np.testing.assert_array_equal(
+        out_value['rs_cold']['shape_non_peak_yd'], shapes['rs_cold']['shape_non_peak_yd'])
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Testing file ``_execute_all_scripts.py``
+"""Testing"""
+import os
+import json
+import pytest
+from energy_demand.scripts import _execute_all_scripts
+
+def test_get_step_levels():
+    """Testing"""
+    steps = [
+        _execute_all_scripts.Step('a', 'module_a', ['raw_a'], ['out_a']),
+        _execute_all_scripts.Step('b', 'module_b', ['raw_b'], ['out_b']),
+        _execute_all_scripts.Step('c', 'module_c', ['out_a', os.path.join('out_b', 'file')], ['out_c']),
+        _execute_all_scripts.Step('d', 'module_d', ['raw_a'], ['out_d'])]
+
+    levels = _execute_all_scripts.get_step_levels(steps)
+
+    assert [[step.name for step in level] for level in levels] == [['a', 'b', 'd'], ['c']]
+
+def test_is_up_to_date(tmpdir):
+    """Testing"""
+    path_input = str(tmpdir.join('input.csv'))
+    path_output = str(tmpdir.join('output.csv'))
+    step = _execute_all_scripts.Step(
+        'step', 'energy_demand.scripts.s_shared_functions', [path_input], [path_output])
+
+    with open(path_input, 'w') as input_file:
+        input_file.write('1,2')
+
+    # Missing output
+    assert not _execute_all_scripts.is_up_to_date(step, {})
+
+    with open(path_output, 'w') as output_file:
+        output_file.write('3')
+
+    # Output newer than inputs
+    os.utime(path_input, (1, 1))
+    assert _execute_all_scripts.is_up_to_date(step, {})
+
+    # Output older than inputs but same content of inputs as in last run
+    os.utime(path_output, (0, 0))
+    assert not _execute_all_scripts.is_up_to_date(step, {})
+    recorded_hashes = {'step': _execute_all_scripts.hash_files(_execute_all_scripts.get_step_inputs(step))}
+    assert _execute_all_scripts.is_up_to_date(step, recorded_hashes)
+
+    with open(path_input, 'w') as input_file:
+        input_file.write('1,3')
+    assert not _execute_all_scripts.is_up_to_date(step, recorded_hashes)
+
+def test_run_steps_failed_step(tmpdir, monkeypatch):
+    """Testing"""
+    path_output = str(tmpdir.join('out_ok.csv'))
+    with open(str(tmpdir.join('step_ok.py')), 'w') as module_file:
+        module_file.write(
+            "def run(path_main, local_data_path):\n"
+            "    open({!r}, 'w').write('1')\n".format(path_output))
+    with open(str(tmpdir.join('step_fail.py')), 'w') as module_file:
+        module_file.write(
+            "def run(path_main, local_data_path):\n"
+            "    raise ValueError('failed')\n")
+    monkeypatch.syspath_prepend(str(tmpdir))
+
+    steps = [
+        _execute_all_scripts.Step('ok', 'step_ok', [], [path_output]),
+        _execute_all_scripts.Step('fail', 'step_fail', [], [str(tmpdir.join('out_fail.csv'))])]
+    path_hashes = str(tmpdir.join('hashes.json'))
+
+    with pytest.raises(SystemExit):
+        _execute_all_scripts.run_steps(steps, '', '', path_hashes)
+
+    # Successful sibling is recorded and skipped in the next run
+    with open(path_hashes, 'r') as hash_file:
+        assert list(json.load(hash_file)) == ['ok']
+    assert _execute_all_scripts.run_steps(steps[:1], '', '', path_hashes) == []
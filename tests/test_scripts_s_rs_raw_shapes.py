@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------
+# Testing file ``s_rs_raw_shapes``
+# -------------------------
+
+import csv
+import numpy as np
+
+from energy_demand.scripts import s_rs_raw_shapes
+
+def write_hes_csv(path_csv_file, rows):
+    """Write a HES csv file (month, daytype, appliance and 24 hourly values)"""
+    with open(path_csv_file, 'w') as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(['month', 'daytype', 'appliance'] + ['h_{}'.format(hour) for hour in range(24)])
+
+        for month, daytype, appliance_typ, hourly_values in rows:
+            writer.writerow(
+                [month, daytype, appliance_typ] + ['{:.6f}'.format(value) for value in hourly_values])
+
+def read_hes_reference(raw_elec_data, nr_app_type_lu):
+    """Per row and hour assignment of the HES data"""
+    hes_data = np.zeros((4, 12, 24, nr_app_type_lu))
+    hes_y_coldest = np.zeros((24, nr_app_type_lu))
+    hes_y_warmest = np.zeros((24, nr_app_type_lu))
+
+    for row in raw_elec_data:
+        month, daytype, appliance_typ = int(row[0]), int(row[1]), int(row[2])
+
+        for hour in range(24):
+            hourly_value = float(row[3 + hour])
+
+            if daytype == 2:
+                hes_y_coldest[hour][appliance_typ] = hourly_value
+            elif daytype == 3:
+                hes_y_warmest[hour][appliance_typ] = hourly_value
+            else:
+                hes_data[daytype][month][hour][appliance_typ] = hourly_value
+
+    return hes_data, hes_y_coldest, hes_y_warmest
+
+def test_read_hes_data(tmpdir):
+    """Testing
+    """
+    rng = np.random.RandomState(3)
+    rows = []
+    for month in range(12):
+        for daytype in range(2):
+            for appliance_typ in range(3):
+                rows.append((month, daytype, appliance_typ, rng.rand(24)))
+    for appliance_typ in range(3):
+        rows.append((0, 2, appliance_typ, rng.rand(24)))
+        rows.append((6, 3, appliance_typ, rng.rand(24)))
+
+    path_csv_file = str(tmpdir.join('hes.csv'))
+    write_hes_csv(path_csv_file, rows)
+
+    hes_data, hes_y_coldest, hes_y_warmest = s_rs_raw_shapes.read_hes_data(path_csv_file, 4)
+    expected = read_hes_reference(s_rs_raw_shapes.read_csv(path_csv_file), 4)
+
+    np.testing.assert_array_equal(hes_data, expected[0])
+    np.testing.assert_array_equal(hes_y_coldest, expected[1])
+    np.testing.assert_array_equal(hes_y_warmest, expected[2])
+
+    # Appliance without rows
+    assert np.sum(hes_data[:, :, :, 3]) == 0
+    assert np.sum(hes_y_coldest[:, 3]) == 0
+
+def test_get_hes_load_shapes():
+    """Testing
+    """
+    rng = np.random.RandomState(5)
+    year_raw_values = rng.rand(365, 24, 3)
+    hes_y_peak = rng.rand(24, 3)
+
+    shape_peak_dh, shape_non_peak_y_dh, shape_peak_yd_factor, shape_non_peak_yd = s_rs_raw_shapes.get_hes_load_shapes(
+        year_raw_values, hes_y_peak)
+
+    # Per appliance and day calculation
+    for hes_app_id in range(3):
+        tot_enduse_y = np.sum(year_raw_values[:, :, hes_app_id])
+        peak_h_values = hes_y_peak[:, hes_app_id]
+
+        np.testing.assert_allclose(
+            shape_peak_dh[:, hes_app_id], peak_h_values / np.sum(peak_h_values))
+        np.testing.assert_allclose(
+            shape_peak_yd_factor[hes_app_id], np.sum(peak_h_values) / tot_enduse_y)
+
+        for day in range(365):
+            day_values = year_raw_values[day, :, hes_app_id]
+
+            np.testing.assert_allclose(
+                shape_non_peak_yd[day, hes_app_id], np.sum(day_values) / tot_enduse_y)
+            np.testing.assert_allclose(
+                shape_non_peak_y_dh[day, :, hes_app_id], day_values / np.sum(day_values))
+
+def test_get_hes_load_shapes_no_demand():
+    """Testing
+    """
+    year_raw_values = np.ones((365, 24, 2))
+    year_raw_values[:, :, 1] = 0
+    year_raw_values[10, :, 0] = 0
+    hes_y_peak = np.ones((24, 2))
+    hes_y_peak[:, 1] = 0
+
+    shape_peak_dh, shape_non_peak_y_dh, shape_peak_yd_factor, shape_non_peak_yd = s_rs_raw_shapes.get_hes_load_shapes(
+        year_raw_values, hes_y_peak)
+
+    assert np.all(shape_peak_dh[:, 1] == 0)
+    assert np.all(shape_non_peak_y_dh[:, :, 1] == 0)
+    assert np.all(shape_non_peak_y_dh[10, :, 0] == 0)
+    assert shape_peak_yd_factor[1] == 0
+    assert np.all(shape_non_peak_yd[:, 1] == 0)
+    np.testing.assert_allclose(np.sum(shape_non_peak_yd[:, 0]), 1)
@@ -0,0 +1,24 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------
+# Testing file ``s_shared_functions``
+# -------------------------
+
+from energy_demand.scripts import s_shared_functions
+
+def test_get_daytype_month_index():
+    """Testing
+    """
+    daytype_index, month_index = s_shared_functions.get_daytype_month_index(2015)
+
+    assert daytype_index.shape == (365,)
+    assert month_index[0] == 0
+    assert month_index[364] == 11
+
+    # 1. Jan 2015 is a bank holiday, 2. Jan 2015 a working day
+    assert daytype_index[0] == 1
+    assert daytype_index[1] == 0
+
+    # 3. Jan 2015 is a Saturday
+    assert daytype_index[2] == 1
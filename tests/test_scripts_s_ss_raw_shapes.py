@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------
+# Testing file ``s_ss_raw_shapes``
+# -------------------------
+
+import os
+import csv
+from datetime import date, timedelta
+import numpy as np
+
+from energy_demand.scripts import s_ss_raw_shapes
+from energy_demand.scripts import s_shared_functions
+from energy_demand.profiles import profile_kernels
+
+def write_carbon_trust_csv(path_csv_file, start_date, nr_of_days, seed, zero_days=()):
+    """Write a csv file with half-hourly values of one site"""
+    rng = np.random.RandomState(seed)
+
+    with open(path_csv_file, 'w') as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(['date'] + ['hh_{}'.format(half_hour) for half_hour in range(48)])
+
+        for day in range(nr_of_days):
+            date_row = start_date + timedelta(days=day)
+            half_hours = np.zeros((48)) if day in zero_days else rng.rand(48)
+            writer.writerow(
+                [date_row.strftime('%d/%m/%Y')] + ['{:.6f}'.format(value) for value in half_hours])
+
+        # Row with wrong number of entries
+        writer.writerow(['01/01/2000', '1.0'])
+
+def read_reference(paths_csv_file):
+    """Per row aggregation of the files (without days without demand)"""
+    values_h = {}
+    max_dh_shapes = []
+
+    for path_csv_file in paths_csv_file:
+        with open(path_csv_file, 'r') as csv_file:
+            rows = list(csv.reader(csv_file))[1:]
+
+        if len(rows) - 1 <= 365:
+            continue
+
+        max_d_demand = 0
+        for day, row in enumerate(rows):
+            if len(row) != 49 or day > 365:
+                continue
+
+            day_nr, month, year = [int(date_entry) for date_entry in row[0].split("/")]
+            if s_ss_raw_shapes.is_leap_year(year):
+                year += 1
+                if month == 2 and day_nr == 29:
+                    continue
+
+            demand_dh = [float(row[1 + 2 * hour]) + float(row[2 + 2 * hour]) for hour in range(24)]
+            daily_sum = sum(demand_dh)
+            if daily_sum == 0:
+                continue
+
+            if s_shared_functions.get_weekday_type(date(year, month, day_nr)) == 'holiday':
+                daytype = 1
+            else:
+                daytype = 0
+
+            for hour, demand_h in enumerate(demand_dh):
+                values_h.setdefault((daytype, month - 1, hour), []).append(demand_h)
+
+            if daily_sum >= max_d_demand:
+                max_d_demand = daily_sum
+                max_dh_shape = np.array(demand_dh) / daily_sum
+
+        max_dh_shapes.append(max_dh_shape)
+
+    av_dh = np.zeros((2, 12, 24))
+    for (daytype, month, hour), demand_h in values_h.items():
+        av_dh[daytype, month, hour] = sum(demand_h) / len(demand_h)
+
+    return av_dh, np.mean(max_dh_shapes, axis=0)
+
+def test_read_carbon_trust_file(tmpdir):
+    """Testing
+    """
+    path_csv_file = str(tmpdir.join('site.csv'))
+    write_carbon_trust_csv(path_csv_file, date(2013, 1, 1), 400, 1, zero_days=[3, 40])
+
+    sum_dh, count_dh, max_dh_shape = s_ss_raw_shapes.read_carbon_trust_file(path_csv_file)
+    av_dh, peak_dh = read_reference([path_csv_file])
+
+    # Days without demand are not counted
+    assert np.sum(count_dh) == 366 - 2
+    np.testing.assert_allclose(profile_kernels.safe_divide(sum_dh, count_dh[:, :, np.newaxis]), av_dh)
+    np.testing.assert_allclose(max_dh_shape, peak_dh)
+
+    # Files which do not cover a full year are skipped
+    path_short_file = str(tmpdir.join('short.csv'))
+    write_carbon_trust_csv(path_short_file, date(2013, 1, 1), 100, 2)
+    _, count_dh, max_dh_shape = s_ss_raw_shapes.read_carbon_trust_file(path_short_file)
+
+    assert np.sum(count_dh) == 0
+    assert max_dh_shape is None
+
+def test_read_raw_carbon_trust_data(tmpdir):
+    """Testing
+    """
+    folder_path = str(tmpdir.mkdir('carbon_trust'))
+    write_carbon_trust_csv(os.path.join(folder_path, 'site_a.csv'), date(2013, 1, 1), 400, 1, zero_days=[5])
+    write_carbon_trust_csv(os.path.join(folder_path, 'site_b.csv'), date(2012, 1, 1), 380, 2)
+    write_carbon_trust_csv(os.path.join(folder_path, 'site_c.csv'), date(2014, 6, 1), 50, 3)
+
+    av_dh, peak_dh = read_reference(
+        [os.path.join(folder_path, name) for name in sorted(os.listdir(folder_path))])
+    daily_demand, load_shape_dh = profile_kernels.factorise(
+        s_ss_raw_shapes.assign_data_to_year(av_dh, 2015), axis=1)
+
+    # Sequential and parallel reading give the same result as the per row aggregation
+    for processes in [1, 2]:
+        out_value = s_ss_raw_shapes.read_raw_carbon_trust_data(folder_path, processes)
+
+        np.testing.assert_allclose(out_value[0], load_shape_dh)
+        np.testing.assert_allclose(out_value[1], peak_dh)
+        np.testing.assert_allclose(out_value[2], np.max(daily_demand) / np.sum(daily_demand))
+        np.testing.assert_allclose(out_value[3], daily_demand / np.sum(daily_demand))
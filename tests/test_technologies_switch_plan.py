@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Testing file ``switch_plan.py``
+"""Testing"""
+import numpy as np
+from energy_demand.technologies import switch_plan
+
+def test_apply_service_switch():
+    """Testing"""
+    sig_param_tech = {'heating': {'heat_pump': {'l_parameter': 0.5, 'midpoint': 0, 'steepness': 100}}}
+    plan = switch_plan.SwitchPlan(
+        'heating', 2050, [], {}, sig_param_tech,
+        {'heating': ['heat_pump']}, {'heating': ['boiler_gas', 'boiler_oil']}, {'heating': []})
+
+    tot_service_h_cy = np.ones((365, 24))
+    service_tech_cy = plan.apply_service_switch(
+        tot_service_h_cy, np.array([0.6, 0.3, 0.1]), ['boiler_gas', 'boiler_oil', 'heat_pump'])
+
+    assert service_tech_cy.shape == (3, 365, 24)
+    np.testing.assert_almost_equal(np.sum(service_tech_cy[2]), 0.5 * 8760)
+    np.testing.assert_almost_equal(np.sum(service_tech_cy[0]), (0.6 - 0.4 * 2 / 3) * 8760)
+    np.testing.assert_almost_equal(np.sum(service_tech_cy), 8760)
+
+def test_apply_fuel_switch():
+    """Testing"""
+    sig_param_tech = {'heating': {'heat_pump': {'l_parameter': 0.5, 'midpoint': 0, 'steepness': 100}}}
+    fuel_switches = [{
+        'enduse': 'heating',
+        'technology_install': 'heat_pump',
+        'enduse_fueltype_replace': 1,
+        'share_fuel_consumption_switched': 0.5}]
+    plan = switch_plan.SwitchPlan(
+        'heating', 2050, fuel_switches, {'heating': ['heat_pump']}, sig_param_tech, {}, {}, {})
+
+    tot_service_h_cy = np.ones((365, 24))
+    service_tech = np.array([np.full((365, 24), 0.9), np.full((365, 24), 0.1)])
+    service_tech_after_switch = plan.apply_fuel_switch(
+        tot_service_h_cy,
+        service_tech,
+        ['boiler_gas', 'heat_pump'],
+        {1: {'boiler_gas': 1.0}, 2: {'heat_pump': 1.0}},
+        {1: 0.9, 2: 0.1},
+        {1: {'boiler_gas': 1.0}, 2: {'heat_pump': 1.0}})
+
+    np.testing.assert_almost_equal(service_tech_after_switch[1, 0, 0], 0.5)
+    np.testing.assert_almost_equal(service_tech_after_switch[0, 0, 0], 0.4)
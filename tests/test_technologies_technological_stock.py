@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Testing file ``technological_stock.py``
+"""Testing"""
+import numpy as np
+from energy_demand import enduse
+from energy_demand.technologies import technological_stock
+from energy_demand.profiles import representative_days
+from energy_demand.basic import temporal_resolution
+
+def get_data():
+    """Testing"""
+    technologies = {
+        'boiler_gas': {'fuel_type': 1, 'eff_by': 0.8, 'eff_ey': 0.9},
+        'heat_pump_elec': {'fuel_type': 2, 'eff_by': 3.0, 'eff_ey': 4.0}}
+    for tech in technologies.values():
+        tech.update({'market_entry': 2015, 'eff_achieved': 1.0, 'diff_method': 'linear'})
+
+    return {
+        'nr_of_fueltypes': 3,
+        'sim_param': {'base_yr': 2015, 'curr_yr': 2020, 'end_yr': 2050, 'sim_period_yrs': 36},
+        'assumptions': {
+            'technologies': technologies,
+            'technology_list': {
+                'tech_heating_hybrid': [],
+                'tech_heating_temp_dep': ['heat_pump_elec'],
+                'tech_heating_const': ['boiler_gas'],
+                'primary_heating_electricity': [],
+                'secondary_heating_electricity': []}}}
+
+def test_shared_technologies():
+    """Testing"""
+    data = get_data()
+    enduses = ['space_heating', 'water_heating']
+    enduse_technologies = {enduse: ['boiler_gas', 'heat_pump_elec'] for enduse in enduses}
+
+    shared_technologies = technological_stock.create_shared_technologies(
+        data, ['boiler_gas', 'heat_pump_elec', 'boiler_gas'])
+    assert list(shared_technologies) == ['boiler_gas']
+
+    stocks = [
+        technological_stock.TechStock(
+            'tech_stock', data, np.full((365, 24), temp), np.full((365, 24), temp),
+            15.5, enduses, 15.5, enduse_technologies, shared_technologies)
+        for temp in [0.0, 10.0]]
+
+    # Temperature independent technologies are shared by all stocks and enduses
+    boiler = stocks[0].stock_technologies[('boiler_gas', 'space_heating')]
+    assert boiler is shared_technologies['boiler_gas']
+    assert boiler is stocks[1].stock_technologies[('boiler_gas', 'water_heating')]
+
+    # Heat pumps are created once per stock
+    heat_pump = stocks[0].stock_technologies[('heat_pump_elec', 'space_heating')]
+    assert heat_pump is stocks[0].stock_technologies[('heat_pump_elec', 'water_heating')]
+    assert heat_pump is not stocks[1].stock_technologies[('heat_pump_elec', 'space_heating')]
+    assert not np.allclose(
+        stocks[0].get_tech_attr('space_heating', 'heat_pump_elec', 'eff_cy'),
+        stocks[1].get_tech_attr('space_heating', 'heat_pump_elec', 'eff_cy'))
+
+    # Identical to a stock with its own technologies
+    own_stock = technological_stock.TechStock(
+        'tech_stock', data, np.zeros((365, 24)), np.zeros((365, 24)),
+        15.5, enduses, 15.5, enduse_technologies)
+    for attribute in ['eff_by', 'eff_cy', 'fueltypes_yh_p_cy', 'fueltype_share_yh_all_h']:
+        for tech in ['boiler_gas', 'heat_pump_elec']:
+            np.testing.assert_array_equal(
+                stocks[0].get_tech_attr('water_heating', tech, attribute),
+                own_stock.get_tech_attr('water_heating', tech, attribute))
+
+    assert not boiler.fueltypes_yh_p_cy.flags.writeable
+
+def test_compile_enduse():
+    """Testing"""
+    data = get_data()
+    technologies = ['heat_pump_elec', 'boiler_gas']
+    tech_stock = technological_stock.TechStock(
+        'tech_stock', data, np.full((365, 24), 5.0), np.full((365, 24), 5.0),
+        15.5, ['space_heating'], 15.5, {'space_heating': technologies})
+
+    enduse_tech_stock = tech_stock.compile_enduse('space_heating', technologies)
+    assert enduse_tech_stock is tech_stock.compile_enduse('space_heating', technologies)
+
+    assert enduse_tech_stock.tech_index == {'heat_pump_elec': 0, 'boiler_gas': 1}
+    assert enduse_tech_stock.is_tech_type(['heat_pump']).tolist() == [True, False]
+    assert enduse_tech_stock.eff_cy.shape == (2, 365, 24)
+    np.testing.assert_array_equal(
+        enduse_tech_stock.eff_cy[0], tech_stock.get_tech_attr('space_heating', 'heat_pump_elec', 'eff_cy'))
+    assert np.all(enduse_tech_stock.eff_by[1] == 0.8)
+    assert enduse_tech_stock.eff_by_y[1] == 0.8
+    np.testing.assert_allclose(enduse_tech_stock.fueltype_p, [[0, 0, 1], [0, 1, 0]])
+    np.testing.assert_array_equal(enduse_tech_stock.get_fueltypes_dh(0)[:, :, 0], [[0, 0, 1], [0, 1, 0]])
+
+    # Scalar efficiencies only are not stored for every hour
+    boiler_stock = tech_stock.compile_enduse('space_heating', ['boiler_gas'])
+    assert boiler_stock.eff_by.shape == (1, 365, 24)
+    assert boiler_stock.eff_by.strides[1:] == (0, 0)
+    assert not boiler_stock.eff_by.flags.writeable
+
+def test_compile_enduse_resolution():
+    """Testing"""
+    data = get_data()
+    technologies = ['heat_pump_elec', 'boiler_gas']
+    temp_by = np.tile(np.linspace(-5, 10, 24), (365, 1))
+    temp_cy = temp_by + 2
+    daily = temporal_resolution.TemporalResolution('daily')
+
+    tech_stock = technological_stock.TechStock(
+        'tech_stock', data, temp_by, daily.reduce(temp_cy), 15.5, ['space_heating'], 15.5,
+        {'space_heating': technologies}, resolution=daily)
+    full_stock = technological_stock.TechStock(
+        'tech_stock', data, temp_by, temp_cy, 15.5, ['space_heating'], 15.5,
+        {'space_heating': technologies})
+
+    # Efficiencies of every day, base year reduced from every hour
+    enduse_tech_stock = tech_stock.compile_enduse('space_heating', technologies)
+    assert enduse_tech_stock.eff_cy.shape == (2, 365, 1)
+    np.testing.assert_allclose(
+        enduse_tech_stock.eff_by[0],
+        daily.reduce(full_stock.get_tech_attr('space_heating', 'heat_pump_elec', 'eff_by')))
+    np.testing.assert_allclose(
+        enduse_tech_stock.eff_by_y,
+        full_stock.compile_enduse('space_heating', technologies).eff_by_y)
+
+def test_hybrid_technology():
+    """Testing"""
+    data = get_data()
+    data['assumptions']['technology_list']['tech_heating_hybrid'] = ['hybrid_gas_elec']
+    data['assumptions']['technologies']['hybrid_gas_elec'] = {
+        'tech_low_temp': 'boiler_gas',
+        'tech_high_temp': 'heat_pump_elec',
+        'hybrid_cutoff_temp_low': -2,
+        'hybrid_cutoff_temp_high': 7}
+    temp = np.tile(np.linspace(-5, 10, 24), (365, 1))
+
+    tech_stock = technological_stock.TechStock(
+        'tech_stock', data, temp, temp, 15.5, ['space_heating'], 15.5,
+        {'space_heating': ['boiler_gas', 'hybrid_gas_elec']})
+
+    # Only the shares of the two fueltypes are stored
+    fuel_distr_hybrid_h_p = tech_stock.get_tech_attr('space_heating', 'hybrid_gas_elec', 'fuel_distr_hybrid_h_p')
+    np.testing.assert_allclose(fuel_distr_hybrid_h_p['low'] + fuel_distr_hybrid_h_p['high'], 1)
+
+    fueltypes_yh_p_cy = tech_stock.get_tech_attr('space_heating', 'hybrid_gas_elec', 'fueltypes_yh_p_cy')
+    assert fueltypes_yh_p_cy.shape == (3, 365, 24)
+    np.testing.assert_array_equal(fueltypes_yh_p_cy[1], fuel_distr_hybrid_h_p['low'])
+    np.testing.assert_array_equal(fueltypes_yh_p_cy[2], fuel_distr_hybrid_h_p['high'])
+
+    enduse_tech_stock = tech_stock.compile_enduse('space_heating', ['boiler_gas', 'hybrid_gas_elec'])
+    np.testing.assert_allclose(
+        enduse_tech_stock.fueltype_share_yh_all_h[1],
+        [0, np.mean(fuel_distr_hybrid_h_p['low']), np.mean(fuel_distr_hybrid_h_p['high'])])
+    np.testing.assert_array_equal(enduse_tech_stock.get_fueltypes_dh(3)[1], fueltypes_yh_p_cy[:, 3])
+
+    # Base year fuel shares of the run context are not changed
+    class DummyEnduse(object):
+        """Dummy enduse"""
+        enduse = 'space_heating'
+        enduse_techs = ['boiler_gas', 'hybrid_gas_elec']
+        fuel_new_y = np.array([0, 100.0, 10.0])
+
+    fuel_tech_p_by = {0: {}, 1: {'boiler_gas': 1.0}, 2: {'hybrid_gas_elec': 1.0}}
+    adapted_fuel_tech_p_by = enduse.Enduse.adapt_fuel_tech_p_by(
+        DummyEnduse(), fuel_tech_p_by, tech_stock, ['hybrid_gas_elec'])
+
+    assert fuel_tech_p_by == {0: {}, 1: {'boiler_gas': 1.0}, 2: {'hybrid_gas_elec': 1.0}}
+    assert adapted_fuel_tech_p_by[1]['hybrid_gas_elec'] > 0
+    assert adapted_fuel_tech_p_by[0] == {}
+
+def test_representative_days_base_year():
+    """Testing"""
+    data = get_data()
+    data['assumptions']['technology_list']['tech_heating_hybrid'] = ['hybrid_gas_elec']
+    data['assumptions']['technologies']['hybrid_gas_elec'] = {
+        'tech_low_temp': 'boiler_gas',
+        'tech_high_temp': 'heat_pump_elec',
+        'hybrid_cutoff_temp_low': -2,
+        'hybrid_cutoff_temp_high': 7}
+    technologies = ['boiler_gas', 'heat_pump_elec', 'hybrid_gas_elec']
+
+    hours = np.linspace(-4, 4, 24)
+    temp_by = np.linspace(-5, 15, 365)[:, np.newaxis] + hours
+    temp_cy = np.linspace(15, -5, 365)[:, np.newaxis] + hours
+    rep_days = representative_days.RepresentativeDays(temp_cy, np.zeros((365), dtype=int), 10)
+
+    # Current year with representative days, base year for every day
+    rep_stock = technological_stock.TechStock(
+        'tech_stock', data, temp_by, rep_days.reduce(temp_cy), 15.5, ['space_heating'], 15.5,
+        {'space_heating': technologies}, resolution=rep_days)
+    full_stock = technological_stock.TechStock(
+        'tech_stock', data, temp_by, rep_days.expand(rep_days.reduce(temp_cy)), 15.5, ['space_heating'], 15.5,
+        {'space_heating': technologies})
+
+    # Attributes are only kept for the representative days
+    for tech in ['heat_pump_elec', 'hybrid_gas_elec']:
+        assert rep_stock.get_tech_attr('space_heating', tech, 'eff_cy').shape == (10, 24)
+        np.testing.assert_allclose(
+            rep_stock.get_tech_attr('space_heating', tech, 'eff_by'),
+            rep_days.reduce(full_stock.get_tech_attr('space_heating', tech, 'eff_by')))
+        np.testing.assert_allclose(
+            rep_stock.get_tech_attr('space_heating', tech, 'fueltype_share_yh_all_h'),
+            full_stock.get_tech_attr('space_heating', tech, 'fueltype_share_yh_all_h'))
+
+        for attribute in ['eff_cy', 'fueltypes_yh_p_cy']:
+            rep_attribute = rep_stock.get_tech_attr('space_heating', tech, attribute)
+            full_attribute = full_stock.get_tech_attr('space_heating', tech, attribute)
+            np.testing.assert_allclose(
+                rep_days.expand(np.broadcast_to(rep_attribute, rep_attribute.shape[:-2] + rep_days.shape)),
+                np.broadcast_to(full_attribute, full_attribute.shape[:-2] + (365, 24)))
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------
+# Testing file ``elec_national_data``
+# -------------------------
+
+import os
+import numpy as np
+
+from energy_demand.validation import elec_national_data
+from energy_demand.basic import unit_conversions
+
+def test_calc_validation_metrics():
+    """Testing
+    """
+    data_real = np.full((365, 24), 2.0)
+    data_calculated = np.full((365, 24), 1.0)
+    data_calculated[10, 5] = 4.0
+
+    out_value = elec_national_data.calc_validation_metrics(data_real, data_calculated)
+
+    assert out_value['diff_percent_h'][0, 0] == 50
+    assert out_value['diff_percent_h'][10, 5] == 200
+    assert out_value['bias_h'][0] == 1
+    assert out_value['peak_h_error'] == -2
+    assert out_value['peak_d_error'] == 48 - 27
+
+def write_elec_csv(path_to_csv, offset):
+    """Write half hourly national electricity data of two days"""
+    with open(path_to_csv, 'w') as csv_file:
+        csv_file.write("SETTLEMENT_DATE,SETTLEMENT_PERIOD,ND,I014_ND,TSD\n")
+        for date_string in ['01-Jan-2015', '02-Feb-2015']:
+            for half_hour in range(48):
+                csv_file.write("{},{},{},0,{}\n".format(
+                    date_string, half_hour + 1, half_hour + offset, 2 * half_hour))
+
+def test_read_raw_elec_2015_data(tmpdir):
+    """Testing
+    """
+    path_to_csv = str(tmpdir.join('elec.csv'))
+    path_cache = str(tmpdir.join('elec_cache.npz'))
+    write_elec_csv(path_to_csv, 0)
+
+    elec_data_INDO, elec_data_ITSDO = elec_national_data.read_raw_elec_2015_data(
+        path_to_csv, path_cache)
+
+    # Sum of both half hours (converted from MW to GWh)
+    assert elec_data_INDO[0, 0] == unit_conversions.convert_mw_gwh(0 + 1, 0.5)
+    assert elec_data_INDO[32, 23] == unit_conversions.convert_mw_gwh(46 + 47, 0.5)
+    assert elec_data_ITSDO[32, 1] == unit_conversions.convert_mw_gwh(4 + 6, 0.5)
+    assert np.sum(elec_data_INDO[1:32]) == 0
+
+    # Cache hit: the cache is newer than the csv file
+    write_elec_csv(path_to_csv, 1000)
+    os.utime(path_to_csv, (os.path.getmtime(path_cache) - 10, ) * 2)
+    cached_INDO, _ = elec_national_data.read_raw_elec_2015_data(path_to_csv, path_cache)
+    np.testing.assert_array_equal(cached_INDO, elec_data_INDO)
+
+    # Cache miss: the csv file changed after the cache was written
+    os.utime(path_to_csv, (os.path.getmtime(path_cache) + 10, ) * 2)
+    new_INDO, _ = elec_national_data.read_raw_elec_2015_data(path_to_csv, path_cache)
+    assert new_INDO[0, 0] == unit_conversions.convert_mw_gwh(2000 + 1, 0.5)
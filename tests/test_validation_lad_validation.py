@@ -0,0 +1,26 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------
+# Testing file ``lad_validation``
+# -------------------------
+
+import numpy as np
+
+from energy_demand.validation import lad_validation
+
+def test_join_lad_demand():
+    """Testing
+    """
+    lad_infos_shapefile = {
+        'reg_A': {'elec_tot15': 10.0},
+        'reg_C': {'elec_tot15': 30.0},
+        'not_modelled': {'elec_tot15': 50.0}}
+    reg_fuel_y = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+    reg_index = {'reg_C': 0, 'reg_B': 1, 'reg_A': 2}
+
+    real_demand, modelled_demand = lad_validation.join_lad_demand(
+        lad_infos_shapefile, reg_fuel_y, reg_index, 1, ['reg_A', 'reg_B', 'reg_C'])
+
+    assert real_demand == {'reg_A': 10.0, 'reg_C': 30.0}
+    assert modelled_demand == {'reg_A': 6.0, 'reg_C': 4.0}